@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Adaptive Poller
+Poll fast around known posting windows, back off exponentially when idle,
+and back off further when Slack reports rate limiting.
+"""
+
+import os
+import time
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import jpholiday
+
+logger = logging.getLogger(__name__)
+
+
+def parse_windows(value: Optional[str]) -> List[Tuple[int, int]]:
+    """Parse "08:00,17:30" into [(8, 0), (17, 30)]."""
+    windows = []
+    for item in (value or '').split(','):
+        item = item.strip()
+        if not item:
+            continue
+        hour, minute = item.split(':')
+        windows.append((int(hour), int(minute)))
+    return windows
+
+
+class AdaptivePoller:
+    """Decide how long to sleep before the next poll."""
+
+    def __init__(self, tz, windows: List[Tuple[int, int]] = None, fast_interval: float = None,
+                 base_interval: float = None, max_interval: float = None, backoff_factor: float = 2.0,
+                 lead_minutes: int = None, trail_minutes: int = None, business_days_only: bool = None):
+        self.tz = tz
+        self.windows = windows if windows is not None else parse_windows(os.getenv('MONITOR_POST_WINDOWS', '08:00'))
+        self.fast_interval = fast_interval or float(os.getenv('MONITOR_FAST_INTERVAL', '5'))
+        self.base_interval = base_interval or float(os.getenv('MONITOR_BASE_INTERVAL', '30'))
+        self.max_interval = max_interval or float(os.getenv('MONITOR_MAX_INTERVAL', '900'))
+        self.backoff_factor = backoff_factor
+        self.lead = timedelta(minutes=lead_minutes if lead_minutes is not None else int(os.getenv('MONITOR_WINDOW_LEAD_MINUTES', '2')))
+        self.trail = timedelta(minutes=trail_minutes if trail_minutes is not None else int(os.getenv('MONITOR_WINDOW_TRAIL_MINUTES', '10')))
+        if business_days_only is None:
+            business_days_only = os.getenv('MONITOR_WINDOW_BUSINESS_DAYS_ONLY', 'true').lower() == 'true'
+        self.business_days_only = business_days_only
+
+        self.idle_polls = 0
+        self.rate_limited_until = 0.0
+        self.rate_limit_strikes = 0
+
+        # Report counters
+        self.polls = 0
+        self.requests = 0
+        self.rate_limited = 0
+        self.detection_delays: List[float] = []
+
+    def _backoff(self, steps: int) -> float:
+        return min(self.max_interval, self.base_interval * (self.backoff_factor ** steps))
+
+    def _window_days(self, now: datetime) -> List[datetime]:
+        days = [now - timedelta(days=1), now, now + timedelta(days=1)]
+        if self.business_days_only:
+            days = [d for d in days if d.weekday() < 5 and not jpholiday.is_holiday(d.date())]
+        return days
+
+    def _windows_around(self, now: datetime) -> List[Tuple[datetime, datetime]]:
+        spans = []
+        for day in self._window_days(now):
+            for hour, minute in self.windows:
+                center = day.replace(hour=hour, minute=minute, second=0, microsecond=0)
+                spans.append((center - self.lead, center + self.trail))
+        return sorted(spans)
+
+    def in_window(self, now: datetime) -> bool:
+        return any(start <= now <= end for start, end in self._windows_around(now))
+
+    def seconds_until_next_window(self, now: datetime) -> Optional[float]:
+        upcoming = [start for start, _ in self._windows_around(now) if start > now]
+        if not upcoming:
+            return None
+        return (upcoming[0] - now).total_seconds()
+
+    def next_interval(self, now: datetime = None) -> float:
+        """Seconds to sleep before the next poll."""
+        now = now or datetime.now(self.tz)
+
+        if self.in_window(now):
+            interval = self.fast_interval
+        else:
+            interval = self._backoff(self.idle_polls)
+            # Never sleep through the start of a posting window
+            until_window = self.seconds_until_next_window(now)
+            if until_window is not None:
+                interval = max(self.fast_interval, min(interval, until_window))
+
+        # Respect rate limiting regardless of the window
+        penalty = self.rate_limited_until - time.time()
+        if penalty > 0:
+            interval = max(interval, penalty)
+        return interval
+
+    def record_request(self):
+        self.requests += 1
+
+    def record_poll(self, found: bool):
+        """Update backoff state after a poll."""
+        self.polls += 1
+        if found:
+            self.idle_polls = 0
+            self.rate_limit_strikes = 0
+        elif self._backoff(self.idle_polls) < self.max_interval:
+            # Stop counting once capped, so a long idle stretch cannot overflow the float power
+            self.idle_polls += 1
+
+    def record_rate_limited(self, retry_after: Optional[float] = None):
+        """Treat a ratelimited response as a signal to back off."""
+        self.rate_limited += 1
+        if self._backoff(self.rate_limit_strikes) < self.max_interval:
+            self.rate_limit_strikes += 1
+        backoff = self._backoff(self.rate_limit_strikes)
+        wait = max(retry_after or 0.0, backoff)
+        self.rate_limited_until = max(self.rate_limited_until, time.time() + wait)
+        logger.warning(f"Slack rate limited - backing off polling for {wait:.0f}s")
+
+    def record_detection(self, message_ts: float, detected_at: float = None):
+        delay = (detected_at or time.time()) - message_ts
+        self.detection_delays.append(max(0.0, delay))
+
+    def report(self) -> Dict[str, Any]:
+        delays = sorted(self.detection_delays)
+        return {
+            'polls': self.polls,
+            'requests': self.requests,
+            'rate_limited': self.rate_limited,
+            'detections': len(delays),
+            'detection_delay_mean': sum(delays) / len(delays) if delays else None,
+            'detection_delay_max': delays[-1] if delays else None,
+        }
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Audio Cache
+Shared on-disk cache of synthesized clips, keyed by speaker and voice text.
+The bot publishes its clips here so the monitor can play them without
+calling VOICEVOX a second time. When post-processing is available, the
+trimmed / normalized WAV is cached next to the MP3 and played instead.
+"""
+
+import os
+import time
+import asyncio
+import hashlib
+import logging
+import tempfile
+from typing import Awaitable, Callable, Dict, Optional
+
+from metrics import REGISTRY
+from audio_processing import AudioProcessor, get_processor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'audio_cache')
+
+cache_requests = REGISTRY.counter('audio_cache_requests_total', 'Audio cache lookups by result')
+
+
+class AudioCache:
+    """Content-addressed MP3 cache shared between processes through a directory."""
+
+    def __init__(self, directory: str = None, max_age_hours: float = None, enabled: bool = None,
+                 processor: AudioProcessor = None):
+        self.directory = directory or os.getenv('AUDIO_CACHE_DIR', DEFAULT_CACHE_DIR)
+        self.max_age = 3600 * (max_age_hours if max_age_hours is not None
+                               else float(os.getenv('AUDIO_CACHE_MAX_AGE_HOURS', '48')))
+        if enabled is None:
+            enabled = os.getenv('AUDIO_CACHE_ENABLED', 'true').lower() == 'true'
+        self.enabled = enabled
+        self.processor = processor or get_processor()
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        if self.enabled:
+            os.makedirs(self.directory, exist_ok=True)
+            self.prune()
+
+    @staticmethod
+    def key(text: str, speaker: int) -> str:
+        return hashlib.sha256(f"{speaker}:{text}".encode('utf-8')).hexdigest()[:32]
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.mp3")
+
+    def processed_path_for(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.wav")
+
+    def owns(self, path: str) -> bool:
+        """True if path lives in the cache (and must not be deleted after playback)."""
+        return self.enabled and os.path.dirname(os.path.abspath(path)) == os.path.abspath(self.directory)
+
+    def get(self, text: str, speaker: int) -> Optional[str]:
+        if not self.enabled:
+            return None
+        key = self.key(text, speaker)
+        for path in (self.processed_path_for(key), self.path_for(key)):
+            if os.path.exists(path):
+                os.utime(path, None)
+                return path
+        return None
+
+    def put(self, text: str, speaker: int, data: bytes) -> str:
+        """Store a clip and return the path to play (a temp file when the cache is disabled).
+
+        Blocking (disk writes and post-processing); async callers run it in an executor.
+        """
+        if not self.enabled:
+            temp_file = tempfile.NamedTemporaryFile(suffix='.mp3', delete=False)
+            temp_file.write(data)
+            temp_file.close()
+            processed = temp_file.name[:-len('.mp3')] + '.wav'
+            if self.processor.process_file(temp_file.name, processed):
+                os.unlink(temp_file.name)
+                return processed
+            return temp_file.name
+
+        key = self.key(text, speaker)
+        path = self.path_for(key)
+        # Write then rename so another process never sees a partial file
+        fd, temp_path = tempfile.mkstemp(prefix='.tmp-', suffix='.mp3', dir=self.directory)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+
+        # The processed clip is published first, so a reader that finds the MP3 also finds it
+        played = path
+        if self.processor.enabled:
+            fd, temp_processed = tempfile.mkstemp(prefix='.tmp-', suffix='.wav', dir=self.directory)
+            os.close(fd)
+            if self.processor.process_file(temp_path, temp_processed):
+                played = self.processed_path_for(key)
+                os.replace(temp_processed, played)
+            else:
+                os.unlink(temp_processed)
+        os.replace(temp_path, path)
+        return played
+
+    async def _put_async(self, text: str, speaker: int, data: bytes) -> str:
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.put, text, speaker, data)
+
+    async def wait_for(self, text: str, speaker: int, timeout: float, poll_interval: float = 0.25) -> Optional[str]:
+        """Wait up to timeout seconds for another process to publish a clip."""
+        deadline = time.monotonic() + timeout
+        while True:
+            path = self.get(text, speaker)
+            if path or time.monotonic() >= deadline:
+                return path
+            await asyncio.sleep(poll_interval)
+
+    async def get_or_synthesize(self, text: str, speaker: int,
+                                synthesize: Callable[[], Awaitable[Optional[bytes]]]) -> Optional[str]:
+        """Return a cached clip, or synthesize it once even if requested concurrently."""
+        if not self.enabled:
+            data = await synthesize()
+            return await self._put_async(text, speaker, data) if data else None
+
+        path = self.get(text, speaker)
+        if path:
+            cache_requests.inc(labels={'result': 'hit'})
+            logger.info(f"Audio cache hit: {path}")
+            return path
+
+        key = self.key(text, speaker)
+        if key in self._inflight:
+            cache_requests.inc(labels={'result': 'joined'})
+            return await asyncio.shield(self._inflight[key])
+
+        cache_requests.inc(labels={'result': 'miss'})
+
+        async def synthesize_and_store():
+            data = await synthesize()
+            return await self._put_async(text, speaker, data) if data else None
+
+        future = asyncio.ensure_future(synthesize_and_store())
+        self._inflight[key] = future
+        try:
+            return await asyncio.shield(future)
+        finally:
+            self._inflight.pop(key, None)
+
+    def prune(self):
+        """Delete clips not used within max_age."""
+        cutoff = time.time() - self.max_age
+        try:
+            for name in os.listdir(self.directory):
+                path = os.path.join(self.directory, name)
+                try:
+                    if os.path.getmtime(path) < cutoff:
+                        os.unlink(path)
+                except OSError:
+                    pass
+        except OSError as e:
+            logger.warning(f"Could not prune audio cache {self.directory}: {e}")
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Audio Processing
+Optional post-processing of synthesized clips before they are cached: trims
+leading / trailing silence and normalizes loudness (RMS target with a peak
+ceiling) so queued clips play back at an even level without gaps.
+Requires NumPy and an initialized pygame mixer; otherwise clips pass through unchanged.
+"""
+
+import os
+import wave
+import logging
+from typing import Optional
+
+from metrics import REGISTRY, stage
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+logger = logging.getLogger(__name__)
+
+processed_clips = REGISTRY.counter('audio_postprocess_total', 'Clip post-processing by result')
+
+# Level analysis works on 10ms blocks, so single clicks do not count as speech
+BLOCK_MS = 10
+
+
+def _db_to_gain(db: float) -> float:
+    return 10.0 ** (db / 20.0)
+
+
+class AudioProcessor:
+    """Silence trimming and loudness normalization on decoded PCM (vectorized with NumPy)."""
+
+    def __init__(self, enabled: bool = None, target_dbfs: float = None, peak_dbfs: float = None,
+                 silence_dbfs: float = None, padding_ms: int = None, max_gain_db: float = None):
+        if enabled is None:
+            enabled = os.getenv('AUDIO_NORMALIZE', 'true').lower() == 'true'
+        if enabled and np is None:
+            logger.info("numpy not available - audio normalization disabled")
+            enabled = False
+        self.enabled = enabled
+        self.target_dbfs = target_dbfs if target_dbfs is not None else float(os.getenv('AUDIO_TARGET_DBFS', '-20'))
+        self.peak_dbfs = peak_dbfs if peak_dbfs is not None else float(os.getenv('AUDIO_PEAK_DBFS', '-1'))
+        self.silence_dbfs = (silence_dbfs if silence_dbfs is not None
+                             else float(os.getenv('AUDIO_SILENCE_DBFS', '-50')))
+        self.padding_ms = padding_ms if padding_ms is not None else int(os.getenv('AUDIO_TRIM_PADDING_MS', '80'))
+        self.max_gain_db = max_gain_db if max_gain_db is not None else float(os.getenv('AUDIO_MAX_GAIN_DB', '20'))
+
+    def process_samples(self, samples, rate: int):
+        """Trimmed and normalized int16 samples ((n,) or (n, channels)); None if the clip is silent."""
+        x = samples.astype(np.float32) * (1.0 / 32768.0)
+        frames = x.reshape(len(x), -1)
+
+        # Per-block RMS across all channels
+        block = max(1, rate * BLOCK_MS // 1000)
+        blocks = len(frames) // block
+        if blocks == 0:
+            return None
+        squares = np.square(frames[:blocks * block]).reshape(blocks, -1)
+        block_power = squares.mean(axis=1)
+        voiced = np.flatnonzero(block_power > _db_to_gain(self.silence_dbfs) ** 2)
+        if voiced.size == 0:
+            return None
+
+        padding = rate * self.padding_ms // 1000
+        start = max(0, voiced[0] * block - padding)
+        end = min(len(frames), (voiced[-1] + 1) * block + padding)
+        frames = frames[start:end]
+
+        # Loudness of the speech itself, so pauses do not pull the level down
+        rms = float(np.sqrt(block_power[voiced].mean()))
+        peak = float(np.abs(frames).max())
+        gain = min(_db_to_gain(self.target_dbfs) / rms,
+                   _db_to_gain(self.peak_dbfs) / peak,
+                   _db_to_gain(self.max_gain_db))
+
+        out = np.clip(frames * gain, -1.0, 32767.0 / 32768.0)
+        out = (out * 32768.0).astype(np.int16)
+        return out.reshape((-1,) + samples.shape[1:])
+
+    def process_file(self, source_path: str, output_path: str) -> bool:
+        """Decode source_path with pygame, process it and write a WAV to output_path.
+
+        Returns False (leaving the source to be played as-is) when processing is
+        disabled, the mixer is not initialized or decoding fails.
+        """
+        if not self.enabled:
+            return False
+        try:
+            import pygame
+            import pygame.sndarray
+            mixer = pygame.mixer.get_init()
+            if not mixer:
+                return False
+            rate, _, channels = mixer
+
+            with stage('audio', 'postprocess'):
+                samples = pygame.sndarray.array(pygame.mixer.Sound(source_path))
+                if samples.dtype != np.int16:
+                    # Mixer opened with a non 16-bit format; leave the clip alone
+                    processed_clips.inc(labels={'result': 'skipped'})
+                    return False
+                processed = self.process_samples(samples, rate)
+                if processed is None:
+                    processed_clips.inc(labels={'result': 'silent'})
+                    return False
+                with wave.open(output_path, 'wb') as f:
+                    f.setnchannels(channels)
+                    f.setsampwidth(2)
+                    f.setframerate(rate)
+                    f.writeframes(processed.astype('<i2').tobytes())
+
+            processed_clips.inc(labels={'result': 'ok'})
+            return True
+        except Exception as e:
+            processed_clips.inc(labels={'result': 'error'})
+            logger.warning(f"Audio post-processing failed for {source_path}: {e}")
+            return False
+
+
+_default: Optional[AudioProcessor] = None
+
+
+def get_processor() -> AudioProcessor:
+    """Process-wide processor configured from the environment."""
+    global _default
+    if _default is None:
+        _default = AudioProcessor()
+    return _default
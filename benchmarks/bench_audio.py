@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+音声後処理のベンチマーク
+無音区間つきの疑似音声クリップを作り、audio_processing.AudioProcessor による
+無音トリミングとラウドネス正規化の処理時間を測ります。
+process_samples は配列処理のみ、process_file は pygame でのデコードと WAV 書き出しを含みます。
+NumPy と pygame が必要です（SDL_AUDIODRIVER=dummy で音声デバイスなしでも動作します）。
+
+設定（環境変数）:
+  BENCH_AUDIO_SECONDS  クリップ長（秒）の一覧 (既定 "2,10,30")
+  BENCH_REPEAT         繰り返し回数、最良値を採用 (既定 5)
+"""
+
+import os
+import sys
+import time
+import wave
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+
+from audio_processing import AudioProcessor  # noqa: E402
+
+
+def speech_like(seconds, rate, channels, seed=7):
+    """Quiet lead-in, bursts of modulated tones with short pauses, and a trailing silence."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * rate)) / rate
+    carrier = np.sin(2 * np.pi * 220 * t) + 0.5 * np.sin(2 * np.pi * 660 * t)
+    envelope = (np.sin(2 * np.pi * 3 * t) > -0.3).astype(np.float32) * rng.uniform(0.02, 0.08)
+    body = carrier * envelope
+    silence = np.zeros(rate // 2)
+    signal = np.concatenate([silence, body, silence, silence])
+    return (np.repeat(signal[:, None], channels, axis=1) * 32767).astype(np.int16)
+
+
+def best_time(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    seconds_list = [float(s) for s in os.getenv('BENCH_AUDIO_SECONDS', '2,10,30').split(',')]
+    repeat = int(os.getenv('BENCH_REPEAT', '5'))
+
+    pygame.mixer.init()
+    rate, _, channels = pygame.mixer.get_init()
+    processor = AudioProcessor(enabled=True)
+
+    print(f"📊 Audio post-processing: {rate} Hz, {channels} ch, best of {repeat}")
+    print(f"{'clip (s)':>9} {'arrays (ms)':>12} {'file (ms)':>10} {'trimmed (s)':>12}")
+    with tempfile.TemporaryDirectory() as work:
+        for seconds in seconds_list:
+            samples = speech_like(seconds, rate, channels)
+            source = os.path.join(work, 'clip.wav')
+            output = os.path.join(work, 'clip.out.wav')
+            with wave.open(source, 'wb') as f:
+                f.setnchannels(channels)
+                f.setsampwidth(2)
+                f.setframerate(rate)
+                f.writeframes(samples.tobytes())
+
+            array_time = best_time(lambda: processor.process_samples(samples, rate), repeat)
+            file_time = best_time(lambda: processor.process_file(source, output), repeat)
+            trimmed = len(processor.process_samples(samples, rate)) / rate
+            print(f"{len(samples) / rate:>9.1f} {array_time * 1000:>12.2f} {file_time * 1000:>10.2f} {trimmed:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+エンドツーエンドのオフラインベンチマーク
+fake_services のスタンドイン（Calendar / Slack / VOICEVOX）に対して
+CalendarVoiceBot と SlackVoiceMonitor を実際に動かし、
+エンドツーエンドの所要時間・最初の音声再生までの時間・スループットを測定します。
+
+結果は benchmarks/results/ に JSON で保存し、BENCH_BASELINE に以前の結果を
+指定すると p50 が BENCH_TOLERANCE (既定 20%) を超えて悪化した項目を報告して終了コード1を返します。
+
+設定（環境変数）:
+  BENCH_RUNS              各シナリオの実行回数 (既定 5)
+  BENCH_EVENTS            1日あたりの予定数 (既定 5)
+  BENCH_MONITOR_MESSAGES  モニターが1回で処理するメッセージ数 (既定 4)
+  BENCH_CALENDAR_LATENCY / BENCH_SLACK_LATENCY / BENCH_SYNTH_LATENCY / BENCH_DOWNLOAD_LATENCY  各サービスの遅延（秒）
+  BENCH_SLACK_RATE_LIMIT / BENCH_SYNTH_RATE_LIMIT  1秒あたりの上限（0 = 無制限）
+  BENCH_AUDIO_SECONDS     合成音声1件の長さ（秒）
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import logging
+import tempfile
+from datetime import datetime
+
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytz  # noqa: E402
+from googleapiclient.discovery import build  # noqa: E402
+from google.auth.credentials import AnonymousCredentials  # noqa: E402
+
+from fake_services import FakeConfig, FakeServices, sample_events  # noqa: E402
+from main import CalendarVoiceBot  # noqa: E402
+from slack_voice_monitor import SlackVoiceMonitor  # noqa: E402
+from message_parser import build_schedule_metadata  # noqa: E402
+
+TZ = pytz.timezone('Asia/Tokyo')
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+
+def env_float(name, default):
+    return float(os.getenv(name, str(default)))
+
+
+def summarize(values):
+    values = sorted(values)
+    if not values:
+        return {}
+    return {
+        'mean': sum(values) / len(values),
+        'p50': values[len(values) // 2],
+        'p95': values[min(len(values) - 1, int(len(values) * 0.95))],
+        'min': values[0],
+        'max': values[-1],
+    }
+
+
+def configure_env(fake, workdir):
+    """Point every client at the stand-ins and keep state in a scratch directory."""
+    os.environ.update({
+        'SLACK_API_BASE_URL': fake.slack_api_base_url,
+        'SLACK_BOT_TOKEN': 'xoxb-bench',
+        'VOICEVOX_API_URL': fake.voicevox_url,
+        'VOICEVOX_API_KEY': 'bench',
+        'AUDIO_CACHE_DIR': os.path.join(workdir, 'audio_cache'),
+        'DELIVERY_LEDGER_PATH': os.path.join(workdir, 'ledger.json'),
+        'MONITOR_CHECKPOINT_PATH': os.path.join(workdir, 'checkpoint.json'),
+        'CALENDAR_SNAPSHOT_PATH': os.path.join(workdir, 'calendar_snapshot.json'),
+        'SLACK_CHANNEL_IDS': 'C_BENCH',
+        'AUDIO_ARTIFACT_WAIT': '0',
+        'MONITOR_ADAPTIVE': 'false',
+    })
+
+
+def track_first_audio(obj):
+    """Wrap obj.play_audio to record when the first clip starts playing and how many played."""
+    marks = {'played': 0}
+    original = obj.play_audio
+
+    def play_audio(path):
+        marks.setdefault('first_audio', time.perf_counter())
+        ok = original(path)
+        marks['played'] += 1 if ok else 0
+        return ok
+
+    obj.play_audio = play_audio
+    return marks
+
+
+async def bench_bot(fake, service, runs):
+    tenant = {'name': 'bench', 'calendar_id': 'bench@example.com',
+              'slack_destinations': [fake.webhook_url('C_BENCH'), 'C_BENCH_DM']}
+    date = TZ.localize(datetime(2025, 8, 5, 8, 0))  # Tuesday
+    results = {'cold': {'total': [], 'first_audio': [], 'slack': []},
+               'warm': {'total': [], 'first_audio': [], 'slack': []}}
+
+    for run in range(runs):
+        with tempfile.TemporaryDirectory() as workdir:
+            configure_env(fake, workdir)
+            bot = CalendarVoiceBot(tenant, service=service)
+            try:
+                for phase in ('cold', 'warm'):
+                    # Fresh ledger so the warm run delivers again, but with the audio cache populated
+                    bot.ledger.entries = {}
+                    marks = track_first_audio(bot)
+                    started = time.perf_counter()
+                    ok = await bot.send_daily_schedule(date=date, include_tomorrow=True, with_voice=True)
+                    total = time.perf_counter() - started
+                    if not ok:
+                        raise RuntimeError(f"Bot run {run} ({phase}) failed")
+                    results[phase]['total'].append(total)
+                    results[phase]['first_audio'].append(marks['first_audio'] - started)
+                    results[phase]['slack'].append(max(r['latency'] for r in bot.last_delivery_report))
+                    del bot.play_audio
+            finally:
+                await bot.close()
+
+    return {phase: {name: summarize(values) for name, values in metrics.items()}
+            for phase, metrics in results.items()}
+
+
+async def bench_monitor(fake, runs, message_count):
+    results = {'total': [], 'first_audio': [], 'throughput': []}
+    date = TZ.localize(datetime(2025, 8, 5, 8, 0))
+
+    for run in range(runs):
+        with tempfile.TemporaryDirectory() as workdir:
+            configure_env(fake, workdir)
+            # A channel of its own so the bot scenario's posts are not picked up
+            channel = f"C_MONITOR{run}"
+            os.environ['SLACK_CHANNEL_IDS'] = channel
+            formatter = CalendarVoiceBot({'calendar_id': 'bench', 'slack_destinations': [channel]}, service=object())
+            await formatter.close()
+
+            # Resume from a checkpoint just before the seeded messages
+            with open(os.environ['MONITOR_CHECKPOINT_PATH'], 'w') as f:
+                json.dump({'channels': {channel: f"{time.time() - 1:.6f}"}}, f)
+            for i in range(message_count):
+                events = sample_events(date, 3 + i)
+                text = formatter.format_schedule_message(events, date)
+                # Distinct voice texts per run so the audio cache never hides synthesis
+                voice_texts = [formatter.format_voice_message(events, date) + f"（{run}-{i}）"]
+                metadata = build_schedule_metadata(date.strftime('%Y-%m-%d'), voice_texts, [])
+                fake.post_message(channel, {'text': text, 'username': 'Calendar Bot', 'metadata': metadata})
+
+            monitor = SlackVoiceMonitor()
+            try:
+                await monitor.start()
+                marks = track_first_audio(monitor)
+                started = time.perf_counter()
+                await monitor.monitor_once()
+                total = time.perf_counter() - started
+            finally:
+                await monitor.close()
+
+            results['total'].append(total)
+            results['first_audio'].append(marks.get('first_audio', started + total) - started)
+            # Each seeded message has one clip, so clips played = messages spoken
+            results['throughput'].append(marks['played'] / total)
+
+    return {name: summarize(values) for name, values in results.items()}
+
+
+def compare(results, baseline, tolerance):
+    """Return a list of metrics whose p50 regressed beyond tolerance."""
+    regressions = []
+
+    def walk(current, previous, path):
+        if 'p50' in current and 'p50' in previous:
+            name = '.'.join(path)
+            higher_is_better = path[-1] == 'throughput'
+            old, new = previous['p50'], current['p50']
+            worse = new < old * (1 - tolerance) if higher_is_better else new > old * (1 + tolerance)
+            if worse:
+                regressions.append(f"{name}: p50 {old:.3f} -> {new:.3f}")
+            return
+        for key, value in current.items():
+            if isinstance(value, dict) and isinstance(previous.get(key), dict):
+                walk(value, previous[key], path + [key])
+
+    walk(results, baseline, [])
+    return regressions
+
+
+def main():
+    logging.getLogger().setLevel(logging.WARNING)
+    runs = int(os.getenv('BENCH_RUNS', '5'))
+    event_count = int(os.getenv('BENCH_EVENTS', '5'))
+    message_count = int(os.getenv('BENCH_MONITOR_MESSAGES', '4'))
+
+    config = FakeConfig(
+        calendar_latency=env_float('BENCH_CALENDAR_LATENCY', 0.05),
+        slack_latency=env_float('BENCH_SLACK_LATENCY', 0.03),
+        synth_latency=env_float('BENCH_SYNTH_LATENCY', 0.3),
+        download_latency=env_float('BENCH_DOWNLOAD_LATENCY', 0.05),
+        slack_rate_limit=env_float('BENCH_SLACK_RATE_LIMIT', 0),
+        synth_rate_limit=env_float('BENCH_SYNTH_RATE_LIMIT', 0),
+        audio_seconds=env_float('BENCH_AUDIO_SECONDS', 0.2),
+    )
+
+    with FakeServices(config) as fake:
+        fake.events_factory = lambda calendar_id, date: sample_events(date, event_count, calendar_id)
+        service = build('calendar', 'v3', credentials=AnonymousCredentials(),
+                        client_options={'api_endpoint': fake.calendar_endpoint}, static_discovery=True)
+
+        print(f"📊 E2E benchmark: {runs} runs, {event_count} events/day, {message_count} monitor messages")
+        bot_results = asyncio.run(bench_bot(fake, service, runs))
+        monitor_results = asyncio.run(bench_monitor(fake, runs, message_count))
+        requests_made = dict(fake.requests)
+        rate_limited = dict(fake.rate_limited)
+
+    results = {
+        'generated_at': datetime.now().isoformat(),
+        'config': dict(vars(config), runs=runs, events=event_count, monitor_messages=message_count),
+        'bot': bot_results,
+        'monitor': monitor_results,
+        'requests': requests_made,
+        'rate_limited': rate_limited,
+    }
+
+    for phase in ('cold', 'warm'):
+        stats = bot_results[phase]
+        print(f"bot/{phase:<5} total p50={stats['total']['p50']:.3f}s  "
+              f"first audio p50={stats['first_audio']['p50']:.3f}s  slack p50={stats['slack']['p50']:.3f}s")
+    print(f"monitor    total p50={monitor_results['total']['p50']:.3f}s  "
+          f"first audio p50={monitor_results['first_audio']['p50']:.3f}s  "
+          f"throughput p50={monitor_results['throughput']['p50']:.2f} msg/s")
+    print(f"requests: {requests_made}  rate limited: {rate_limited}")
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    path = os.path.join(RESULTS_DIR, f"bench_e2e-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"💾 Results saved to {path}")
+
+    baseline_path = os.getenv('BENCH_BASELINE')
+    if baseline_path:
+        with open(baseline_path, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, env_float('BENCH_TOLERANCE', 0.2))
+        if regressions:
+            print("❌ Regressions against baseline:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("✅ No regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
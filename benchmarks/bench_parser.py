@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+メッセージパーサーのベンチマーク
+旧実装（行ごとの正規表現）と message_parser の単一パス実装を、
+実際の形式のメッセージと合成メッセージのコーパスで比較します。
+出力が完全に一致することも確認します。
+"""
+
+import os
+import re
+import sys
+import time
+import random
+from datetime import datetime, timedelta
+
+import pytz
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import message_parser  # noqa: E402
+
+TZ = pytz.timezone('Asia/Tokyo')
+
+
+# --- Legacy implementation (slack_voice_monitor.py before the single-pass parser) ---
+
+def legacy_is_calendar_message(message):
+    text = message.get('text', '')
+    username = message.get('username', '')
+    calendar_patterns = [
+        r'📅.*の予定',
+        r'合計.*件の予定',
+        r'Calendar Bot',
+        r'🕐.*〜'
+    ]
+    return (username == 'Calendar Bot' or
+            any(re.search(pattern, text) for pattern in calendar_patterns))
+
+
+def legacy_extract_voice_content(slack_text):
+    text = re.sub(r'\*([^*]+)\*', r'\1', slack_text)
+    text = re.sub(r'📅|🕐|📍|📝|✨|📊', '', text)
+    text = re.sub(r'\n+', '。', text)
+    text = re.sub(r'〜', 'から', text)
+
+    lines = slack_text.split('\n')
+    voice_parts = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        if '予定 -' in line:
+            date_match = re.search(r'(\d+年\d+月\d+日)', line)
+            day_match = re.search(r'(今日|明日)', line)
+            if date_match and day_match:
+                voice_parts.append(f"{day_match.group(1)}の予定をお知らせします。")
+        elif re.match(r'^\d+\.', line):
+            event_name = re.sub(r'^\d+\.\s*', '', line)
+            voice_parts.append(f"{event_name}。")
+        elif '🕐' in line:
+            time_text = re.sub(r'🕐\s*', '', line)
+            time_text = re.sub(r'〜', 'から', time_text)
+            voice_parts.append(f"時間は{time_text}です。")
+        elif '合計' in line and '件の予定' in line:
+            count_match = re.search(r'(\d+)\s*件', line)
+            if count_match:
+                count = count_match.group(1)
+                voice_parts.append(f"以上、{count}件の予定でした。")
+    if not voice_parts:
+        cleaned = re.sub(r'[📅🕐📍📝✨📊\*]', '', slack_text)
+        cleaned = re.sub(r'\n+', '。', cleaned)
+        return cleaned.strip()
+    return ''.join(voice_parts)
+
+
+# --- Corpus ---
+
+TITLES = ['（確定）RAFT様定例会', '週次MTG', 'Design review: API v2', '1on1', 'ランチ',
+          '全社会議 📢', '顧客訪問（渋谷）', 'Sprint planning', '採用面接 3. 二次', '移動']
+
+
+def schedule_message(rng, day_label, date, count):
+    """Same layout as CalendarVoiceBot.format_schedule_message."""
+    date_str = date.strftime('%Y年%m月%d日 (%A)')
+    if count == 0:
+        return f"📅 *{day_label}の予定 - {date_str}*\n\n✨ 予定はありません。お疲れ様です！"
+    message = f"📅 *{day_label}の予定 - {date_str}*\n\n"
+    for i in range(1, count + 1):
+        start = 9 + rng.randint(0, 8)
+        message += f"*{i}. {rng.choice(TITLES)}*\n"
+        message += f"🕐 {start:02d}:00 〜 {start + 1:02d}:00\n"
+        if rng.random() < 0.4:
+            message += "📍 会議室A\n"
+        if rng.random() < 0.3:
+            message += f"📝 {'議事録を確認してください。' * rng.randint(1, 12)}\n"
+        message += "\n"
+    message += f"\n📊 合計 {count} 件の予定があります"
+    return message
+
+
+def build_corpus(size, seed=7):
+    rng = random.Random(seed)
+    base = TZ.localize(datetime(2025, 8, 4))
+    corpus = []
+    for n in range(size):
+        kind = rng.random()
+        date = base + timedelta(days=n % 30)
+        if kind < 0.5:
+            text = schedule_message(rng, '今日', date, rng.randint(0, 12))
+            if rng.random() < 0.5:
+                text += "\n\n" + "=" * 30 + "\n\n" + schedule_message(rng, '明日', date + timedelta(days=1), rng.randint(0, 8))
+            corpus.append({'text': text, 'username': 'Calendar Bot'})
+        elif kind < 0.6:
+            # Plain-numbered and indented variants
+            lines = [f"  {i}. {rng.choice(TITLES)}  " for i in range(1, rng.randint(2, 6))]
+            corpus.append({'text': '\n'.join(lines), 'username': ''})
+        else:
+            # Ordinary chatter
+            words = ['おはようございます', '了解です', 'PR見ました', '🕐 後で', '合計3件', 'Calendar Botの件',
+                     'LGTM', '明日の予定 - 未定']
+            text = '\n'.join(rng.choice(words) for _ in range(rng.randint(1, 5)))
+            corpus.append({'text': text, 'username': rng.choice(['', 'someone'])})
+    return corpus
+
+
+def bench(func, corpus, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for item in corpus:
+            func(item)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    corpus = build_corpus(int(os.getenv('BENCH_CORPUS_SIZE', '2000')))
+    repeat = 5
+
+    # Outputs must be identical
+    for item in corpus:
+        assert legacy_is_calendar_message(item) == message_parser.is_calendar_message(item), item
+        assert legacy_extract_voice_content(item['text']) == message_parser.extract_voice_content(item['text']), item
+
+    total_bytes = sum(len(item['text'].encode('utf-8')) for item in corpus)
+    print(f"📊 Parser benchmark: {len(corpus)} messages, {total_bytes / 1024:.0f} KiB (best of {repeat})")
+    for name, legacy, current in [
+        ('is_calendar_message', legacy_is_calendar_message, message_parser.is_calendar_message),
+        ('extract_voice_content', lambda m: legacy_extract_voice_content(m['text']),
+         lambda m: message_parser.extract_voice_content(m['text'])),
+    ]:
+        old = bench(legacy, corpus, repeat)
+        new = bench(current, corpus, repeat)
+        print(f"{name:<22} legacy={old * 1000:8.2f}ms  single-pass={new * 1000:8.2f}ms  speedup={old / new:4.1f}x")
+    print("✅ outputs identical")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+ポーリング方式の比較ベンチマーク（シミュレーション）
+固定30秒間隔と AdaptivePoller を1週間分シミュレートし、
+API リクエスト数と検出遅延を比較します。
+あわせて、長時間の無通知・レート制限が続いても待ち時間が上限で止まることを確認します。
+"""
+
+import os
+import sys
+import time
+import random
+import logging
+from datetime import datetime, timedelta
+
+import pytz
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from adaptive_poller import AdaptivePoller  # noqa: E402
+
+TZ = pytz.timezone('Asia/Tokyo')
+
+
+def posting_times(start, days, rng):
+    """Calendar posts at 08:00 (+ a few seconds of jitter) on weekdays."""
+    times = []
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        if day.weekday() < 5:
+            times.append(day.replace(hour=8, minute=0, second=0) + timedelta(seconds=rng.uniform(0, 20)))
+    return times
+
+
+def simulate(start, days, posts, next_interval, on_poll):
+    now = start
+    end = start + timedelta(days=days)
+    pending = list(posts)
+    polls = 0
+    delays = []
+    while now < end:
+        polls += 1
+        found = False
+        while pending and pending[0] <= now:
+            delays.append((now - pending.pop(0)).total_seconds())
+            found = True
+        on_poll(found)
+        now += timedelta(seconds=next_interval(now))
+    return polls, delays
+
+
+def summarize(name, polls, delays, days):
+    mean = sum(delays) / len(delays) if delays else 0
+    print(f"{name:<10} requests/day={polls / days:8.1f}  "
+          f"detection delay mean={mean:5.1f}s max={max(delays) if delays else 0:5.1f}s")
+
+
+def check_long_idle(polls=5000):
+    """Thousands of idle polls and rate limits must stay at max_interval (not overflow)."""
+    poller = AdaptivePoller(TZ, windows=[], business_days_only=False)
+    for _ in range(polls):
+        poller.record_poll(False)
+        assert poller.next_interval() <= poller.max_interval
+    logging.disable(logging.WARNING)  # one warning per rate limit
+    try:
+        for _ in range(polls):
+            poller.record_rate_limited()
+    finally:
+        logging.disable(logging.NOTSET)
+    assert poller.rate_limited_until - time.time() <= poller.max_interval
+    print(f"✅ {polls} idle polls / rate limits: interval capped at {poller.next_interval():.0f}s")
+
+
+def main():
+    rng = random.Random(42)
+    days = 7
+    start = TZ.localize(datetime(2025, 8, 4))  # Monday
+    posts = posting_times(start, days, rng)
+
+    fixed_polls, fixed_delays = simulate(start, days, posts, lambda now: 30, lambda found: None)
+
+    check_long_idle()
+
+    poller = AdaptivePoller(TZ, windows=[(8, 0)], business_days_only=True)
+    adaptive_polls, adaptive_delays = simulate(start, days, posts, poller.next_interval, poller.record_poll)
+
+    print(f"📊 Polling simulation over {days} days ({len(posts)} calendar posts)")
+    summarize('fixed-30s', fixed_polls, fixed_delays, days)
+    summarize('adaptive', adaptive_polls, adaptive_delays, days)
+    print(f"   API calls reduced by {100 * (1 - adaptive_polls / fixed_polls):.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+スケーリングベンチマーク
+calendar_load で生成した予定を件数を増やしながら処理し（現実的な混在と、数百人規模の会議のみの2系列）、
+各段階（API レスポンスの JSON デコード、辞退フィルタ、Slack 用整形、音声用整形、
+重複する予定の検出、週次・月次ダイジェストの集計と整形、空き時間の計算、モニター側のテキスト抽出）の所要時間とピークメモリを表示します。
+
+設定（環境変数）:
+  BENCH_SCALING_SIZES  件数の一覧 (既定 "100,1000,10000")
+  BENCH_LARGE_MEETING_SIZES  大規模会議のみの系列の件数 (既定 "10,100,1000")
+  BENCH_REPEAT         時間計測の繰り返し回数、最良値を採用 (既定 3)
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import tracemalloc
+from datetime import datetime
+
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ['AUDIO_CACHE_ENABLED'] = 'false'
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from calendar_load import SELF_EMAIL, TZ, events_response, generate_events  # noqa: E402
+from main import CalendarVoiceBot  # noqa: E402
+import message_parser  # noqa: E402
+from digest import period_range, summarize_range  # noqa: E402
+from freebusy import free_slots  # noqa: E402
+from conflicts import find_overlaps  # noqa: E402
+
+
+def measure(func, repeat):
+    """Best wall time over `repeat` runs, then peak traced memory of one more run."""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, result
+
+
+def run_series(bot, date, sizes, repeat, mix=None):
+    for size in sizes:
+        events = generate_events(size, date, mix=mix)
+        body = json.dumps(events_response(events), ensure_ascii=False)
+        attendees = sum(len(e.get('attendees', [])) for e in events)
+
+        decoded = json.loads(body)['items']
+        filtered = bot._filter_declined_events(decoded)
+        slack_text = bot.format_schedule_message(filtered, date)
+        month_start, month_end = period_range('month', date, TZ)
+        summary = summarize_range(filtered, month_start, month_end, TZ)
+        # Busy intervals as freebusy.query would return them for these events
+        busy = [(datetime.fromisoformat(e['start']['dateTime']), datetime.fromisoformat(e['end']['dateTime']))
+                for e in filtered if 'dateTime' in e['start']]
+        work_start, work_end = date.replace(hour=9), date.replace(hour=18)
+
+        stages = [
+            ('json_decode', lambda: json.loads(body)['items']),
+            ('filter_declined', lambda: bot._filter_declined_events(decoded)),
+            ('find_overlaps', lambda: find_overlaps(filtered, TZ)),
+            ('format_schedule', lambda: bot.format_schedule_message(filtered, date)),
+            ('format_voice', lambda: bot.format_voice_message(filtered, date)),
+            ('digest_summarize', lambda: summarize_range(filtered, month_start, month_end, TZ)),
+            ('digest_format', lambda: bot.format_digest_message(summary, 'month')),
+            ('free_slots', lambda: free_slots(busy, work_start, work_end)),
+            ('extract_voice_content', lambda: message_parser.extract_voice_content(slack_text)),
+        ]
+        print(f"{size:>7} ({len(body) / 1024 / 1024:.1f} MiB response, {attendees} attendees, "
+              f"{len(filtered)} kept after filtering)")
+        for name, func in stages:
+            elapsed, peak, _ = measure(func, repeat)
+            print(f"{'':>7} {name:<22} {elapsed * 1000:8.2f}ms {elapsed / size * 1e6:8.2f}µs {peak / 1024 / 1024:8.2f}MiB")
+
+
+def main():
+    logging.getLogger().setLevel(logging.WARNING)
+    sizes = [int(s) for s in os.getenv('BENCH_SCALING_SIZES', '100,1000,10000').split(',')]
+    large_sizes = [int(s) for s in os.getenv('BENCH_LARGE_MEETING_SIZES', '10,100,1000').split(',')]
+    repeat = int(os.getenv('BENCH_REPEAT', '3'))
+
+    bot = CalendarVoiceBot({'name': 'bench', 'calendar_id': SELF_EMAIL, 'slack_destinations': ['C_BENCH']},
+                           service=object())
+    date = TZ.localize(datetime(2025, 8, 5))
+
+    print(f"📊 Scaling benchmark (best of {repeat}; peak = tracemalloc peak of one run)")
+    print(f"{'events':>7} {'stage':<22} {'time':>10} {'per event':>11} {'peak mem':>10}")
+    print("--- realistic mix ---")
+    run_series(bot, date, sizes, repeat)
+    print("--- 300-500 attendee meetings only ---")
+    run_series(bot, date, large_sizes, repeat, mix={'large_meeting': 1.0})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+合成カレンダー負荷ジェネレーター
+Google Calendar API (events.list, singleEvents=True) と同じ形の予定を任意の件数で生成します。
+通常の予定に加えて、終日・複数日・繰り返し展開・辞退済み・長い説明・Unicode の多い予定、
+数百人規模の参加者を持つ会議を設定した割合で混ぜます。
+
+    python benchmarks/calendar_load.py 1000 > events.json
+"""
+
+import sys
+import json
+import random
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+import pytz
+
+TZ = pytz.timezone('Asia/Tokyo')
+
+# Share of each kind of event (the rest are ordinary timed meetings)
+DEFAULT_MIX = {
+    'all_day': 0.05,
+    'multi_day': 0.03,
+    'recurring': 0.25,
+    'declined': 0.10,
+    'long_description': 0.10,
+    'unicode_heavy': 0.10,
+    'large_meeting': 0.02,
+}
+
+TITLES = ['週次MTG', '1on1', 'Design review: API v2', '顧客訪問（渋谷）', 'Sprint planning', 'ランチ',
+          '全社会議 📢', '採用面接', '移動', '（確定）RAFT様定例会', 'Incident postmortem', '予算レビュー']
+UNICODE_TITLES = ['🎉🎂 誕生日会 🎈🥳', 'Ｃａｆé ｍｅｅｔｉｎｇ — ｚｕｎｄａ', '①②③ 四半期レビュー ㊗️',
+                  '𠮷野家で打ち合わせ 🍚', 'équipe sync（再）👩‍💻👨‍💻', '한국 팀 / 中国团队 / 日本チーム']
+LOCATIONS = ['会議室A', '会議室B (5F)', 'Zoom', 'Google Meet', '東京都渋谷区道玄坂1-2-3 ○○ビル 12F', '']
+SELF_EMAIL = 'me@example.com'
+
+
+def _attendees(rng: random.Random, count: int, declined: bool) -> List[Dict[str, Any]]:
+    statuses = ['accepted', 'tentative', 'needsAction', 'declined']
+    attendees = [{
+        'email': f"user{i}@example.com",
+        'displayName': f"ユーザー{i}",
+        'responseStatus': rng.choice(statuses),
+    } for i in range(count)]
+    attendees.append({
+        'email': SELF_EMAIL,
+        'self': True,
+        'responseStatus': 'declined' if declined else 'accepted',
+    })
+    rng.shuffle(attendees)
+    return attendees
+
+
+def _long_description(rng: random.Random) -> str:
+    paragraph = ('<p>アジェンダ: 進捗共有、課題整理、次回までのアクションアイテム。'
+                 '<a href="https://example.com/doc">資料</a> を事前に確認してください。</p>\n')
+    return paragraph * rng.randint(20, 120)
+
+
+def _timed(start: datetime, minutes: int) -> Dict[str, Any]:
+    return {
+        'start': {'dateTime': start.isoformat(), 'timeZone': 'Asia/Tokyo'},
+        'end': {'dateTime': (start + timedelta(minutes=minutes)).isoformat(), 'timeZone': 'Asia/Tokyo'},
+    }
+
+
+def generate_event(rng: random.Random, index: int, date: datetime, mix: Dict[str, float]) -> Dict[str, Any]:
+    day = date.replace(hour=0, minute=0, second=0, microsecond=0)
+    start = day + timedelta(hours=rng.randint(7, 20), minutes=rng.choice([0, 15, 30, 45]))
+    event: Dict[str, Any] = {
+        'kind': 'calendar#event',
+        'id': f"evt{index:06d}",
+        'status': 'confirmed',
+        'summary': rng.choice(TITLES),
+        'organizer': {'email': f"user{rng.randint(0, 50)}@example.com"},
+        'created': '2025-01-01T00:00:00.000Z',
+        'updated': '2025-07-01T00:00:00.000Z',
+        'etag': f'"{3000000000000000 + index}"',
+        'location': rng.choice(LOCATIONS),
+    }
+    event.update(_timed(start, rng.choice([15, 30, 45, 60, 90, 120])))
+
+    roll = rng.random()
+    threshold = 0.0
+    kind = 'timed'
+    for name, share in mix.items():
+        threshold += share
+        if roll < threshold:
+            kind = name
+            break
+
+    if kind == 'all_day':
+        event['start'] = {'date': day.strftime('%Y-%m-%d')}
+        event['end'] = {'date': (day + timedelta(days=1)).strftime('%Y-%m-%d')}
+    elif kind == 'multi_day':
+        first = day - timedelta(days=rng.randint(0, 2))
+        if rng.random() < 0.5:
+            event['start'] = {'date': first.strftime('%Y-%m-%d')}
+            event['end'] = {'date': (first + timedelta(days=rng.randint(2, 5))).strftime('%Y-%m-%d')}
+        else:
+            event.update(_timed(first + timedelta(hours=18), 60 * 24 * rng.randint(1, 3)))
+        event['summary'] = '出張（大阪）'
+    elif kind == 'recurring':
+        base_id = f"rec{index % 97:04d}"
+        event['recurringEventId'] = base_id
+        event['id'] = f"{base_id}_{start.astimezone(pytz.utc).strftime('%Y%m%dT%H%M%SZ')}"
+        event['originalStartTime'] = dict(event['start'])
+        event['attendees'] = _attendees(rng, rng.randint(1, 8), declined=False)
+    elif kind == 'declined':
+        event['attendees'] = _attendees(rng, rng.randint(2, 20), declined=True)
+    elif kind == 'long_description':
+        event['description'] = _long_description(rng)
+    elif kind == 'unicode_heavy':
+        event['summary'] = rng.choice(UNICODE_TITLES)
+        event['description'] = '🗒️ ' + ''.join(rng.choice('絵文字😀漢字ｶﾀｶﾅ한글éñ🧑‍🤝‍🧑') for _ in range(rng.randint(10, 90)))
+    elif kind == 'large_meeting':
+        event['summary'] = '全社タウンホール 🏢'
+        event['attendees'] = _attendees(rng, rng.randint(300, 500), declined=rng.random() < 0.2)
+        event['conferenceData'] = {'entryPoints': [{'entryPointType': 'video', 'uri': 'https://meet.example.com/abc'}]}
+    return event
+
+
+def generate_events(count: int, date: datetime = None, seed: int = 0,
+                    mix: Dict[str, float] = None) -> List[Dict[str, Any]]:
+    """Generate `count` events for `date`, ordered by start time like orderBy=startTime."""
+    date = date or TZ.localize(datetime(2025, 8, 5))
+    rng = random.Random(seed)
+    events = [generate_event(rng, i, date, mix or DEFAULT_MIX) for i in range(count)]
+    events.sort(key=lambda e: e['start'].get('dateTime') or e['start'].get('date'))
+    return events
+
+
+def events_response(events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Wrap events in an events.list response body."""
+    return {'kind': 'calendar#events', 'summary': 'bench@example.com', 'timeZone': 'Asia/Tokyo', 'items': events}
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    json.dump(events_response(generate_events(size)), sys.stdout, ensure_ascii=False, indent=2)
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+ローカルのスタンドインサーバー（ベンチマーク用）
+Google Calendar events API、Slack (webhook / Web API / 履歴)、VOICEVOX (tts.quest)
+の合成・ダウンロードを1つの aiohttp アプリで再現します。
+遅延とレート制限は FakeConfig で設定できます。
+
+実際のクライアント（googleapiclient の同期呼び出しを含む）から呼べるように、
+サーバーは専用スレッドの別イベントループで動作します。
+"""
+
+import time
+import random
+import asyncio
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from aiohttp import web
+
+# 無音の MPEG-1 Layer III フレーム (128kbps / 44.1kHz / mono, 1フレーム = 1152サンプル ≒ 26ms)
+SILENT_MP3_FRAME = bytes([0xFF, 0xFB, 0x90, 0xC0]) + b'\0' * 413
+MP3_FRAME_SECONDS = 1152 / 44100
+
+
+def silent_mp3(seconds: float) -> bytes:
+    return SILENT_MP3_FRAME * max(1, int(seconds / MP3_FRAME_SECONDS))
+
+
+class FakeConfig:
+    """Latency (seconds) and rate limits (requests per second, 0 = unlimited) per service."""
+
+    def __init__(self, calendar_latency: float = 0.05, slack_latency: float = 0.03,
+                 synth_latency: float = 0.3, download_latency: float = 0.05, jitter: float = 0.2,
+                 slack_rate_limit: float = 0.0, synth_rate_limit: float = 0.0,
+                 audio_seconds: float = 0.2, calendar_error_rate: float = 0.0, seed: int = 1):
+        self.calendar_latency = calendar_latency
+        self.slack_latency = slack_latency
+        self.synth_latency = synth_latency
+        self.download_latency = download_latency
+        self.jitter = jitter
+        self.slack_rate_limit = slack_rate_limit
+        self.synth_rate_limit = synth_rate_limit
+        self.audio_seconds = audio_seconds
+        # Share of Calendar requests answered with 503 (simulates a degraded Google API)
+        self.calendar_error_rate = calendar_error_rate
+        self.seed = seed
+
+
+class _Window:
+    """Fixed one-second window counter used to emulate rate limiting."""
+
+    def __init__(self, limit: float):
+        self.limit = limit
+        self.window = 0
+        self.count = 0
+
+    def allow(self) -> bool:
+        if not self.limit:
+            return True
+        now = int(time.monotonic())
+        if now != self.window:
+            self.window, self.count = now, 0
+        self.count += 1
+        return self.count <= self.limit
+
+
+def sample_events(date: datetime, count: int, calendar_id: str = '') -> List[Dict[str, Any]]:
+    """Calendar API style events spread over the working day (same input, same events)."""
+    rng = random.Random(f"{calendar_id}:{date.date().isoformat()}:{count}")
+    titles = ['週次MTG', '1on1', 'Design review', '顧客訪問', 'Sprint planning', 'ランチ', '全社会議']
+    events = []
+    for i in range(count):
+        start = date.replace(hour=9, minute=0, second=0, microsecond=0) + timedelta(minutes=30 * (i % 18))
+        events.append({
+            'id': f"evt{i}",
+            'summary': f"{rng.choice(titles)} {i + 1}",
+            'start': {'dateTime': start.isoformat()},
+            'end': {'dateTime': (start + timedelta(minutes=30)).isoformat()},
+            'location': '会議室A' if i % 3 == 0 else '',
+        })
+    return events
+
+
+class FakeServices:
+    """Run the stand-in servers on 127.0.0.1:<port> in a background thread."""
+
+    def __init__(self, config: FakeConfig = None, port: int = 0,
+                 events_factory: Callable[[str, datetime], List[Dict[str, Any]]] = None):
+        self.config = config or FakeConfig()
+        self.port = port
+        self.rng = random.Random(self.config.seed)
+        self.events_factory = events_factory or (lambda calendar_id, date: sample_events(date, 5, calendar_id=calendar_id))
+
+        self.history: Dict[str, List[Dict[str, Any]]] = {}
+        self.requests: Dict[str, int] = {}
+        self.rate_limited: Dict[str, int] = {}
+        self._slack_window = _Window(self.config.slack_rate_limit)
+        self._synth_window = _Window(self.config.synth_rate_limit)
+        self._audio: Dict[str, float] = {}
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._runner: Optional[web.AppRunner] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+
+    # --- URLs for the clients under test ---
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    @property
+    def calendar_endpoint(self) -> str:
+        return f"{self.base_url}/calendar/"
+
+    @property
+    def slack_api_base_url(self) -> str:
+        return f"{self.base_url}/slack/api/"
+
+    def webhook_url(self, channel: str) -> str:
+        return f"{self.base_url}/slack/webhook/{channel}"
+
+    @property
+    def voicevox_url(self) -> str:
+        return f"{self.base_url}/voicevox/synthesis"
+
+    # --- Helpers ---
+
+    def _count(self, name: str):
+        self.requests[name] = self.requests.get(name, 0) + 1
+
+    async def _delay(self, base: float):
+        if base:
+            await asyncio.sleep(base * (1 + self.rng.uniform(-self.config.jitter, self.config.jitter)))
+
+    def post_message(self, channel: str, message: Dict[str, Any]) -> str:
+        """Append a message to a channel's history and return its ts."""
+        ts = f"{time.time():.6f}"
+        # Keep ts unique and increasing even within one clock tick
+        history = self.history.setdefault(channel, [])
+        if history and float(ts) <= float(history[-1]['ts']):
+            ts = f"{float(history[-1]['ts']) + 0.000001:.6f}"
+        history.append(dict(message, ts=ts))
+        return ts
+
+    # --- Handlers ---
+
+    async def _calendar_events(self, request: web.Request) -> web.Response:
+        self._count('calendar.events.list')
+        await self._delay(self.config.calendar_latency)
+        if self.rng.random() < self.config.calendar_error_rate:
+            return web.json_response({'error': {'code': 503, 'message': 'Backend Error'}}, status=503)
+        time_min = datetime.fromisoformat(request.query['timeMin'])
+        time_max = datetime.fromisoformat(request.query.get('timeMax', time_min.isoformat()))
+        # One factory call per day so week / month ranges get every day's events
+        items = []
+        day = time_min
+        while True:
+            items.extend(self.events_factory(request.match_info['calendar_id'], day))
+            day += timedelta(days=1)
+            if day >= time_max:
+                break
+
+        # Page like events.list: maxResults per page, nextPageToken = offset of the next page
+        offset = int(request.query.get('pageToken', '0'))
+        limit = int(request.query.get('maxResults', '250'))
+        body = {'kind': 'calendar#events', 'items': items[offset:offset + limit]}
+        if offset + limit < len(items):
+            body['nextPageToken'] = str(offset + limit)
+        return web.json_response(body)
+
+    async def _calendar_freebusy(self, request: web.Request) -> web.Response:
+        """freebusy.query: the timed events of each requested calendar as busy intervals."""
+        self._count('calendar.freebusy.query')
+        await self._delay(self.config.calendar_latency)
+        body = await request.json()
+        time_min = datetime.fromisoformat(body['timeMin'])
+        calendars = {}
+        for item in body.get('items', []):
+            events = self.events_factory(item['id'], time_min)
+            calendars[item['id']] = {'busy': [{'start': e['start']['dateTime'], 'end': e['end']['dateTime']}
+                                              for e in events if 'dateTime' in e['start']]}
+        return web.json_response({'kind': 'calendar#freeBusy', 'timeMin': body['timeMin'],
+                                  'timeMax': body['timeMax'], 'calendars': calendars})
+
+    async def _slack_rate_limited(self, name: str) -> Optional[web.Response]:
+        if self._slack_window.allow():
+            return None
+        self.rate_limited[name] = self.rate_limited.get(name, 0) + 1
+        return web.Response(status=429, text='rate_limited', headers={'Retry-After': '1'})
+
+    async def _slack_webhook(self, request: web.Request) -> web.Response:
+        self._count('slack.webhook')
+        await self._delay(self.config.slack_latency)
+        limited = await self._slack_rate_limited('slack.webhook')
+        if limited:
+            return limited
+        payload = await request.json()
+        self.post_message(request.match_info['channel'], payload)
+        return web.Response(text='ok')
+
+    async def _slack_api(self, request: web.Request) -> web.Response:
+        method = request.match_info['method']
+        self._count(f"slack.{method}")
+        await self._delay(self.config.slack_latency)
+        limited = await self._slack_rate_limited(f"slack.{method}")
+        if limited:
+            return limited
+
+        if method == 'chat.postMessage':
+            payload = await request.json()
+            ts = self.post_message(payload['channel'], payload)
+            return web.json_response({'ok': True, 'channel': payload['channel'], 'ts': ts})
+
+        if method == 'conversations.history':
+            query = request.query
+            oldest = float(query.get('oldest', '0'))
+            limit = int(query.get('limit', '100'))
+            # Slack returns newest first
+            messages = [m for m in reversed(self.history.get(query['channel'], [])) if float(m['ts']) > oldest]
+            offset = int(query.get('cursor') or 0)
+            page = messages[offset:offset + limit]
+            has_more = offset + limit < len(messages)
+            return web.json_response({
+                'ok': True, 'messages': page, 'has_more': has_more,
+                'response_metadata': {'next_cursor': str(offset + limit) if has_more else ''},
+            })
+
+        return web.json_response({'ok': False, 'error': 'unknown_method'})
+
+    async def _voicevox_synthesis(self, request: web.Request) -> web.Response:
+        self._count('voicevox.synthesis')
+        await self._delay(self.config.synth_latency)
+        if not self._synth_window.allow():
+            self.rate_limited['voicevox.synthesis'] = self.rate_limited.get('voicevox.synthesis', 0) + 1
+            return web.json_response({'success': False, 'retryAfter': 1})
+
+        params = dict(request.query)
+        if request.method == 'POST':
+            params.update(await request.post())
+        audio_id = f"{len(self._audio)}-{abs(hash(params.get('text', ''))) % 100000}"
+        self._audio[audio_id] = self.config.audio_seconds
+        url = f"{self.base_url}/voicevox/audio/{audio_id}.mp3"
+        return web.json_response({'success': True, 'mp3StreamingUrl': url, 'mp3DownloadUrl': url})
+
+    async def _voicevox_audio(self, request: web.Request) -> web.Response:
+        self._count('voicevox.download')
+        await self._delay(self.config.download_latency)
+        seconds = self._audio.get(request.match_info['audio_id'])
+        if seconds is None:
+            return web.Response(status=404)
+        return web.Response(body=silent_mp3(seconds), content_type='audio/mpeg')
+
+    # --- Lifecycle ---
+
+    def _build_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get('/calendar/calendars/{calendar_id}/events', self._calendar_events)
+        app.router.add_post('/calendar/freeBusy', self._calendar_freebusy)
+        app.router.add_post('/slack/webhook/{channel}', self._slack_webhook)
+        app.router.add_route('*', '/slack/api/{method}', self._slack_api)
+        app.router.add_route('*', '/voicevox/synthesis', self._voicevox_synthesis)
+        app.router.add_get('/voicevox/audio/{audio_id}.mp3', self._voicevox_audio)
+        return app
+
+    def _serve(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+
+        async def start():
+            self._runner = web.AppRunner(self._build_app(), access_log=None)
+            await self._runner.setup()
+            site = web.TCPSite(self._runner, '127.0.0.1', self.port)
+            await site.start()
+            self.port = site._server.sockets[0].getsockname()[1]
+
+        self._loop.run_until_complete(start())
+        self._ready.set()
+        self._loop.run_forever()
+        self._loop.run_until_complete(self._runner.cleanup())
+        self._loop.close()
+
+    def start(self) -> 'FakeServices':
+        self._thread = threading.Thread(target=self._serve, name='fake-services', daemon=True)
+        self._thread.start()
+        self._ready.wait(10)
+        return self
+
+    def stop(self):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(10)
+            self._loop = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Calendar Snapshot
+Stale-while-revalidate cache of the last successful events.list result per
+calendar and date. When Google is slow or down, the last snapshot is served
+(marked stale) while the fetch keeps running in the background, and a circuit
+breaker stops hammering the API after repeated failures. The blocking API
+calls run on a worker thread, so waiting for them never blocks the event loop.
+"""
+
+import os
+import time
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+from circuit_breaker import CircuitBreaker
+from metrics import REGISTRY
+from state_store import load_json, atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+fetch_total = REGISTRY.counter('calendar_fetch_total', 'Calendar fetches by result (fresh, stale or unavailable)')
+
+
+class CalendarUnavailable(Exception):
+    """Raised when the Calendar API failed and there is no snapshot to fall back to."""
+
+
+class ScheduleEvents(list):
+    """Events for one day; stale is True when served from an older snapshot."""
+
+    def __init__(self, events=(), stale: bool = False, fetched_at: Optional[float] = None):
+        super().__init__(events)
+        self.stale = stale
+        self.fetched_at = fetched_at
+
+
+class CalendarSnapshot:
+    """Per (calendar, date) snapshots persisted to a JSON file."""
+
+    def __init__(self, path: str = None, timeout: float = None, cold_timeout: float = None,
+                 retention_days: int = None, breaker: CircuitBreaker = None):
+        self.path = path or os.getenv('CALENDAR_SNAPSHOT_PATH', 'calendar_snapshot.json')
+        # How long to wait for a fresh result when a snapshot can be served instead
+        self.timeout = timeout if timeout is not None else float(os.getenv('CALENDAR_FETCH_TIMEOUT', '5'))
+        # How long to wait when there is nothing to fall back to
+        self.cold_timeout = cold_timeout if cold_timeout is not None else float(os.getenv('CALENDAR_COLD_FETCH_TIMEOUT', '30'))
+        self.retention_days = retention_days or int(os.getenv('CALENDAR_SNAPSHOT_RETENTION_DAYS', '14'))
+        self.breaker = breaker or CircuitBreaker(
+            'calendar',
+            failure_threshold=int(os.getenv('CALENDAR_BREAKER_THRESHOLD', '3')),
+            reset_timeout=float(os.getenv('CALENDAR_BREAKER_RESET_SECONDS', '300')))
+
+        self.entries: Dict[str, Dict[str, Any]] = load_json(self.path, {}).get('entries', {})
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @staticmethod
+    def _key(calendar_id: str, date_key: str) -> str:
+        return f"{calendar_id}|{date_key}"
+
+    def get(self, calendar_id: str, date_key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self.entries.get(self._key(calendar_id, date_key))
+
+    def put(self, calendar_id: str, date_key: str, events: List[Dict[str, Any]]):
+        cutoff = time.time() - self.retention_days * 86400
+        with self._lock:
+            self.entries[self._key(calendar_id, date_key)] = {
+                'date': date_key,
+                'fetched_at': time.time(),
+                'events': events,
+            }
+            self.entries = {k: v for k, v in self.entries.items() if v.get('fetched_at', 0) >= cutoff}
+            try:
+                atomic_write_json(self.path, {'entries': self.entries})
+            except OSError as e:
+                logger.error(f"Failed to save calendar snapshot: {e}")
+
+    def _run(self, key: str, calendar_id: str, date_key: str,
+             fetch: Callable[[], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        try:
+            events = fetch()
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+        self.breaker.record_success()
+        self.put(calendar_id, date_key, events)
+        return events
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        # One worker: the Calendar service's HTTP object is not thread-safe
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='calendar-fetch')
+        return self._executor
+
+    def _submit(self, calendar_id: str, date_key: str, fetch) -> Future:
+        key = self._key(calendar_id, date_key)
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is None:
+                future = self._get_executor().submit(self._run, key, calendar_id, date_key, fetch)
+                self._inflight[key] = future
+        return future
+
+    @staticmethod
+    async def _wait(future: Future, timeout: float):
+        """Await a worker future for up to timeout seconds; on timeout it keeps running."""
+        return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), timeout)
+
+    async def call(self, func: Callable[[], T], timeout: float = None) -> T:
+        """Run another blocking Calendar API call (e.g. freebusy.query) on the fetch worker."""
+        with self._lock:
+            future = self._get_executor().submit(func)
+        try:
+            return await self._wait(future, timeout if timeout is not None else self.cold_timeout)
+        except asyncio.TimeoutError:
+            # Nobody needs the result any more; drop it if it has not started yet
+            future.cancel()
+            raise
+
+    def _serve_stale(self, snapshot: Dict[str, Any], reason: str) -> ScheduleEvents:
+        fetch_total.inc(labels={'result': f"stale_{reason}"})
+        age = time.time() - snapshot['fetched_at']
+        logger.warning(f"Serving calendar snapshot from {age / 60:.0f} minutes ago ({reason})")
+        return ScheduleEvents(snapshot['events'], stale=True, fetched_at=snapshot['fetched_at'])
+
+    async def fetch(self, calendar_id: str, date_key: str,
+                    fetch: Callable[[], List[Dict[str, Any]]]) -> ScheduleEvents:
+        """Fetch fresh events, falling back to the snapshot when the API is slow, failing or tripped."""
+        snapshot = self.get(calendar_id, date_key)
+
+        if not self.breaker.allow():
+            if snapshot:
+                return self._serve_stale(snapshot, 'circuit_open')
+            fetch_total.inc(labels={'result': 'unavailable'})
+            raise CalendarUnavailable("Calendar API circuit is open and no snapshot is available")
+
+        future = self._submit(calendar_id, date_key, fetch)
+        try:
+            events = await self._wait(future, self.timeout if snapshot else self.cold_timeout)
+        except asyncio.TimeoutError:
+            # Keep fetching in the background; the snapshot is refreshed when it completes
+            if snapshot:
+                return self._serve_stale(snapshot, 'timeout')
+            fetch_total.inc(labels={'result': 'unavailable'})
+            raise CalendarUnavailable(f"Calendar API did not respond within {self.cold_timeout:.0f}s")
+        except Exception as e:
+            if snapshot:
+                logger.error(f"Failed to fetch calendar events: {e}")
+                return self._serve_stale(snapshot, 'error')
+            fetch_total.inc(labels={'result': 'unavailable'})
+            raise CalendarUnavailable(f"Failed to fetch calendar events: {e}") from e
+
+        fetch_total.inc(labels={'result': 'fresh'})
+        return ScheduleEvents(events, stale=False, fetched_at=time.time())
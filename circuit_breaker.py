@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Circuit Breaker
+Stop calling a failing dependency for a while after repeated failures,
+then let a single trial request through to see if it has recovered.
+"""
+
+import time
+import logging
+import threading
+
+from metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+breaker_open = REGISTRY.gauge('circuit_breaker_open', 'Whether a circuit breaker is open (1) or closed (0)')
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """Closed -> open after failure_threshold consecutive failures; half-open after reset_timeout."""
+
+    def __init__(self, name: str, failure_threshold: int = 3, reset_timeout: float = 300.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = 0.0
+        self._state = CLOSED
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def allow(self) -> bool:
+        """True if a request may be attempted now."""
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self._state = HALF_OPEN
+                self._trial_in_flight = False
+            if self._state == HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                logger.info(f"Circuit '{self.name}' half-open, trying one request")
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            if self._state != CLOSED:
+                logger.info(f"Circuit '{self.name}' closed")
+            self._state = CLOSED
+            self.failures = 0
+            self._trial_in_flight = False
+            breaker_open.set(0, {'name': self.name})
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._state == HALF_OPEN or self.failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    logger.warning(f"Circuit '{self.name}' open after {self.failures} failures, "
+                                   f"pausing requests for {self.reset_timeout:.0f}s")
+                self._state = OPEN
+                self.opened_at = time.monotonic()
+                self._trial_in_flight = False
+                breaker_open.set(1, {'name': self.name})
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Conflicts
+Merge events from several calendars into one normalized, start-ordered list and
+find overlapping meetings with a sort-and-sweep (O(n log n), no pairwise checks).
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+import pytz
+
+
+def event_bounds(event: Dict[str, Any], tz=None):
+    """(start, end) as POSIX timestamps and whether the event is all-day; (None, None, False) if untimed."""
+    start, end = event.get('start', {}), event.get('end', {})
+    if 'dateTime' in start:
+        start_ts = datetime.fromisoformat(start['dateTime'].replace('Z', '+00:00')).timestamp()
+        end_ts = (datetime.fromisoformat(end['dateTime'].replace('Z', '+00:00')).timestamp()
+                  if 'dateTime' in end else start_ts)
+        return start_ts, end_ts, False
+    if 'date' in start:
+        tz = tz or pytz.utc
+        start_ts = tz.localize(datetime.strptime(start['date'], '%Y-%m-%d')).timestamp()
+        end_ts = tz.localize(datetime.strptime(end['date'], '%Y-%m-%d')).timestamp() if 'date' in end else start_ts
+        return start_ts, end_ts, True
+    return None, None, False
+
+
+def merge_calendars(event_lists: Iterable[List[Dict[str, Any]]], tz=None) -> List[Dict[str, Any]]:
+    """Events of several calendars in start order; a meeting shared by two calendars is kept once."""
+    seen = set()
+    keyed = []
+    for events in event_lists:
+        for event in events:
+            key = (event.get('iCalUID') or event.get('id'), event.get('start', {}).get('dateTime') or
+                   event.get('start', {}).get('date'))
+            if key in seen:
+                continue
+            seen.add(key)
+            start_ts, _, _ = event_bounds(event, tz)
+            keyed.append((start_ts if start_ts is not None else float('inf'), len(keyed), event))
+    keyed.sort(key=lambda item: (item[0], item[1]))
+    return [event for _, _, event in keyed]
+
+
+def find_overlaps(events: List[Dict[str, Any]], tz=None) -> Set[int]:
+    """Indexes of timed events that overlap another one.
+
+    All-day and free (transparent) events never conflict. After sorting by start,
+    an event overlaps if it starts before the latest end seen so far; the event
+    holding that end overlaps it too, so both are marked.
+    """
+    timed = []
+    for index, event in enumerate(events):
+        if event.get('transparency') == 'transparent':
+            continue
+        start_ts, end_ts, all_day = event_bounds(event, tz)
+        if start_ts is None or all_day:
+            continue
+        timed.append((start_ts, end_ts, index))
+    timed.sort()
+
+    conflicts: Set[int] = set()
+    latest_end: Optional[float] = None
+    latest_index = -1
+    for start_ts, end_ts, index in timed:
+        if latest_end is not None and start_ts < latest_end:
+            conflicts.add(index)
+            conflicts.add(latest_index)
+        if latest_end is None or end_ts > latest_end:
+            latest_end, latest_index = end_ts, index
+    return conflicts
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Delivery Ledger
+Persistent record of successful deliveries so reruns skip what already went out,
+and the in-process record of announcements the bot speaks itself (combined mode).
+"""
+
+import os
+import json
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from state_store import load_json, atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(content: Any) -> str:
+    """Stable short hash of a payload or text."""
+    if not isinstance(content, str):
+        content = json.dumps(content, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()[:16]
+
+
+class DeliveryLedger:
+    """Ledger keyed by (tenant, date, destination, content hash)."""
+
+    def __init__(self, path: str = None, retention_days: int = None):
+        self.path = path or os.getenv('DELIVERY_LEDGER_PATH', 'delivery_ledger.json')
+        self.retention_days = retention_days or int(os.getenv('DELIVERY_LEDGER_RETENTION_DAYS', '14'))
+        self.entries: Dict[str, Dict[str, Any]] = load_json(self.path, {}).get('entries', {})
+        if not isinstance(self.entries, dict):
+            logger.warning(f"Ignoring malformed delivery ledger entries in {self.path}")
+            self.entries = {}
+
+    @staticmethod
+    def _key(tenant: str, date: str, destination: str, digest: str) -> str:
+        return '|'.join([tenant, date, destination, digest])
+
+    def is_delivered(self, tenant: str, date: str, destination: str, digest: str) -> bool:
+        return self._key(tenant, date, destination, digest) in self.entries
+
+    def record(self, tenant: str, date: str, destination: str, digest: str,
+               ts: Optional[str] = None, save: bool = True):
+        """Mark a delivery as succeeded."""
+        self.entries[self._key(tenant, date, destination, digest)] = {
+            'date': date,
+            'delivered_at': datetime.now().isoformat(),
+            'ts': ts,
+        }
+        if save:
+            self.save()
+
+    def _prune(self):
+        cutoff = (datetime.now() - timedelta(days=self.retention_days)).strftime('%Y-%m-%d')
+        self.entries = {k: v for k, v in self.entries.items() if v.get('date', '') >= cutoff}
+
+    def save(self):
+        self._prune()
+        try:
+            atomic_write_json(self.path, {'entries': self.entries})
+        except OSError as e:
+            logger.error(f"Failed to save delivery ledger {self.path}: {e}")
+
+
+class LocalAnnouncements:
+    """Announcements a bot in this process speaks itself, by metadata content hash.
+
+    The bot begins an announcement before posting it and finishes it after speaking.
+    The monitor waits for the outcome and skips only announcements that were actually
+    spoken; a failed one is dropped so the monitor speaks the post instead.
+    Only the most recent max_entries are kept.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, asyncio.Future]" = OrderedDict()
+
+    def begin(self, digest: str):
+        if digest not in self._entries:
+            self._entries[digest] = asyncio.get_event_loop().create_future()
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self.max_entries:
+            _, future = self._entries.popitem(last=False)
+            if not future.done():
+                future.set_result(False)
+
+    def finish(self, digest: str, spoken: bool):
+        future = self._entries.get(digest)
+        if future is None:
+            return
+        if not future.done():
+            future.set_result(spoken)
+        if not spoken:
+            del self._entries[digest]
+
+    async def was_spoken(self, digest: str) -> bool:
+        """True if the announcement was spoken here (waiting while it is still being spoken)."""
+        future = self._entries.get(digest)
+        if future is None:
+            return False
+        return await asyncio.shield(future)
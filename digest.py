@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Digest
+Weekly / monthly aggregation of calendar events: per-day grouping, total meeting
+hours, the busiest day and back-to-back meetings, in one pass over the sorted events.
+"""
+
+import os
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+WEEKDAYS = '月火水木金土日'
+
+PERIOD_LABELS = {'week': '今週', 'month': '今月'}
+
+# Fields the digest needs; keeps month-sized events.list responses small
+RANGE_FIELDS = ('nextPageToken,items(id,iCalUID,status,transparency,summary,start,end,'
+                'attendees(email,self,organizer,responseStatus))')
+
+
+def period_range(period: str, date: datetime, tz) -> Tuple[datetime, datetime]:
+    """[start, end) of the week (Monday to Sunday) or calendar month containing date."""
+    day = date.astimezone(tz).date() if date.tzinfo else date.date()
+    if period == 'week':
+        first = day - timedelta(days=day.weekday())
+        last = first + timedelta(days=7)
+    elif period == 'month':
+        first = day.replace(day=1)
+        last = (first + timedelta(days=32)).replace(day=1)
+    else:
+        raise ValueError(f"Unknown digest period: {period}")
+    return (tz.localize(datetime(first.year, first.month, first.day)),
+            tz.localize(datetime(last.year, last.month, last.day)))
+
+
+def _parse_time(time_data: Dict[str, Any], tz) -> Tuple[Optional[datetime], bool]:
+    """(datetime in tz, is_all_day) for an event start/end."""
+    if 'dateTime' in time_data:
+        return datetime.fromisoformat(time_data['dateTime'].replace('Z', '+00:00')).astimezone(tz), False
+    if 'date' in time_data:
+        return tz.localize(datetime.strptime(time_data['date'], '%Y-%m-%d')), True
+    return None, False
+
+
+def summarize_range(events: List[Dict[str, Any]], start: datetime, end: datetime, tz,
+                    back_to_back_gap: timedelta = None) -> Dict[str, Any]:
+    """Aggregate events overlapping [start, end).
+
+    Events are grouped under the day they start (or the range start, if earlier).
+    Meeting hours count timed events only, clipped to the range. A meeting is
+    back-to-back when it starts within back_to_back_gap after every earlier one has ended.
+    """
+    if back_to_back_gap is None:
+        back_to_back_gap = timedelta(minutes=int(os.getenv('DIGEST_BACK_TO_BACK_MINUTES', '5')))
+
+    parsed = []
+    for event in events:
+        event_start, all_day = _parse_time(event.get('start', {}), tz)
+        event_end, _ = _parse_time(event.get('end', {}), tz)
+        if event_start is None:
+            continue
+        parsed.append((event_start, event_end or event_start, all_day, event))
+    # Already in startTime order from the API, so this is a linear check in practice
+    parsed.sort(key=lambda item: item[0])
+
+    days: Dict[Any, Dict[str, Any]] = {}
+    total_minutes = 0.0
+    back_to_back = 0
+    last_end = None
+
+    for event_start, event_end, all_day, event in parsed:
+        day = max(event_start, start).date()
+        bucket = days.get(day)
+        if bucket is None:
+            bucket = days[day] = {'date': day, 'events': [], 'minutes': 0.0}
+        bucket['events'].append(event)
+
+        if all_day:
+            continue
+
+        minutes = (min(event_end, end) - max(event_start, start)).total_seconds() / 60
+        if minutes > 0:
+            bucket['minutes'] += minutes
+            total_minutes += minutes
+
+        if last_end is not None and timedelta(0) <= event_start - last_end <= back_to_back_gap:
+            back_to_back += 1
+        if last_end is None or event_end > last_end:
+            last_end = event_end
+
+    busiest = None
+    for bucket in days.values():
+        if busiest is None or (len(bucket['events']), bucket['minutes']) > (len(busiest['events']), busiest['minutes']):
+            busiest = bucket
+
+    return {
+        'start': start,
+        'end': end,
+        'days': [days[day] for day in sorted(days)],
+        'total_events': len(parsed),
+        'total_minutes': total_minutes,
+        'busiest_day': busiest,
+        'back_to_back': back_to_back,
+    }
+
+
+def format_day(day) -> str:
+    return f"{day.month:02d}/{day.day:02d} ({WEEKDAYS[day.weekday()]})"
+
+
+def format_hours(minutes: float) -> str:
+    """Minutes as hours rounded to the nearest half hour ("3時間", "3.5時間")."""
+    hours = round(minutes / 30) / 2
+    return f"{hours:g}時間"
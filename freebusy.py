@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Free / Busy
+Busy intervals from the Calendar freebusy.query endpoint (many calendars per
+request), merged with a sorted sweep into free slots within working hours.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Tuple
+
+from metrics import stage
+
+logger = logging.getLogger(__name__)
+
+Interval = Tuple[datetime, datetime]
+
+# freebusy.query accepts at most this many calendars per request
+MAX_CALENDARS_PER_QUERY = 50
+
+
+def parse_hhmm(value: str) -> Tuple[int, int]:
+    """'9' or '09:30' -> (9, 0) / (9, 30)."""
+    hour, _, minute = value.partition(':')
+    return int(hour), int(minute or 0)
+
+
+def _parse(value: str, tz) -> datetime:
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).astimezone(tz)
+
+
+def query_busy(service, calendar_ids: List[str], time_min: datetime, time_max: datetime,
+               tz) -> Dict[str, List[Interval]]:
+    """Busy intervals per calendar, 50 calendars per freebusy.query request."""
+    busy: Dict[str, List[Interval]] = {}
+    for offset in range(0, len(calendar_ids), MAX_CALENDARS_PER_QUERY):
+        chunk = calendar_ids[offset:offset + MAX_CALENDARS_PER_QUERY]
+        body = {
+            'timeMin': time_min.isoformat(),
+            'timeMax': time_max.isoformat(),
+            'timeZone': str(tz),
+            'items': [{'id': calendar_id} for calendar_id in chunk],
+        }
+        with stage('bot', 'freebusy_fetch'):
+            result = service.freebusy().query(body=body).execute()
+
+        for calendar_id, calendar in result.get('calendars', {}).items():
+            for error in calendar.get('errors', []):
+                logger.warning(f"freebusy.query error for {calendar_id}: {error.get('reason')}")
+            busy[calendar_id] = [(_parse(b['start'], tz), _parse(b['end'], tz)) for b in calendar.get('busy', [])]
+    return busy
+
+
+def merge_intervals(intervals: Iterable[Interval]) -> List[Interval]:
+    """Union of intervals: sort by start, then extend the current run while they overlap or touch."""
+    merged: List[Interval] = []
+    # Sort on timestamps: comparing aware datetimes recomputes UTC offsets on every comparison
+    for start, end in sorted(intervals, key=lambda interval: interval[0].timestamp()):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def free_slots(busy: Iterable[Interval], window_start: datetime, window_end: datetime,
+               min_duration: timedelta = timedelta(0)) -> List[Interval]:
+    """Gaps of at least min_duration between merged busy intervals inside [window_start, window_end)."""
+    slots: List[Interval] = []
+    cursor = window_start
+    for start, end in merge_intervals(busy):
+        if end <= cursor:
+            continue
+        if start >= window_end:
+            break
+        if start - cursor >= min_duration and start > cursor:
+            slots.append((cursor, start))
+        cursor = max(cursor, end)
+    if window_end - cursor >= min_duration and window_end > cursor:
+        slots.append((cursor, window_end))
+    return slots
+
+
+def _voice_time(dt: datetime) -> str:
+    return f"{dt.hour}時" if dt.minute == 0 else f"{dt.hour}時{dt.minute}分"
+
+
+def format_free_slots(slots: List[Interval]) -> str:
+    """Slack line, e.g. '🟢 空き時間: 13:00〜15:00, 16:30〜18:00'."""
+    if not slots:
+        return "🟢 空き時間: なし"
+    return "🟢 空き時間: " + ", ".join(f"{s.strftime('%H:%M')}〜{e.strftime('%H:%M')}" for s, e in slots)
+
+
+def format_free_slots_voice(slots: List[Interval]) -> str:
+    """Spoken form, e.g. '空き時間は13時から15時です。'."""
+    if not slots:
+        return "空き時間はありません。"
+    return "空き時間は" + "と、".join(f"{_voice_time(s)}から{_voice_time(e)}" for s, e in slots) + "です。"
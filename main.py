@@ -8,19 +8,36 @@ and reads them aloud using VOICEVOX API.
 import os
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
-import requests
+from typing import List, Dict, Any, Optional, Callable, Awaitable
 from dotenv import load_dotenv
 import pytz
 from googleapiclient.discovery import build
 from google.oauth2.service_account import Credentials
+from google_auth_httplib2 import AuthorizedHttp
+import httplib2
 import json
 import jpholiday
 import pygame
-import tempfile
 import asyncio
 import aiohttp
 from urllib.parse import urlencode
+from slack_client import SlackClient
+from slack_fanout import SlackFanout, parse_destinations, is_webhook
+from delivery_ledger import DeliveryLedger, LocalAnnouncements, content_hash
+from message_parser import build_schedule_metadata
+from audio_cache import AudioCache
+from scheduler import Scheduler, CronSchedule
+from tenants import load_tenants
+from reminders import ReminderEngine
+from metrics import stage
+from calendar_snapshot import CalendarSnapshot, CalendarUnavailable, ScheduleEvents
+from metrics_exporter import MetricsExporter
+from voicevox_client import VoicevoxClient, parse_calendar_speakers
+from digest import (PERIOD_LABELS, RANGE_FIELDS, WEEKDAYS, format_day, format_hours,
+                    period_range, summarize_range)
+from conflicts import find_overlaps, merge_calendars
+from reading import normalize_reading
+from freebusy import format_free_slots, format_free_slots_voice, free_slots, parse_hhmm, query_busy
 
 load_dotenv()
 
@@ -30,26 +47,105 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Events listed per day in the weekly digest (the monthly one shows counts only)
+DIGEST_TITLES_PER_DAY = 5
+
 
 class CalendarVoiceBot:
-    def __init__(self):
-        self.slack_webhook_url = os.getenv('SLACK_WEBHOOK_URL')
+    def __init__(self, tenant: Dict[str, Any] = None, service=None, slack_client: SlackClient = None,
+                 audio_cache: AudioCache = None, ledger: DeliveryLedger = None,
+                 playback_lock: asyncio.Lock = None, calendar_snapshot: CalendarSnapshot = None,
+                 tts: VoicevoxClient = None, player: Callable[[str], Awaitable[bool]] = None,
+                 announced: LocalAnnouncements = None):
+        """Tenant settings override the environment; the daemon passes shared clients and caches.
+        
+        In combined mode, player is the monitor's playback queue and announced records the
+        announcements this bot speaks itself, so the monitor skips them once they were spoken.
+        """
+        tenant = tenant or {}
+        self.slack_webhook_url = tenant.get('slack_webhook_url') or os.getenv('SLACK_WEBHOOK_URL')
         self.google_credentials_json = os.getenv('GOOGLE_CREDENTIALS_JSON')
-        self.calendar_id = os.getenv('CALENDAR_ID')
-        self.timezone = os.getenv('TIMEZONE', 'Asia/Tokyo')
+        self.calendar_id = tenant.get('calendar_id') or os.getenv('CALENDAR_ID')
+        self.timezone = tenant.get('timezone') or os.getenv('TIMEZONE', 'Asia/Tokyo')
         self.tz = pytz.timezone(self.timezone)
         
         # VOICEVOX API settings
         self.voicevox_api_key = os.getenv('VOICEVOX_API_KEY')
-        self.voicevox_speaker_id = int(os.getenv('VOICEVOX_SPEAKER_ID', '3'))  # Default: ずんだもん
-        self.voicevox_api_url = 'https://api.tts.quest/v3/voicevox/synthesis'
+        # Speaker: tenant "speaker", then VOICEVOX_CALENDAR_SPEAKERS for this calendar, then VOICEVOX_SPEAKER_ID;
+        # tomorrow's schedule can use its own voice (tenant "tomorrow_speaker" / VOICEVOX_TOMORROW_SPEAKER_ID)
+        calendar_speakers = parse_calendar_speakers(os.getenv('VOICEVOX_CALENDAR_SPEAKERS'))
+        speaker = tenant.get('speaker')
+        if speaker is None:
+            speaker = calendar_speakers.get(self.calendar_id, os.getenv('VOICEVOX_SPEAKER_ID', '3'))  # Default: ずんだもん
+        self.voicevox_speaker_id = int(speaker)
+        tomorrow_speaker = tenant.get('tomorrow_speaker')
+        if tomorrow_speaker is None:
+            tomorrow_speaker = os.getenv('VOICEVOX_TOMORROW_SPEAKER_ID') or self.voicevox_speaker_id
+        self.tomorrow_speaker_id = int(tomorrow_speaker)
+        self.voicevox_api_url = os.getenv('VOICEVOX_API_URL', 'https://api.tts.quest/v3/voicevox/synthesis')
+        # Per-phase timeouts and optional hedging (GET with query parameters like the browser implementation)
+        self._owns_tts = tts is None
+        self.tts = tts or VoicevoxClient('bot', self.voicevox_api_url, self.voicevox_api_key, method='get')
+        
+        # Webhook URLs, channel IDs or user IDs (DM) to post the schedule to
+        destinations = tenant.get('slack_destinations')
+        if isinstance(destinations, list):
+            destinations = ','.join(destinations)
+        self.slack_destinations = parse_destinations(destinations)
+        if not self.slack_destinations and tenant.get('slack_webhook_url'):
+            self.slack_destinations = [tenant['slack_webhook_url']]
+        if not self.slack_destinations:
+            self.slack_destinations = parse_destinations(os.getenv('SLACK_DESTINATIONS'))
+        if not self.slack_destinations and self.slack_webhook_url:
+            self.slack_destinations = [self.slack_webhook_url]
+        
+        if not all([self.slack_destinations, self.google_credentials_json or service, self.calendar_id]):
+            raise ValueError("Missing required environment variables: SLACK_WEBHOOK_URL (or SLACK_DESTINATIONS), GOOGLE_CREDENTIALS_JSON, CALENDAR_ID")
+        
+        # Pooled async Slack client (retries, 429 handling, timeouts)
+        self._owns_slack_client = slack_client is None
+        self.slack_client = slack_client or SlackClient(bot_token=os.getenv('SLACK_BOT_TOKEN'))
+        self.slack_fanout = SlackFanout(self.slack_client)
+        self.last_delivery_report = []
+        
+        # Ledger of successful deliveries so reruns only redo what failed
+        self.tenant = tenant.get('name') or os.getenv('TENANT_ID', 'default')
+        self.ledger = ledger or DeliveryLedger()
+        
+        # Initialize Google Calendar service (reused as-is when shared by the daemon)
+        self.service = service
+        if self.service is None:
+            self._init_calendar_service()
+        
+        # Last good fetch per calendar/date, served when the API is slow or down
+        self.calendar_snapshot = calendar_snapshot or CalendarSnapshot()
+        
+        # Extra calendars merged into the schedule (a meeting on several of them is listed once)
+        extra_calendars = tenant.get('extra_calendar_ids') or os.getenv('EXTRA_CALENDAR_IDS')
+        if isinstance(extra_calendars, list):
+            extra_calendars = ','.join(extra_calendars)
+        self.calendar_ids = [self.calendar_id] + [c.strip() for c in (extra_calendars or '').split(',')
+                                                  if c.strip() and c.strip() != self.calendar_id]
+        
+        # Free time within working hours, computed from freebusy.query over these calendars
+        self.free_time_enabled = (tenant['free_time'] if 'free_time' in tenant else
+                                  os.getenv('FREE_TIME_ENABLED', 'false').lower() == 'true')
+        freebusy_calendars = tenant.get('freebusy_calendars') or os.getenv('FREEBUSY_CALENDAR_IDS')
+        if isinstance(freebusy_calendars, list):
+            freebusy_calendars = ','.join(freebusy_calendars)
+        self.freebusy_calendars = ([c.strip() for c in (freebusy_calendars or '').split(',') if c.strip()] or
+                                   [self.calendar_id])
+        self.working_hours = (parse_hhmm(tenant.get('working_hours_start') or os.getenv('WORKING_HOURS_START', '9:00')),
+                              parse_hhmm(tenant.get('working_hours_end') or os.getenv('WORKING_HOURS_END', '18:00')))
+        self.free_slot_min = timedelta(minutes=int(os.getenv('FREE_SLOT_MIN_MINUTES', '30')))
         
-        if not all([self.slack_webhook_url, self.google_credentials_json, self.calendar_id]):
-            raise ValueError("Missing required environment variables: SLACK_WEBHOOK_URL, GOOGLE_CREDENTIALS_JSON, CALENDAR_ID")
+        # Shared clip cache (also read by slack_voice_monitor.py)
+        self.audio_cache = audio_cache or AudioCache()
         
-        # Initialize Google Calendar service
-        self.service = None
-        self._init_calendar_service()
+        # Serializes playback when several tenants speak from one process
+        self.playback_lock = playback_lock
+        self.player = player
+        self.announced = announced
         
         # Initialize pygame for audio playback
         pygame.mixer.init()
@@ -66,8 +162,10 @@ class CalendarVoiceBot:
                 scopes=['https://www.googleapis.com/auth/calendar.readonly']
             )
             
-            # Build the service
-            self.service = build('calendar', 'v3', credentials=credentials)
+            # Build the service. httplib2 has no timeout by default, and a hung request would
+            # block the single calendar worker for good without the breaker ever counting it
+            http = httplib2.Http(timeout=float(os.getenv('CALENDAR_HTTP_TIMEOUT', '30')))
+            self.service = build('calendar', 'v3', http=AuthorizedHttp(credentials, http=http))
             logger.info("Google Calendar service initialized successfully with Service Account")
             
         except json.JSONDecodeError as e:
@@ -128,7 +226,98 @@ class CalendarVoiceBot:
         
         return filtered_events
 
-    def get_daily_events(self, date: datetime = None) -> List[Dict[str, Any]]:
+    def _list_events(self, time_min: datetime, time_max: datetime, fields: str = None,
+                     calendar_id: str = None) -> List[Dict[str, Any]]:
+        """events.list for a time range, following nextPageToken until every page is read."""
+        params = {
+            'calendarId': calendar_id or self.calendar_id,
+            'timeMin': time_min.isoformat(),
+            'timeMax': time_max.isoformat(),
+            'singleEvents': True,
+            'orderBy': 'startTime',
+            'maxResults': 2500,
+        }
+        if fields:
+            params['fields'] = fields
+        
+        items = []
+        with stage('bot', 'calendar_fetch'):
+            while True:
+                events_result = self.service.events().list(**params).execute()
+                items.extend(events_result.get('items', []))
+                page_token = events_result.get('nextPageToken')
+                if not page_token:
+                    return items
+                params['pageToken'] = page_token
+    
+    async def _fetch_calendars(self, date_key: str, time_min: datetime, time_max: datetime,
+                               fields: str = None) -> ScheduleEvents:
+        """Fetch CALENDAR_ID and any extra calendars (each via the snapshot) and merge them in start order.
+        
+        The calendars are awaited together, so their timeouts overlap instead of adding up.
+        An extra calendar that is unavailable is left out; only the main one raises CalendarUnavailable.
+        """
+        fetched = await asyncio.gather(*(
+            self.calendar_snapshot.fetch(
+                calendar_id, date_key,
+                lambda calendar_id=calendar_id: self._list_events(time_min, time_max, fields, calendar_id))
+            for calendar_id in self.calendar_ids), return_exceptions=True)
+        
+        results = []
+        for calendar_id, result in zip(self.calendar_ids, fetched):
+            if isinstance(result, CalendarUnavailable):
+                if calendar_id == self.calendar_id:
+                    raise result
+                logger.warning(f"Leaving out calendar {calendar_id}: {result}")
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                results.append(result)
+        if len(results) == 1:
+            return results[0]
+        
+        stale = [r for r in results if r.stale]
+        fetched_at = min(r.fetched_at for r in stale) if stale else max(r.fetched_at for r in results)
+        return ScheduleEvents(merge_calendars(results, self.tz), stale=bool(stale), fetched_at=fetched_at)
+    
+    async def get_range_events(self, start: datetime, end: datetime) -> ScheduleEvents:
+        """Fetch events in [start, end) with one paginated request (declined events removed)."""
+        logger.info(f"Fetching events from {start.strftime('%Y-%m-%d')} to {end.strftime('%Y-%m-%d')} ({self.timezone})")
+        range_key = f"{start.strftime('%Y-%m-%d')}~{end.strftime('%Y-%m-%d')}"
+        events = await self._fetch_calendars(range_key, start, end, fields=RANGE_FIELDS)
+        logger.info(f"Found {len(events)} total events{' (stale snapshot)' if events.stale else ''}")
+        
+        with stage('bot', 'filter'):
+            filtered_events = self._filter_declined_events(events)
+        return ScheduleEvents(filtered_events, stale=events.stale, fetched_at=events.fetched_at)
+    
+    async def get_free_slots(self, date: datetime) -> Optional[List[tuple]]:
+        """Free slots within working hours on date across the free/busy calendars, or None if unavailable."""
+        if not self.free_time_enabled:
+            return None
+        
+        day = date.astimezone(self.tz).replace(tzinfo=None)
+        window_start = self.tz.localize(day.replace(hour=self.working_hours[0][0], minute=self.working_hours[0][1],
+                                                    second=0, microsecond=0))
+        window_end = self.tz.localize(day.replace(hour=self.working_hours[1][0], minute=self.working_hours[1][1],
+                                                  second=0, microsecond=0))
+        try:
+            # On the Calendar fetch worker; free time is optional, so don't wait for a slow API
+            busy = await self.calendar_snapshot.call(
+                lambda: query_busy(self.service, self.freebusy_calendars, window_start, window_end, self.tz),
+                timeout=self.calendar_snapshot.timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"free/busy query did not respond within {self.calendar_snapshot.timeout:g}s")
+            return None
+        except Exception as e:
+            # The schedule still goes out, just without the free time
+            logger.error(f"Failed to query free/busy: {e}")
+            return None
+        
+        intervals = [interval for calendar_busy in busy.values() for interval in calendar_busy]
+        return free_slots(intervals, window_start, window_end, self.free_slot_min)
+    
+    async def get_daily_events(self, date: datetime = None) -> List[Dict[str, Any]]:
         """Fetch calendar events for a specific date."""
         if date is None:
             date = datetime.now(self.tz)
@@ -143,48 +332,45 @@ class CalendarVoiceBot:
         
         logger.info(f"Fetching events for {date.strftime('%Y-%m-%d')} ({self.timezone})")
         
-        try:
-            events_result = self.service.events().list(
-                calendarId=self.calendar_id,
-                timeMin=start_time.isoformat(),
-                timeMax=end_time.isoformat(),
-                singleEvents=True,
-                orderBy='startTime'
-            ).execute()
-            
-            events = events_result.get('items', [])
-            logger.info(f"Found {len(events)} total events")
-            
-            # Filter out declined events
+        # Serves the last good snapshot (marked stale) if the API is slow or down;
+        # raises CalendarUnavailable only when there is nothing to fall back to
+        events = await self._fetch_calendars(date.strftime('%Y-%m-%d'), start_time, end_time)
+        logger.info(f"Found {len(events)} total events{' (stale snapshot)' if events.stale else ''}")
+        
+        # Filter out declined events
+        with stage('bot', 'filter'):
             filtered_events = self._filter_declined_events(events)
-            logger.info(f"After filtering declined events: {len(filtered_events)} events")
-            
-            return filtered_events
-            
-        except Exception as e:
-            logger.error(f"Failed to fetch calendar events: {e}")
-            # Return placeholder events as fallback
-            return [
-                {
-                    'summary': 'API接続エラー - プレースホルダーイベント',
-                    'start': {'dateTime': '09:00'},
-                    'end': {'dateTime': '10:00'},
-                    'description': 'Google Calendar APIへの接続に失敗しました'
-                }
-            ]
-    
-    def format_schedule_message(self, events: List[Dict[str, Any]], date: datetime, is_tomorrow: bool = False) -> str:
-        """Format events into a beautiful Slack message."""
+        logger.info(f"After filtering declined events: {len(filtered_events)} events")
+        
+        return ScheduleEvents(filtered_events, stale=events.stale, fetched_at=events.fetched_at)
+    
+    def _stale_notice(self, events: List[Dict[str, Any]]) -> Optional[str]:
+        """When the events came from an old snapshot, the time they were fetched (e.g. "08/04 17:30")."""
+        if not getattr(events, 'stale', False) or not events.fetched_at:
+            return None
+        return datetime.fromtimestamp(events.fetched_at, self.tz).strftime('%m/%d %H:%M')
+    
+    def format_schedule_message(self, events: List[Dict[str, Any]], date: datetime, is_tomorrow: bool = False,
+                                free_slots: List[tuple] = None) -> str:
+        """Format events into a beautiful Slack message (with free time when free_slots is given)."""
         day_label = "明日" if is_tomorrow else "今日"
         date_str = date.strftime('%Y年%m月%d日 (%A)')
+        header = f"📅 *{day_label}の予定 - {date_str}*\n\n"
+        
+        stale_at = self._stale_notice(events)
+        if stale_at:
+            header += f"⚠️ カレンダーに接続できないため、{stale_at} 時点の情報です\n\n"
+        
+        free_line = f"\n{format_free_slots(free_slots)}" if free_slots is not None else ""
         
         if not events:
             if is_tomorrow:
-                return f"📅 *{day_label}の予定 - {date_str}*\n\n✨ 予定はありません。ゆっくりお過ごしください！"
+                return f"{header}✨ 予定はありません。ゆっくりお過ごしください！{free_line}"
             else:
-                return f"📅 *{day_label}の予定 - {date_str}*\n\n✨ 予定はありません。お疲れ様です！"
+                return f"{header}✨ 予定はありません。お疲れ様です！{free_line}"
         
-        message = f"📅 *{day_label}の予定 - {date_str}*\n\n"
+        message = header
+        conflicts = find_overlaps(events, self.tz)
         
         for i, event in enumerate(events, 1):
             start_time = self._format_time(event.get('start', {}))
@@ -195,6 +381,8 @@ class CalendarVoiceBot:
             
             message += f"*{i}. {summary}*\n"
             message += f"🕐 {start_time} 〜 {end_time}\n"
+            if i - 1 in conflicts:
+                message += "⚠️ 他の予定と重なっています\n"
             
             if location:
                 message += f"📍 {location}\n"
@@ -207,27 +395,92 @@ class CalendarVoiceBot:
             message += "\n"
         
         message += f"\n📊 合計 {len(events)} 件の予定があります"
+        if conflicts:
+            message += f"\n⚠️ 重なっている予定が {len(conflicts)} 件あります"
+        message += free_line
         return message
     
-    def format_voice_message(self, events: List[Dict[str, Any]], date: datetime, is_tomorrow: bool = False) -> str:
-        """Format events into a voice-friendly message."""
+    def format_voice_message(self, events: List[Dict[str, Any]], date: datetime, is_tomorrow: bool = False,
+                             free_slots: List[tuple] = None) -> str:
+        """Format events into a voice-friendly message (with free time when free_slots is given)."""
         day_label = "明日" if is_tomorrow else "今日"
         date_str = date.strftime('%m月%d日')
         
+        stale_note = "カレンダーに接続できなかったため、前回取得した予定です。" if self._stale_notice(events) else ""
+        free_note = format_free_slots_voice(free_slots) if free_slots is not None else ""
+        
         if not events:
-            return f"{day_label}{date_str}の予定はありません。"
+            return f"{day_label}{date_str}の予定はありません。{stale_note}{free_note}"
         
-        message = f"{day_label}{date_str}の予定をお知らせします。"
+        message = f"{day_label}{date_str}の予定をお知らせします。{stale_note}"
+        conflicts = find_overlaps(events, self.tz)
         
         for i, event in enumerate(events, 1):
             start_time = self._format_voice_time(event.get('start', {}))
-            summary = event.get('summary', '無題のイベント')
+            summary = normalize_reading(event.get('summary', '無題のイベント'))
             
-            message += f"{i}番目、{start_time}から{summary}。"
+            if i - 1 in conflicts:
+                message += f"{i}番目、{start_time}から{summary}、ほかの予定と重なっています。"
+            else:
+                message += f"{i}番目、{start_time}から{summary}。"
+        
+        message += f"以上、合計{len(events)}件の予定です。{free_note}"
+        return message
+    
+    def format_digest_message(self, summary: Dict[str, Any], period: str, stale_at: str = None) -> str:
+        """Format a weekly / monthly digest for Slack (titles are listed for weeks only)."""
+        label = PERIOD_LABELS[period]
+        last_day = summary['end'] - timedelta(days=1)
+        header = f"📅 *{label}の予定 - {summary['start'].strftime('%Y年%m月%d日')}〜{last_day.strftime('%m月%d日')}*\n\n"
+        if stale_at:
+            header += f"⚠️ カレンダーに接続できないため、{stale_at} 時点の情報です\n\n"
+        
+        if not summary['total_events']:
+            return f"{header}✨ 予定はありません。"
+        
+        lines = []
+        for day in summary['days']:
+            events = day['events']
+            line = f"*{format_day(day['date'])}* {len(events)}件"
+            if day['minutes']:
+                line += f"・{format_hours(day['minutes'])}"
+            lines.append(line)
+            if period == 'week':
+                titles = [f"{self._format_time(e.get('start', {}))} {e.get('summary', '無題のイベント')}"
+                          for e in events[:DIGEST_TITLES_PER_DAY]]
+                if len(events) > DIGEST_TITLES_PER_DAY:
+                    titles.append(f"他{len(events) - DIGEST_TITLES_PER_DAY}件")
+                lines.append("　" + " / ".join(titles))
+        
+        busiest = summary['busiest_day']
+        lines.append("")
+        lines.append(f"📊 合計 {summary['total_events']} 件の予定 / 会議 {format_hours(summary['total_minutes'])}")
+        lines.append(f"🔥 最も忙しい日: {format_day(busiest['date'])} {len(busiest['events'])}件")
+        lines.append(f"🔁 連続した会議: {summary['back_to_back']} 回")
+        return header + "\n".join(lines)
+    
+    def format_digest_voice_message(self, summary: Dict[str, Any], period: str, stale: bool = False) -> str:
+        """Short spoken summary of a digest instead of reading every event."""
+        label = PERIOD_LABELS[period]
+        stale_note = "カレンダーに接続できなかったため、前回取得した予定です。" if stale else ""
+        if not summary['total_events']:
+            return f"{label}の予定はありません。{stale_note}"
         
-        message += f"以上、合計{len(events)}件の予定です。"
+        busiest = summary['busiest_day']['date']
+        message = f"{label}の予定をお知らせします。{stale_note}"
+        message += f"合計{summary['total_events']}件、会議はおよそ{format_hours(summary['total_minutes'])}です。"
+        message += (f"いちばん忙しいのは{busiest.month}月{busiest.day}日{WEEKDAYS[busiest.weekday()]}曜日で、"
+                    f"{len(summary['busiest_day']['events'])}件です。")
+        if summary['back_to_back']:
+            message += f"連続した会議が{summary['back_to_back']}回あります。"
         return message
     
+    def format_reminder_message(self, event: Dict[str, Any], minutes: int) -> str:
+        """Format a pre-meeting reminder for voice output."""
+        start_time = self._format_voice_time(event.get('start', {}))
+        summary = normalize_reading(event.get('summary', '無題のイベント'))
+        return f"{minutes}分後、{start_time}から{summary}が始まります。"
+    
     def _format_voice_time(self, time_data: Dict[str, Any]) -> str:
         """Format time data for voice output."""
         if 'dateTime' in time_data:
@@ -245,76 +498,34 @@ class CalendarVoiceBot:
         else:
             return '時刻未定で'
     
-    async def synthesize_speech(self, text: str) -> str:
-        """Synthesize speech using VOICEVOX API and return audio file path."""
-        try:
-            params = {
-                'speaker': self.voicevox_speaker_id,
-                'text': text
-            }
-            
-            if self.voicevox_api_key:
-                params['key'] = self.voicevox_api_key
-            
-            async with aiohttp.ClientSession() as session:
-                # Use GET request with query parameters like the browser implementation
-                async with session.get(self.voicevox_api_url, params=params) as response:
-                    if response.status != 200:
-                        logger.error(f"VOICEVOX API error: {response.status}")
-                        error_text = await response.text()
-                        logger.error(f"Error response: {error_text}")
-                        return None
-                    
-                    result = await response.json()
-                    logger.info(f"VOICEVOX API response keys: {list(result.keys())}")
-                    
-                    # Check for retry (rate limiting)
-                    if 'retryAfter' in result:
-                        retry_seconds = result['retryAfter'] + 1
-                        logger.info(f"Rate limited, retrying after {retry_seconds} seconds")
-                        await asyncio.sleep(retry_seconds)
-                        return await self.synthesize_speech(text)  # Recursive retry
-                    
-                    # Get the streaming URL (correct field name)
-                    mp3_url = result.get('mp3StreamingUrl')
-                    
-                    if not mp3_url:
-                        if 'errorMessage' in result:
-                            logger.error(f"VOICEVOX API error: {result['errorMessage']}")
-                        else:
-                            logger.error("No mp3StreamingUrl in response")
-                            logger.error(f"Full response: {result}")
-                        return None
-                    
-                    logger.info(f"Downloading audio from: {mp3_url}")
-                    
-                    # Download audio file
-                    async with session.get(mp3_url) as audio_response:
-                        if audio_response.status != 200:
-                            logger.error(f"Failed to download audio: {audio_response.status}")
-                            return None
-                        
-                        # Save to temporary file
-                        temp_file = tempfile.NamedTemporaryFile(suffix='.mp3', delete=False)
-                        audio_data = await audio_response.read()
-                        temp_file.write(audio_data)
-                        temp_file.close()
-                        
-                        logger.info(f"Audio file saved: {temp_file.name}")
-                        return temp_file.name
-                        
-        except Exception as e:
-            logger.error(f"Error synthesizing speech: {e}")
-            return None
+    def speaker_for(self, is_tomorrow: bool = False) -> int:
+        """VOICEVOX speaker for today's (or tomorrow's) announcement."""
+        return self.tomorrow_speaker_id if is_tomorrow else self.voicevox_speaker_id
+    
+    async def synthesize_speech(self, text: str, speaker: int = None) -> str:
+        """Synthesize speech using VOICEVOX API and return audio file path.
+        
+        Clips are published to the shared audio cache (keyed by speaker) so the monitor can reuse them.
+        """
+        if speaker is None:
+            speaker = self.voicevox_speaker_id
+        return await self.audio_cache.get_or_synthesize(
+            text, speaker, lambda: self._request_speech(text, speaker))
+    
+    async def _request_speech(self, text: str, speaker: int) -> bytes:
+        """Call VOICEVOX API and return the MP3 bytes."""
+        return await self.tts.synthesize(text, speaker)
     
     def play_audio(self, audio_file_path: str) -> bool:
         """Play audio file using pygame."""
         try:
-            pygame.mixer.music.load(audio_file_path)
-            pygame.mixer.music.play()
-            
-            while pygame.mixer.music.get_busy():
-                pygame.time.wait(100)
+            with stage('bot', 'decode'):
+                pygame.mixer.music.load(audio_file_path)
+            with stage('bot', 'playback'):
+                pygame.mixer.music.play()
+                
+                while pygame.mixer.music.get_busy():
+                    pygame.time.wait(100)
             
             logger.info("Audio playback completed")
             return True
@@ -323,22 +534,47 @@ class CalendarVoiceBot:
             logger.error(f"Error playing audio: {e}")
             return False
         finally:
-            # Clean up temporary file
-            try:
-                os.unlink(audio_file_path)
-            except:
-                pass
+            # Clean up temporary file (cached clips are kept for reuse)
+            if not self.audio_cache.owns(audio_file_path):
+                try:
+                    os.unlink(audio_file_path)
+                except:
+                    pass
     
-    async def speak_schedule(self, events: List[Dict[str, Any]], date: datetime, is_tomorrow: bool = False) -> bool:
+    async def speak_schedule(self, events: List[Dict[str, Any]], date: datetime, is_tomorrow: bool = False,
+                             voice_message: str = None) -> bool:
         """Convert schedule to speech and play it."""
-        voice_message = self.format_voice_message(events, date, is_tomorrow)
+        if voice_message is None:
+            voice_message = self.format_voice_message(events, date, is_tomorrow)
         logger.info(f"Voice message: {voice_message}")
         
-        audio_file = await self.synthesize_speech(voice_message)
-        if audio_file:
-            return self.play_audio(audio_file)
+        destination = 'voice:tomorrow' if is_tomorrow else 'voice:today'
+        return await self._speak_once(voice_message, date.strftime('%Y-%m-%d'), destination,
+                                      self.speaker_for(is_tomorrow))
+    
+    async def _speak_once(self, voice_message: str, date_key: str, destination: str, speaker: int = None) -> bool:
+        """Synthesize and play voice_message unless the ledger says it was already spoken."""
+        digest = content_hash(voice_message)
+        if self.ledger.is_delivered(self.tenant, date_key, destination, digest):
+            logger.info(f"Voice message for {date_key} already spoken, skipping")
+            return True
+        
+        audio_file = await self.synthesize_speech(voice_message, speaker)
+        if audio_file and await self._play_audio_async(audio_file):
+            self.ledger.record(self.tenant, date_key, destination, digest)
+            return True
         return False
     
+    async def _play_audio_async(self, audio_file_path: str) -> bool:
+        """Play audio in a worker thread so Slack delivery keeps running during playback."""
+        if self.player is not None:
+            return await self.player(audio_file_path)
+        if self.playback_lock is None:
+            self.playback_lock = asyncio.Lock()
+        async with self.playback_lock:
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(None, self.play_audio, audio_file_path)
+    
     def _format_time(self, time_data: Dict[str, Any]) -> str:
         """Format time data from Google Calendar API."""
         if 'dateTime' in time_data:
@@ -351,24 +587,91 @@ class CalendarVoiceBot:
         else:
             return '時刻未定'
     
-    def send_to_slack(self, message: str) -> bool:
-        """Send message to Slack webhook."""
-        try:
-            payload = {
-                'text': message,
-                'username': 'Calendar Bot',
-                'icon_emoji': ':calendar:'
-            }
-            
-            response = requests.post(self.slack_webhook_url, json=payload)
-            response.raise_for_status()
-            
-            logger.info("Message sent to Slack successfully")
+    def build_slack_payload(self, message: str, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Render the Slack payload shared by every destination."""
+        payload = {
+            'text': message,
+            'username': 'Calendar Bot',
+            'icon_emoji': ':calendar:'
+        }
+        if metadata:
+            payload['metadata'] = metadata
+        return payload
+    
+    def build_schedule_metadata(self, date: datetime, voice_texts: List[str], days: List[tuple],
+                                audio_published: bool = False, speakers: List[int] = None) -> Dict[str, Any]:
+        """Build message metadata from (day_label, events) pairs and the voice texts (and their speakers)."""
+        events = []
+        for day_label, day_events in days:
+            for event in day_events:
+                events.append({
+                    'day': day_label,
+                    'time': f"{self._format_time(event.get('start', {}))}〜{self._format_time(event.get('end', {}))}",
+                    'title': event.get('summary', '無題のイベント'),
+                })
+        return build_schedule_metadata(date.strftime('%Y-%m-%d'), voice_texts, events,
+                                       speaker=self.voicevox_speaker_id,
+                                       audio_published=audio_published and self.audio_cache.enabled,
+                                       speakers=speakers or [self.voicevox_speaker_id] * len(voice_texts))
+    
+    def _begin_announcement(self, metadata: Dict[str, Any]):
+        """Mark an announcement as being spoken here before posting it, so an in-process monitor waits for it."""
+        if self.announced is not None:
+            self.announced.begin(metadata['event_payload']['content_hash'])
+    
+    def _finish_announcement(self, metadata: Dict[str, Any], spoken: bool):
+        if self.announced is not None:
+            self.announced.finish(metadata['event_payload']['content_hash'], spoken)
+    
+    @staticmethod
+    def _ledger_destination(destination: str) -> str:
+        """Ledger name for a destination (webhook URLs are secrets, so store a hash)."""
+        if is_webhook(destination):
+            return f"webhook:{content_hash(destination)}"
+        return destination
+    
+    async def send_to_slack(self, message: str, date: datetime = None, metadata: Dict[str, Any] = None) -> bool:
+        """Send message to every configured Slack destination not yet delivered today."""
+        payload = self.build_slack_payload(message, metadata)
+        date_key = (date or datetime.now(self.tz)).strftime('%Y-%m-%d')
+        digest = content_hash(payload)
+        
+        pending = [d for d in self.slack_destinations
+                   if not self.ledger.is_delivered(self.tenant, date_key, self._ledger_destination(d), digest)]
+        skipped = len(self.slack_destinations) - len(pending)
+        if skipped:
+            logger.info(f"Skipping {skipped} Slack destinations already delivered for {date_key}")
+        if not pending:
+            self.last_delivery_report = []
             return True
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to send message to Slack: {e}")
-            return False
+        
+        with stage('bot', 'slack_post') as timer:
+            results = await self.slack_fanout.deliver(payload, pending)
+            if not all(r['ok'] for r in results):
+                timer.fail()
+        self.last_delivery_report = results
+        
+        # Reports carry masked destinations; match them back by position
+        for destination, result in zip(pending, results):
+            if result['ok']:
+                self.ledger.record(self.tenant, date_key, self._ledger_destination(destination),
+                                   digest, ts=result['ts'], save=False)
+        self.ledger.save()
+        
+        succeeded = [r for r in results if r['ok']]
+        if len(succeeded) == len(results):
+            logger.info(f"Message sent to Slack successfully ({len(results)} destinations)")
+            return True
+        
+        logger.error(f"Failed to send message to {len(results) - len(succeeded)} of {len(results)} Slack destinations")
+        return False
+    
+    async def close(self):
+        """Release pooled HTTP connections (unless shared with other bots)."""
+        if self._owns_slack_client:
+            await self.slack_client.close()
+        if self._owns_tts:
+            await self.tts.close()
     
     async def send_daily_schedule(self, date: datetime = None, include_tomorrow: bool = True, with_voice: bool = True) -> bool:
         """Main method to fetch events, send daily schedule to Slack, and optionally speak it."""
@@ -381,65 +684,154 @@ class CalendarVoiceBot:
                 date = self.tz.localize(date)
             
             # Get today's events
-            today_events = self.get_daily_events(date)
-            today_message = self.format_schedule_message(today_events, date, is_tomorrow=False)
+            today_events = await self.get_daily_events(date)
+            today_free = await self.get_free_slots(date)
+            with stage('bot', 'format'):
+                today_message = self.format_schedule_message(today_events, date, is_tomorrow=False,
+                                                             free_slots=today_free)
             
             # Get tomorrow's events if requested
             message = today_message
             tomorrow_events = []
+            tomorrow_free = None
             if include_tomorrow:
                 tomorrow = date + timedelta(days=1)
                 # 明日が平日の場合のみ明日の予定を表示
                 if self._is_business_day(tomorrow):
-                    tomorrow_events = self.get_daily_events(tomorrow)
-                    tomorrow_message = self.format_schedule_message(tomorrow_events, tomorrow, is_tomorrow=True)
-                    message += "\n\n" + "="*30 + "\n\n" + tomorrow_message
+                    try:
+                        tomorrow_events = await self.get_daily_events(tomorrow)
+                    except CalendarUnavailable as e:
+                        # Today's schedule still goes out without tomorrow's section
+                        logger.warning(f"Skipping tomorrow's schedule: {e}")
+                    else:
+                        tomorrow_free = await self.get_free_slots(tomorrow)
+                        with stage('bot', 'format'):
+                            tomorrow_message = self.format_schedule_message(tomorrow_events, tomorrow, is_tomorrow=True,
+                                                                            free_slots=tomorrow_free)
+                        message += "\n\n" + "="*30 + "\n\n" + tomorrow_message
+            
+            # Attach the exact voice texts spoken below so the monitor can skip parsing
+            with stage('bot', 'format'):
+                voice_texts = [self.format_voice_message(today_events, date, is_tomorrow=False, free_slots=today_free)]
+                if tomorrow_events:
+                    voice_texts.append(self.format_voice_message(tomorrow_events, date + timedelta(days=1), is_tomorrow=True,
+                                                                 free_slots=tomorrow_free))
+            speakers = [self.speaker_for(is_tomorrow=i > 0) for i in range(len(voice_texts))]
+            metadata = self.build_schedule_metadata(date, voice_texts, [('今日', today_events), ('明日', tomorrow_events)],
+                                                    audio_published=with_voice, speakers=speakers)
+            if with_voice:
+                self._begin_announcement(metadata)
+            
+            # Start synthesis before posting so the published clips are ready when the monitor sees the message
+            prefetch = []
+            if with_voice:
+                prefetch = [asyncio.ensure_future(self.synthesize_speech(text, speaker))
+                            for text, speaker in zip(voice_texts, speakers)]
             
-            # Send to Slack
-            slack_success = self.send_to_slack(message)
+            # Send to Slack in the background so a slow response doesn't hold up the voice
+            slack_task = asyncio.ensure_future(self.send_to_slack(message, date, metadata))
             
             # Speak the schedule if voice is enabled
             voice_success = True
             if with_voice:
-                # Speak today's schedule
-                today_voice_success = await self.speak_schedule(today_events, date, is_tomorrow=False)
-                
-                # Speak tomorrow's schedule if available
-                tomorrow_voice_success = True
-                if tomorrow_events and include_tomorrow:
-                    tomorrow = date + timedelta(days=1)
-                    tomorrow_voice_success = await self.speak_schedule(tomorrow_events, tomorrow, is_tomorrow=True)
-                
-                voice_success = today_voice_success and tomorrow_voice_success
+                voice_success = False
+                try:
+                    # Speak today's schedule
+                    today_voice_success = await self.speak_schedule(today_events, date, is_tomorrow=False,
+                                                                    voice_message=voice_texts[0])
+                    
+                    # Speak tomorrow's schedule if available
+                    tomorrow_voice_success = True
+                    if tomorrow_events and include_tomorrow:
+                        tomorrow = date + timedelta(days=1)
+                        tomorrow_voice_success = await self.speak_schedule(tomorrow_events, tomorrow, is_tomorrow=True,
+                                                                           voice_message=voice_texts[1])
+                    
+                    voice_success = today_voice_success and tomorrow_voice_success
+                finally:
+                    self._finish_announcement(metadata, voice_success)
             
+            slack_success = await slack_task
+            await asyncio.gather(*prefetch, return_exceptions=True)
             return slack_success and voice_success
             
         except Exception as e:
             logger.error(f"Error sending daily schedule: {e}")
             return False
+    
+    async def send_digest(self, period: str, date: datetime = None, with_voice: bool = True) -> bool:
+        """Post a weekly or monthly digest of the period containing date, with a short spoken summary."""
+        try:
+            if date is None:
+                date = datetime.now(self.tz)
+            if date.tzinfo is None:
+                date = self.tz.localize(date)
+            
+            start, end = period_range(period, date, self.tz)
+            events = await self.get_range_events(start, end)
+            with stage('bot', 'format'):
+                summary = summarize_range(events, start, end, self.tz)
+                message = self.format_digest_message(summary, period, self._stale_notice(events))
+                voice_text = self.format_digest_voice_message(summary, period, stale=bool(self._stale_notice(events)))
+            logger.info(f"{period} digest: {summary['total_events']} events, "
+                        f"{summary['total_minutes'] / 60:.1f} hours, {summary['back_to_back']} back-to-back")
+            metadata = self.build_schedule_metadata(start, [voice_text], [], audio_published=with_voice)
+            if with_voice:
+                self._begin_announcement(metadata)
+            
+            prefetch = asyncio.ensure_future(self.synthesize_speech(voice_text, self.speaker_for())) if with_voice else None
+            slack_task = asyncio.ensure_future(self.send_to_slack(message, start, metadata))
+            
+            voice_success = True
+            if with_voice:
+                logger.info(f"Voice message: {voice_text}")
+                voice_success = False
+                try:
+                    voice_success = await self._speak_once(voice_text, start.strftime('%Y-%m-%d'), f"voice:{period}",
+                                                           self.speaker_for())
+                finally:
+                    self._finish_announcement(metadata, voice_success)
+                await asyncio.gather(prefetch, return_exceptions=True)
+            
+            return await slack_task and voice_success
+            
+        except Exception as e:
+            logger.error(f"Error sending {period} digest: {e}")
+            return False
 
 
-async def main():
-    """Main entry point."""
+async def run_once(period: str = None):
+    """Post today's schedule once (the cron / run_calendar.sh mode), or a 'week' / 'month' digest."""
     try:
         logger.info("Starting Calendar Voice Bot...")
         bot = CalendarVoiceBot()
+        exporter = MetricsExporter('bot')
         
-        # 現在の日付をJSTで取得
-        now = datetime.now(bot.tz)
-        
-        # 平日判定（土日祝日をスキップ）
-        if not bot._is_business_day(now):
-            logger.info("今日は土日または祝日のため、配信をスキップします")
-            return
-        
-        # Send today's schedule (and tomorrow's if available) with voice
-        success = await bot.send_daily_schedule(include_tomorrow=True, with_voice=True)
+        try:
+            await exporter.start()
+            
+            if period:
+                success = await bot.send_digest(period)
+            else:
+                # 現在の日付をJSTで取得
+                now = datetime.now(bot.tz)
+                
+                # 平日判定（土日祝日をスキップ）
+                if not bot._is_business_day(now):
+                    logger.info("今日は土日または祝日のため、配信をスキップします")
+                    return
+                
+                # Send today's schedule (and tomorrow's if available) with voice
+                success = await bot.send_daily_schedule(include_tomorrow=True, with_voice=True)
+        finally:
+            await exporter.stop()
+            await bot.close()
         
+        what = f"{period} digest" if period else "daily schedule"
         if success:
-            logger.info("Daily schedule sent successfully to Slack and spoken")
+            logger.info(f"{what.capitalize()} sent successfully to Slack and spoken")
         else:
-            logger.error("Failed to send daily schedule or speak it")
+            logger.error(f"Failed to send {what} or speak it")
             exit(1)
             
     except Exception as e:
@@ -447,5 +839,160 @@ async def main():
         exit(1)
 
 
+def _make_daily_job(bot: CalendarVoiceBot, tenant: Dict[str, Any]):
+    async def job(fire_time: datetime):
+        if tenant['business_days_only'] and not bot._is_business_day(fire_time):
+            return
+        bot.audio_cache.prune()
+        success = await bot.send_daily_schedule(date=fire_time,
+                                                include_tomorrow=tenant['include_tomorrow'],
+                                                with_voice=tenant['with_voice'])
+        if success:
+            logger.info(f"[{bot.tenant}] Daily schedule sent successfully")
+        else:
+            logger.error(f"[{bot.tenant}] Failed to send daily schedule or speak it")
+    return job
+
+
+def _make_digest_job(bot: CalendarVoiceBot, tenant: Dict[str, Any], period: str):
+    async def job(fire_time: datetime):
+        if await bot.send_digest(period, date=fire_time, with_voice=tenant['with_voice']):
+            logger.info(f"[{bot.tenant}] {period} digest sent successfully")
+        else:
+            logger.error(f"[{bot.tenant}] Failed to send {period} digest")
+    return job
+
+
+def _make_reminder_refresh_job(bot: CalendarVoiceBot, engine: ReminderEngine):
+    async def job(fire_time: datetime):
+        try:
+            events = await bot.get_daily_events(fire_time)
+        except CalendarUnavailable as e:
+            logger.warning(f"[{bot.tenant}] {e}, keeping existing reminders")
+            return
+        engine.sync(bot, events, now=fire_time)
+    return job
+
+
+async def run_daemon(session: aiohttp.ClientSession = None, audio_cache: AudioCache = None,
+                     tts: VoicevoxClient = None, player: Callable[[str], Awaitable[bool]] = None,
+                     announced: LocalAnnouncements = None, export_metrics: bool = True):
+    """Stay resident and post each tenant's schedule at its cron time.
+    
+    The Calendar service, Slack connection pool, ledger, audio cache and pygame
+    are set up once and reused by every run. Tenants with reminders enabled also
+    get spoken reminders before each meeting, refreshed from the calendar periodically.
+    run_combined passes the monitor's session, audio cache, VOICEVOX client and playback queue.
+    """
+    logger.info("Starting Calendar Voice Bot daemon...")
+    tenants = load_tenants()
+    
+    slack_client = SlackClient(bot_token=os.getenv('SLACK_BOT_TOKEN'), session=session)
+    audio_cache = audio_cache or AudioCache()
+    ledger = DeliveryLedger()
+    calendar_snapshot = CalendarSnapshot()
+    owns_tts = tts is None
+    tts = tts or VoicevoxClient('bot')
+    playback_lock = asyncio.Lock()
+    scheduler = Scheduler()
+    reminders = ReminderEngine()
+    refresh_schedule = CronSchedule(os.getenv('REMINDER_REFRESH_SCHEDULE', '*/10 * * * *'))
+    
+    exporter = MetricsExporter('bot') if export_metrics else None
+    
+    service = None
+    tasks = []
+    try:
+        if exporter:
+            await exporter.start()
+        for tenant in tenants:
+            bot = CalendarVoiceBot(tenant, service=service, slack_client=slack_client,
+                                   audio_cache=audio_cache, ledger=ledger, playback_lock=playback_lock,
+                                   calendar_snapshot=calendar_snapshot, tts=tts, player=player,
+                                   announced=announced)
+            service = bot.service
+            scheduler.add_job(bot.tenant, CronSchedule(tenant['schedule']), _make_daily_job(bot, tenant), bot.tz)
+            for period in ('week', 'month'):
+                if tenant[f"{period}ly_digest_schedule"]:
+                    scheduler.add_job(f"{bot.tenant}:{period}ly_digest", CronSchedule(tenant[f"{period}ly_digest_schedule"]),
+                                      _make_digest_job(bot, tenant, period), bot.tz)
+            
+            if tenant['reminders']:
+                refresh = _make_reminder_refresh_job(bot, reminders)
+                scheduler.add_job(f"{bot.tenant}:reminders", refresh_schedule, refresh, bot.tz)
+                await refresh(datetime.now(bot.tz))
+        
+        tasks.append(asyncio.ensure_future(reminders.run()))
+        tasks.append(asyncio.ensure_future(scheduler.run()))
+        await asyncio.gather(*tasks)
+    finally:
+        reminders.stop()
+        for task in tasks:
+            task.cancel()
+        if exporter:
+            await exporter.stop()
+        await slack_client.close()
+        if owns_tts:
+            await tts.close()
+
+
+async def run_combined():
+    """Run the daemon and the Slack monitor as tasks on one event loop (BOT_MODE=combined).
+    
+    Instead of two processes, both share one HTTP connection pool, the audio cache,
+    one VOICEVOX client (hedging statistics and rate-limit cooldowns cover all
+    synthesis) and the monitor's playback queue, so announcements, reminders and
+    monitored messages never talk over each other. Announcements the bot speaks
+    itself are not spoken a second time when the monitor sees the post (one the
+    bot failed to speak is left to the monitor).
+    """
+    # Imported here: the monitor module configures logging on import, which would override ours
+    from slack_voice_monitor import SlackVoiceMonitor
+    
+    logger.info("Starting Calendar Voice Bot with the Slack monitor in one process...")
+    monitor = SlackVoiceMonitor(announced=LocalAnnouncements())
+    exporter = MetricsExporter('combined')
+    mode = os.getenv('MONITOR_MODE', 'poll').lower()
+    
+    tasks = []
+    try:
+        await monitor.start()
+        await exporter.start()
+        tasks.append(asyncio.ensure_future(run_daemon(session=monitor.session, audio_cache=monitor.audio_cache,
+                                                      tts=monitor.tts, player=monitor.enqueue_playback,
+                                                      announced=monitor.announced, export_metrics=False)))
+        if mode in ('socket', 'events'):
+            tasks.append(asyncio.ensure_future(monitor.run_events(mode)))
+        else:
+            tasks.append(asyncio.ensure_future(monitor.run_continuous()))
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await exporter.stop()
+        await monitor.close()
+
+
+def main():
+    """Main entry point."""
+    # once (default): post and exit, daemon: stay resident with the built-in scheduler,
+    # weekly / monthly: post a digest of this week / month and exit,
+    # combined: daemon plus the Slack monitor in this process
+    mode = os.getenv('BOT_MODE', 'once').lower()
+    if mode in ('weekly', 'monthly'):
+        asyncio.run(run_once('week' if mode == 'weekly' else 'month'))
+    elif mode in ('daemon', 'combined'):
+        try:
+            asyncio.run(run_daemon() if mode == 'daemon' else run_combined())
+        except KeyboardInterrupt:
+            logger.info("Daemon stopped by user")
+        except Exception as e:
+            logger.error(f"Application error: {e}")
+            exit(1)
+    else:
+        asyncio.run(run_once())
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    main()
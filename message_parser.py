@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Message Parser
+Structured metadata for Calendar Bot Slack messages, with single-pass
+parsing of the mrkdwn text as a fallback for messages without it.
+"""
+
+import re
+import json
+import hashlib
+from typing import Any, Dict, List, Optional
+
+from reading import normalize_reading
+
+# Slack message metadata event type attached by CalendarVoiceBot
+CALENDAR_METADATA_EVENT_TYPE = 'calendar_schedule_posted'
+CALENDAR_METADATA_VERSION = 1
+
+# Any one of these marks a Calendar Bot message ('.' never crosses a line, as before)
+CALENDAR_MESSAGE_RE = re.compile(r'📅[^\n]*の予定|合計[^\n]*件の予定|Calendar Bot|🕐[^\n]*〜')
+
+# One token per non-blank line; the body group is the line with surrounding whitespace stripped
+LINE_RE = re.compile(r'^[^\S\n]*(?P<body>\S(?:[^\n]*\S)?)', re.M)
+
+ITEM_PREFIX_RE = re.compile(r'\d+\.\s*')
+DATE_RE = re.compile(r'\d+年\d+月\d+日')
+DAY_RE = re.compile(r'今日|明日')
+CLOCK_RE = re.compile(r'🕐\s*')
+COUNT_RE = re.compile(r'(\d+)\s*件')
+NEWLINES_RE = re.compile(r'\n+')
+
+FALLBACK_STRIP_TABLE = str.maketrans('', '', '📅🕐📍📝✨📊🟢*')
+
+
+def voice_texts_hash(voice_texts: List[str]) -> str:
+    """Content hash identifying the spoken announcement."""
+    return hashlib.sha256(json.dumps(voice_texts, ensure_ascii=False).encode('utf-8')).hexdigest()[:16]
+
+
+def build_schedule_metadata(date: str, voice_texts: List[str], events: List[Dict[str, str]],
+                            speaker: Optional[int] = None, audio_published: bool = False,
+                            speakers: Optional[List[int]] = None) -> Dict[str, Any]:
+    """Build the Slack message metadata posted alongside a schedule.
+
+    Slack metadata payloads should stay flat, so events are sent as parallel string arrays.
+    speakers gives the speaker of each voice text (speaker alone is kept for older monitors).
+    audio_published tells the monitor the bot is publishing the clips to the shared audio cache.
+    """
+    return {
+        'event_type': CALENDAR_METADATA_EVENT_TYPE,
+        'event_payload': {
+            'version': CALENDAR_METADATA_VERSION,
+            'date': date,
+            'voice_texts': voice_texts,
+            'content_hash': voice_texts_hash(voice_texts),
+            'speaker': speaker,
+            'speakers': speakers if speakers is not None else [speaker] * len(voice_texts),
+            'audio_published': audio_published,
+            'event_days': [event['day'] for event in events],
+            'event_times': [event['time'] for event in events],
+            'event_titles': [event['title'] for event in events],
+        }
+    }
+
+
+def read_schedule_metadata(message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Return the schedule metadata payload of a message, or None if it has none."""
+    metadata = message.get('metadata')
+    if not metadata or metadata.get('event_type') != CALENDAR_METADATA_EVENT_TYPE:
+        return None
+    payload = metadata.get('event_payload') or {}
+    if not payload.get('voice_texts'):
+        return None
+    return payload
+
+
+def is_calendar_message(message: Dict[str, Any]) -> bool:
+    """Check if message is from Calendar Bot."""
+    return (read_schedule_metadata(message) is not None or
+            message.get('username', '') == 'Calendar Bot' or
+            CALENDAR_MESSAGE_RE.search(message.get('text', '')) is not None)
+
+
+def voice_texts_for_message(message: Dict[str, Any]) -> List[str]:
+    """Voice texts for a message: from metadata when present, otherwise parsed from the text."""
+    payload = read_schedule_metadata(message)
+    if payload is not None:
+        return list(payload['voice_texts'])
+
+    # The bot normalizes readings before attaching voice texts; parsed text still needs it
+    voice_text = normalize_reading(extract_voice_content(message.get('text', '')))
+    return [voice_text] if voice_text else []
+
+
+def extract_voice_content(slack_text: str) -> str:
+    """Extract voice-friendly content from a Calendar Bot Slack message."""
+    voice_parts = []
+
+    for token in LINE_RE.finditer(slack_text):
+        line = token.group('body')
+
+        # Title line
+        if '予定 -' in line:
+            day_match = DAY_RE.search(line)
+            if day_match and DATE_RE.search(line):
+                voice_parts.append(f"{day_match.group(0)}の予定をお知らせします。")
+
+        # Event lines (numbered items)
+        elif ITEM_PREFIX_RE.match(line):
+            voice_parts.append(f"{ITEM_PREFIX_RE.sub('', line, count=1)}。")
+
+        # Time lines
+        elif '🕐' in line:
+            voice_parts.append(f"時間は{CLOCK_RE.sub('', line).replace('〜', 'から')}です。")
+
+        # Free time line ("🟢 空き時間: 13:00〜15:00, 16:30〜18:00" or "🟢 空き時間: なし")
+        elif line.startswith('🟢'):
+            slots = line.partition(':')[2].strip()
+            if slots == 'なし':
+                voice_parts.append("空き時間はありません。")
+            elif slots:
+                voice_parts.append(f"空き時間は{slots.replace('〜', 'から').replace(', ', 'と、')}です。")
+
+        # Summary line
+        elif '合計' in line and '件の予定' in line:
+            count_match = COUNT_RE.search(line)
+            if count_match:
+                voice_parts.append(f"以上、{count_match.group(1)}件の予定でした。")
+
+    # Fallback: if no structured content found, clean the whole text
+    if not voice_parts:
+        return NEWLINES_RE.sub('。', slack_text.translate(FALLBACK_STRIP_TABLE)).strip()
+
+    return ''.join(voice_parts)
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Metrics
+Lightweight in-process counters and latency histograms shared by the bot and monitor.
+"""
+
+import time
+import threading
+from typing import Dict, List, Optional, Tuple
+
+# Default latency buckets in seconds (Prometheus-style upper bounds)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Optional[Dict[str, str]]) -> LabelKey:
+    if not labels:
+        return ()
+    return tuple(sorted((str(k), str(v)) for k, v in labels.items()))
+
+
+class Counter:
+    """Monotonic counter with optional labels."""
+
+    def __init__(self, name: str, help_text: str = ''):
+        self.name = name
+        self.help_text = help_text
+        self._values: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, labels: Optional[Dict[str, str]] = None):
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, labels: Optional[Dict[str, str]] = None) -> float:
+        return self._values.get(_label_key(labels), 0.0)
+
+    def snapshot(self) -> List[Dict]:
+        with self._lock:
+            return [{'labels': dict(key), 'value': value} for key, value in self._values.items()]
+
+
+class Gauge:
+    """Value that can go up and down, with optional labels."""
+
+    def __init__(self, name: str, help_text: str = ''):
+        self.name = name
+        self.help_text = help_text
+        self._values: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def set(self, value: float, labels: Optional[Dict[str, str]] = None):
+        with self._lock:
+            self._values[_label_key(labels)] = float(value)
+
+    def value(self, labels: Optional[Dict[str, str]] = None) -> float:
+        return self._values.get(_label_key(labels), 0.0)
+
+    def snapshot(self) -> List[Dict]:
+        with self._lock:
+            return [{'labels': dict(key), 'value': value} for key, value in self._values.items()]
+
+
+class Histogram:
+    """Bucketed histogram with optional labels."""
+
+    def __init__(self, name: str, help_text: str = '', buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[LabelKey, Dict] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, labels: Optional[Dict[str, str]] = None):
+        key = _label_key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = {'counts': [0] * len(self.buckets), 'count': 0, 'sum': 0.0, 'max': 0.0}
+                self._series[key] = series
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series['counts'][i] += 1
+            series['count'] += 1
+            series['sum'] += value
+            series['max'] = max(series['max'], value)
+
+    def snapshot(self) -> List[Dict]:
+        with self._lock:
+            result = []
+            for key, series in self._series.items():
+                count = series['count']
+                result.append({
+                    'labels': dict(key),
+                    'count': count,
+                    'sum': series['sum'],
+                    'mean': series['sum'] / count if count else 0.0,
+                    'max': series['max'],
+                    'buckets': dict(zip(self.buckets, series['counts'])),
+                })
+            return result
+
+
+class MetricsRegistry:
+    """Named collection of counters, gauges and histograms."""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help_text: str = '') -> Counter:
+        with self._lock:
+            if name not in self._metrics:
+                self._metrics[name] = Counter(name, help_text)
+            return self._metrics[name]
+
+    def gauge(self, name: str, help_text: str = '') -> Gauge:
+        with self._lock:
+            if name not in self._metrics:
+                self._metrics[name] = Gauge(name, help_text)
+            return self._metrics[name]
+
+    def histogram(self, name: str, help_text: str = '', buckets=DEFAULT_BUCKETS) -> Histogram:
+        with self._lock:
+            if name not in self._metrics:
+                self._metrics[name] = Histogram(name, help_text, buckets)
+            return self._metrics[name]
+
+    def snapshot(self) -> Dict[str, List[Dict]]:
+        with self._lock:
+            metrics = dict(self._metrics)
+        return {name: metric.snapshot() for name, metric in metrics.items()}
+
+
+# Process-wide default registry
+REGISTRY = MetricsRegistry()
+
+stage_latency = REGISTRY.histogram('stage_seconds', 'Latency of each pipeline stage')
+stage_total = REGISTRY.counter('stage_total', 'Pipeline stage runs by outcome')
+
+
+class StageTimer:
+    """Context manager timing one pipeline stage (usable inside async functions too).
+
+    An exception marks the stage as an error; call fail() for failures reported by return value.
+    """
+
+    def __init__(self, component: str, stage: str):
+        self.labels = {'component': component, 'stage': stage}
+        self.failed = False
+        self.started = 0.0
+        self.elapsed = 0.0
+
+    def fail(self):
+        self.failed = True
+
+    def __enter__(self):
+        self.started = time.monotonic()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.elapsed = time.monotonic() - self.started
+        stage_latency.observe(self.elapsed, self.labels)
+        outcome = 'error' if exc_type is not None or self.failed else 'ok'
+        stage_total.inc(labels=dict(self.labels, outcome=outcome))
+        return False
+
+
+def stage(component: str, name: str) -> StageTimer:
+    return StageTimer(component, name)
+
+
+def _escape_label(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels: Dict[str, str], extra: Dict[str, str] = None) -> str:
+    items = dict(labels, **(extra or {}))
+    if not items:
+        return ''
+    return '{' + ','.join(f'{k}="{_escape_label(v)}"' for k, v in sorted(items.items())) + '}'
+
+
+def render_prometheus(registry: MetricsRegistry = None) -> str:
+    """Render a registry in the Prometheus text exposition format."""
+    registry = registry or REGISTRY
+    with registry._lock:
+        metrics = list(registry._metrics.values())
+
+    lines = []
+    for metric in metrics:
+        kind = 'counter' if isinstance(metric, Counter) else 'gauge' if isinstance(metric, Gauge) else 'histogram'
+        lines.append(f"# HELP {metric.name} {metric.help_text}")
+        lines.append(f"# TYPE {metric.name} {kind}")
+        for series in metric.snapshot():
+            labels = series['labels']
+            if kind != 'histogram':
+                lines.append(f"{metric.name}{_format_labels(labels)} {series['value']}")
+                continue
+            # Bucket counts are already cumulative
+            for bound, count in series['buckets'].items():
+                lines.append(f"{metric.name}_bucket{_format_labels(labels, {'le': str(bound)})} {count}")
+            lines.append(f"{metric.name}_bucket{_format_labels(labels, {'le': '+Inf'})} {series['count']}")
+            lines.append(f"{metric.name}_sum{_format_labels(labels)} {series['sum']}")
+            lines.append(f"{metric.name}_count{_format_labels(labels)} {series['count']}")
+    return '\n'.join(lines) + '\n'
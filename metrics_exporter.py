@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Metrics Exporter
+Expose the metrics registry as a local Prometheus text endpoint and/or a
+periodic JSON dump. Both are off unless METRICS_PORT / METRICS_DUMP_PATH are set.
+"""
+
+import os
+import time
+import asyncio
+import logging
+from typing import Optional
+
+from aiohttp import web
+
+from metrics import REGISTRY, render_prometheus
+from state_store import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsExporter:
+    """Serve GET /metrics and write REGISTRY snapshots to a JSON file."""
+
+    def __init__(self, component: str, port: int = None, host: str = None,
+                 dump_path: str = None, dump_interval: float = None, registry=None):
+        self.component = component
+        # BOT_METRICS_PORT / MONITOR_METRICS_PORT etc. take precedence so both can run on one host
+        prefix = component.upper()
+        self.port = port if port is not None else int(
+            os.getenv(f'{prefix}_METRICS_PORT') or os.getenv('METRICS_PORT') or '0')
+        self.host = host or os.getenv('METRICS_HOST', '127.0.0.1')
+        self.dump_path = dump_path if dump_path is not None else (
+            os.getenv(f'{prefix}_METRICS_DUMP_PATH') or os.getenv('METRICS_DUMP_PATH', ''))
+        self.dump_interval = dump_interval or float(os.getenv('METRICS_DUMP_INTERVAL', '60'))
+        self.registry = registry or REGISTRY
+        self._runner: Optional[web.AppRunner] = None
+        self._dump_task: Optional[asyncio.Future] = None
+
+    async def _handle_metrics(self, request: web.Request) -> web.Response:
+        return web.Response(text=render_prometheus(self.registry), content_type='text/plain',
+                            charset='utf-8', headers={'X-Metrics-Component': self.component})
+
+    def dump(self):
+        """Write the current snapshot to dump_path."""
+        if not self.dump_path:
+            return
+        try:
+            atomic_write_json(self.dump_path, {
+                'component': self.component,
+                'generated_at': time.time(),
+                'metrics': self.registry.snapshot(),
+            })
+        except (OSError, TypeError) as e:
+            logger.warning(f"Could not write metrics dump {self.dump_path}: {e}")
+
+    async def _dump_loop(self):
+        while True:
+            await asyncio.sleep(self.dump_interval)
+            self.dump()
+
+    async def start(self):
+        if self.port:
+            app = web.Application()
+            app.router.add_get('/metrics', self._handle_metrics)
+            self._runner = web.AppRunner(app)
+            await self._runner.setup()
+            await web.TCPSite(self._runner, self.host, self.port).start()
+            logger.info(f"Metrics endpoint listening on http://{self.host}:{self.port}/metrics")
+        if self.dump_path:
+            self._dump_task = asyncio.ensure_future(self._dump_loop())
+            logger.info(f"Writing metrics to {self.dump_path} every {self.dump_interval:.0f}s")
+
+    async def stop(self):
+        """Stop serving and write a final dump."""
+        if self._dump_task is not None:
+            self._dump_task.cancel()
+            self._dump_task = None
+        self.dump()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
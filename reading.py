@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Reading Normalizer
+Rewrites event titles into text VOICEVOX reads well: full-width / half-width
+folding, URLs, emoji, floor codes and a user dictionary of English product
+names and acronyms. The dictionary is compiled into a trie and applied in one
+left-to-right pass (longest match wins); results are memoized per title.
+"""
+
+import os
+import re
+import logging
+import unicodedata
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from state_store import load_json
+
+logger = logging.getLogger(__name__)
+
+# Built-in readings; READING_DICTIONARY_PATH ({"word": "reading"}) adds to or overrides these.
+# ASCII keys match case-insensitively and only as whole words.
+DEFAULT_READINGS = {
+    'MTG': 'ミーティング',
+    '1on1': 'ワンオンワン',
+    'Zoom': 'ズーム',
+    'Google Meet': 'グーグルミート',
+    'Meet': 'ミート',
+    'Teams': 'チームズ',
+    'Slack': 'スラック',
+    'API': 'エーピーアイ',
+    'UI': 'ユーアイ',
+    'PR': 'ピーアール',
+    'KPI': 'ケーピーアイ',
+    'OKR': 'オーケーアール',
+    'TBD': '未定',
+    'WFH': '在宅勤務',
+    'Sprint planning': 'スプリントプランニング',
+    'Design review': 'デザインレビュー',
+    'review': 'レビュー',
+    'sync': 'シンク',
+    'Incident postmortem': 'インシデントポストモーテム',
+    'postmortem': 'ポストモーテム',
+    'all hands': 'オールハンズ',
+    'standup': 'スタンドアップ',
+    'kickoff': 'キックオフ',
+    '&': 'アンド',
+}
+
+URL_RE = re.compile(r'https?://\S+|www\.\S+')
+# 5F -> 5階, B1F -> 地下1階 (only when not part of a longer word)
+FLOOR_RE = re.compile(r'(?<![A-Za-z0-9])(B)?(\d{1,3})F(?![A-Za-z0-9])')
+SPACES_RE = re.compile(r'\s+')
+
+# Lowercase ASCII only, so indexes in the folded text match the original
+_ASCII_LOWER = str.maketrans('ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')
+_END = ''
+# Zero-width joiner and emoji variation selector left behind by stripped emoji
+_EMOJI_JOINERS = {'\u200d', '\ufe0f'}
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isascii() and ch.isalnum()
+
+
+def _floor_reading(match) -> str:
+    return f"{'地下' if match.group(1) else ''}{match.group(2)}階"
+
+
+class ReadingNormalizer:
+    """Dictionary-driven reading normalization with a per-text memo."""
+
+    def __init__(self, readings: Dict[str, str] = None, cache_size: int = None):
+        self.readings = dict(DEFAULT_READINGS)
+        self.readings.update(readings or {})
+        self._trie = self._compile(self.readings)
+        cache_size = cache_size if cache_size is not None else int(os.getenv('READING_CACHE_SIZE', '4096'))
+        self.normalize = lru_cache(maxsize=cache_size)(self._normalize)
+
+    @staticmethod
+    def _compile(readings: Dict[str, str]) -> dict:
+        """Nested dicts keyed by (ASCII-lowercased, NFKC) character; '' holds (reading, word-bounded ends)."""
+        trie: dict = {}
+        for word, reading in readings.items():
+            key = unicodedata.normalize('NFKC', word).translate(_ASCII_LOWER)
+            if not key:
+                continue
+            node = trie
+            for ch in key:
+                node = node.setdefault(ch, {})
+            node[_END] = (reading, _is_word_char(key[0]), _is_word_char(key[-1]))
+        return trie
+
+    def _replace(self, text: str) -> str:
+        """Single left-to-right pass replacing the longest dictionary match at each position."""
+        folded = text.translate(_ASCII_LOWER)
+        trie = self._trie
+        n = len(text)
+        out: List[str] = []
+        plain_start = 0
+        i = 0
+        while i < n:
+            node = trie.get(folded[i])
+            if node is None:
+                i += 1
+                continue
+
+            candidates: List[Tuple[int, str, bool, bool]] = []
+            j = i
+            while node is not None:
+                j += 1
+                if _END in node:
+                    candidates.append((j,) + node[_END])
+                if j >= n:
+                    break
+                node = node.get(folded[j])
+
+            for end, reading, bounded_start, bounded_end in reversed(candidates):
+                if bounded_start and i > 0 and _is_word_char(text[i - 1]):
+                    continue
+                if bounded_end and end < n and _is_word_char(text[end]):
+                    continue
+                out.append(text[plain_start:i])
+                out.append(reading)
+                i = plain_start = end
+                break
+            else:
+                i += 1
+
+        if not out:
+            return text
+        out.append(text[plain_start:])
+        return ''.join(out)
+
+    def _normalize(self, text: str) -> str:
+        if not text:
+            return text
+        # Full-width letters / digits and half-width kana to their standard forms
+        text = unicodedata.normalize('NFKC', text)
+        text = URL_RE.sub('リンク', text)
+        # Emoji and other pictographs are read as their names (or noise)
+        text = ''.join(ch for ch in text if ch not in _EMOJI_JOINERS and unicodedata.category(ch) not in ('So', 'Cs'))
+        text = FLOOR_RE.sub(_floor_reading, text)
+        text = self._replace(text)
+        return SPACES_RE.sub(' ', text).strip()
+
+
+_default: Optional[ReadingNormalizer] = None
+
+
+def get_normalizer() -> ReadingNormalizer:
+    """Process-wide normalizer with the built-in readings plus READING_DICTIONARY_PATH."""
+    global _default
+    if _default is None:
+        path = os.getenv('READING_DICTIONARY_PATH', 'reading_dictionary.json')
+        readings = load_json(path, {})
+        if readings:
+            logger.info(f"Loaded {len(readings)} readings from {path}")
+        _default = ReadingNormalizer(readings)
+    return _default
+
+
+def normalize_reading(text: str) -> str:
+    return get_normalizer().normalize(text)
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Reminders
+Spoken reminders a few minutes before each meeting. Fire times live in a
+min-heap; the engine sleeps until the earliest deadline and clips are
+synthesized ahead of time so they play on schedule.
+"""
+
+import os
+import time
+import heapq
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from delivery_ledger import content_hash
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on a single sleep so wall-clock jumps (suspend/resume) are noticed
+MAX_SLEEP_SECONDS = 300
+
+SYNTH = 'synth'
+FIRE = 'fire'
+
+ReminderKey = Tuple[str, str]
+
+
+class Reminder:
+    """One pending reminder for one event of one tenant."""
+
+    def __init__(self, bot, key: ReminderKey, start: datetime, fire_at: datetime, text: str, version: int,
+                 speaker: int = None):
+        self.bot = bot
+        self.key = key
+        self.start = start
+        self.fire_at = fire_at
+        self.text = text
+        self.version = version
+        self.speaker = speaker
+        self.clip: Optional[asyncio.Future] = None
+
+    @property
+    def signature(self) -> Tuple[datetime, str, Optional[int]]:
+        return (self.start, self.text, self.speaker)
+
+
+class ReminderEngine:
+    """Timer heap of (deadline, seq, kind, key, version) entries.
+
+    Changing or removing an event replaces/drops its Reminder; heap entries whose
+    version no longer matches are skipped when popped instead of being searched for.
+    Past reminders are dropped by the next sync once the meeting has started.
+    """
+
+    def __init__(self, lead_minutes: int = None, prefetch_minutes: int = None,
+                 synth_concurrency: int = None, grace_seconds: float = 60.0):
+        self.lead = timedelta(minutes=lead_minutes if lead_minutes is not None
+                              else int(os.getenv('REMINDER_LEAD_MINUTES', '5')))
+        self.prefetch = timedelta(minutes=prefetch_minutes if prefetch_minutes is not None
+                                  else int(os.getenv('REMINDER_PREFETCH_MINUTES', '30')))
+        self.synth_concurrency = synth_concurrency or int(os.getenv('REMINDER_SYNTH_CONCURRENCY', '4'))
+        self.grace = grace_seconds
+
+        self.reminders: Dict[ReminderKey, Reminder] = {}
+        self._heap: List[Tuple[float, int, str, ReminderKey, int]] = []
+        self._seq = 0
+        self._tasks = set()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._stopped = False
+
+    def __len__(self):
+        return len(self.reminders)
+
+    def _push(self, when: datetime, kind: str, reminder: Reminder):
+        self._seq += 1
+        heapq.heappush(self._heap, (when.timestamp(), self._seq, kind, reminder.key, reminder.version))
+
+    def _compact(self):
+        """Drop stale heap entries once they outnumber live ones."""
+        if len(self._heap) > 64 and len(self._heap) > 4 * len(self.reminders):
+            self._heap = [item for item in self._heap
+                          if item[3] in self.reminders and self.reminders[item[3]].version == item[4]]
+            heapq.heapify(self._heap)
+
+    def _event_start(self, bot, event: Dict[str, Any]) -> Optional[datetime]:
+        start = event.get('start', {})
+        if 'dateTime' not in start:
+            return None  # 終日の予定はリマインドしない
+        try:
+            return datetime.fromisoformat(start['dateTime'].replace('Z', '+00:00')).astimezone(bot.tz)
+        except ValueError:
+            return None
+
+    def sync(self, bot, events: List[Dict[str, Any]], now: datetime = None) -> int:
+        """Replace a tenant's reminders with those for `events`.
+
+        Only new, moved, renamed or removed events touch the heap. Returns the
+        number of reminders added, changed or removed.
+        """
+        now = now or datetime.now(bot.tz)
+        speaker = bot.speaker_for()
+        wanted: Dict[ReminderKey, Tuple[datetime, str]] = {}
+        for event in events:
+            start = self._event_start(bot, event)
+            if start is None or start <= now or 'id' not in event:
+                continue
+            key = (bot.tenant, f"{event['id']}@{start.isoformat()}")
+            wanted[key] = (start, bot.format_reminder_message(event, int(self.lead.total_seconds() // 60)))
+
+        changed = 0
+        for key in [k for k in self.reminders if k[0] == bot.tenant and k not in wanted]:
+            self._drop(key)
+            changed += 1
+
+        for key, (start, text) in wanted.items():
+            existing = self.reminders.get(key)
+            if existing is not None and existing.signature == (start, text, speaker):
+                continue
+            if existing is not None:
+                self._drop(key)
+            self._seq += 1
+            reminder = Reminder(bot, key, start, start - self.lead, text, self._seq, speaker)
+            self.reminders[key] = reminder
+            self._push(reminder.fire_at - self.prefetch, SYNTH, reminder)
+            self._push(reminder.fire_at, FIRE, reminder)
+            changed += 1
+
+        if changed:
+            self._compact()
+            logger.info(f"[{bot.tenant}] Reminders updated: {changed} changed, {len(self)} pending in total")
+            if self._wakeup is not None:
+                self._wakeup.set()
+        return changed
+
+    def _drop(self, key: ReminderKey):
+        reminder = self.reminders.pop(key, None)
+        if reminder is not None and reminder.clip is not None and not reminder.clip.done():
+            reminder.clip.cancel()
+
+    def _spawn(self, coro) -> asyncio.Future:
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _synthesize(self, reminder: Reminder) -> Optional[str]:
+        async with self._semaphore:
+            return await reminder.bot.synthesize_speech(reminder.text, reminder.speaker)
+
+    def _start_synthesis(self, reminder: Reminder):
+        if reminder.clip is None:
+            reminder.clip = self._spawn(self._synthesize(reminder))
+
+    async def _fire(self, reminder: Reminder):
+        bot = reminder.bot
+        late = time.time() - reminder.fire_at.timestamp()
+        if late > self.grace and time.time() >= reminder.start.timestamp():
+            logger.warning(f"[{bot.tenant}] Skipping reminder for a meeting that already started: {reminder.text}")
+            return
+
+        date_key = reminder.start.strftime('%Y-%m-%d')
+        destination = f"reminder:{reminder.key[1]}"
+        digest = content_hash(reminder.text)
+        if bot.ledger.is_delivered(bot.tenant, date_key, destination, digest):
+            return
+
+        self._start_synthesis(reminder)
+        try:
+            audio_file = await reminder.clip
+        except asyncio.CancelledError:
+            return
+        if not audio_file:
+            logger.error(f"[{bot.tenant}] Reminder clip unavailable: {reminder.text}")
+            return
+
+        logger.info(f"[{bot.tenant}] Reminder: {reminder.text} (late {max(0.0, late):.2f}s)")
+        if await bot._play_audio_async(audio_file):
+            bot.ledger.record(bot.tenant, date_key, destination, digest)
+
+    async def run(self):
+        """Sleep until the next deadline, then prefetch or play what is due."""
+        self._wakeup = asyncio.Event()
+        self._semaphore = asyncio.Semaphore(self.synth_concurrency)
+        self._stopped = False
+
+        while not self._stopped:
+            self._wakeup.clear()
+            now = time.time()
+            while self._heap and self._heap[0][0] <= now:
+                _, _, kind, key, version = heapq.heappop(self._heap)
+                reminder = self.reminders.get(key)
+                if reminder is None or reminder.version != version:
+                    continue  # superseded by a later sync
+                if kind == SYNTH:
+                    self._start_synthesis(reminder)
+                else:
+                    self._spawn(self._fire(reminder))
+
+            delay = self._heap[0][0] - time.time() if self._heap else MAX_SLEEP_SECONDS
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=min(max(delay, 0.0), MAX_SLEEP_SECONDS))
+            except asyncio.TimeoutError:
+                pass
+
+    def stop(self):
+        self._stopped = True
+        if self._wakeup is not None:
+            self._wakeup.set()
+        for task in list(self._tasks):
+            task.cancel()
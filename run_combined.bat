@@ -0,0 +1,20 @@
+@echo off
+REM Calendar Voice Bot - 常駐スケジューラー + Slack音声監視の一体モード (Windows用)
+REM run_daemon.bat と run_monitor.bat を1つのプロセスで実行（HTTP接続・音声キャッシュ・再生キューを共有）
+
+echo [%date% %time%] Calendar Voice Bot (投稿 + 監視) 起動中...
+
+REM 作業ディレクトリに移動
+cd /d "%~dp0"
+
+REM 仮想環境を有効化
+call venv\Scripts\activate
+
+REM 一体モード開始
+echo 停止するには Ctrl+C を押してください
+echo.
+
+set BOT_MODE=combined
+python main.py
+
+echo [%date% %time%] 終了
@@ -0,0 +1,20 @@
+#!/bin/bash
+# Calendar Voice Bot - 常駐スケジューラー + Slack音声監視の一体モード (macOS/Linux用)
+# run_daemon.sh と run_monitor.sh を1つのプロセスで実行（HTTP接続・音声キャッシュ・再生キューを共有）
+
+echo "[$(date)] Calendar Voice Bot (投稿 + 監視) 起動中..."
+
+# スクリプトのディレクトリに移動
+cd "$(dirname "$0")"
+
+# 仮想環境を有効化
+source venv/bin/activate
+
+# 一体モード開始
+echo "[$(date)] 監視モード: ${MONITOR_MODE:-poll}"
+echo "停止するには Ctrl+C を押してください"
+echo
+
+BOT_MODE=combined python main.py
+
+echo "[$(date)] 終了"
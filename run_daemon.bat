@@ -0,0 +1,20 @@
+@echo off
+REM Calendar Voice Bot - 常駐スケジューラーモード (Windows用)
+REM タスクスケジューラーの代わりに常時起動し、設定した時刻に予定を投稿・読み上げ
+
+echo [%date% %time%] Calendar Voice Bot デーモン起動中...
+
+REM 作業ディレクトリに移動
+cd /d "%~dp0"
+
+REM 仮想環境を有効化
+call venv\Scripts\activate
+
+REM デーモンモード開始
+echo 停止するには Ctrl+C を押してください
+echo.
+
+set BOT_MODE=daemon
+python main.py
+
+echo [%date% %time%] デーモン終了
\ No newline at end of file
@@ -0,0 +1,20 @@
+#!/bin/bash
+# Calendar Voice Bot - 常駐スケジューラーモード (macOS/Linux用)
+# cron の代わりに常時起動し、設定した時刻に予定を投稿・読み上げ
+
+echo "[$(date)] Calendar Voice Bot デーモン起動中..."
+
+# スクリプトのディレクトリに移動
+cd "$(dirname "$0")"
+
+# 仮想環境を有効化
+source venv/bin/activate
+
+# デーモンモード開始
+echo "[$(date)] スケジュール: ${DAEMON_SCHEDULE:-.env / TENANTS_FILE の設定}"
+echo "停止するには Ctrl+C を押してください"
+echo
+
+BOT_MODE=daemon python main.py
+
+echo "[$(date)] デーモン終了"
\ No newline at end of file
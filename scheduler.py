@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Scheduler
+Cron-style schedules and an asyncio job runner for the long-running daemon.
+"""
+
+import heapq
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, List, Set
+
+logger = logging.getLogger(__name__)
+
+# (low, high) bounds for minute, hour, day of month, month, day of week (0 = Sunday)
+CRON_FIELDS = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+
+# Sleep in short slices so clock changes and suspend/resume are noticed
+MAX_SLEEP_SECONDS = 60
+
+
+def _parse_field(field: str, low: int, high: int) -> Set[int]:
+    values = set()
+    for part in field.split(','):
+        step = 1
+        if '/' in part:
+            part, step_text = part.split('/')
+            step = int(step_text)
+        if part == '*':
+            start, end = low, high
+        elif '-' in part:
+            start, end = (int(v) for v in part.split('-'))
+        else:
+            start = end = int(part)
+        if start < low or end > high or start > end:
+            raise ValueError(f"Cron field '{field}' out of range {low}-{high}")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+class CronSchedule:
+    """Five-field cron expression: minute hour day-of-month month day-of-week."""
+
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression must have 5 fields: '{expression}'")
+        self.expression = expression
+        minutes, hours, days, months, weekdays = (
+            _parse_field(field, low, high) for field, (low, high) in zip(fields, CRON_FIELDS))
+        self.minutes = sorted(minutes)
+        self.hours = sorted(hours)
+        self.days = days
+        self.months = months
+        # 7 is an alias for Sunday
+        self.weekdays = {0 if d == 7 else d for d in weekdays}
+        # Standard cron: if both day fields are restricted, either may match
+        self.day_any = fields[2] != '*' and fields[4] != '*'
+        self.days_restricted = fields[2] != '*'
+        self.weekdays_restricted = fields[4] != '*'
+
+    def _day_matches(self, day: datetime) -> bool:
+        if day.month not in self.months:
+            return False
+        day_ok = day.day in self.days
+        weekday_ok = (day.isoweekday() % 7) in self.weekdays
+        if self.day_any:
+            return day_ok or weekday_ok
+        return (day_ok or not self.days_restricted) and (weekday_ok or not self.weekdays_restricted)
+
+    def next_after(self, after: datetime) -> datetime:
+        """First matching time strictly after `after` (same tzinfo)."""
+        start = (after + timedelta(minutes=1)).replace(second=0, microsecond=0)
+        day = start.replace(hour=0, minute=0)
+
+        for _ in range(366 * 5):
+            if self._day_matches(day):
+                for hour in self.hours:
+                    for minute in self.minutes:
+                        candidate = day.replace(hour=hour, minute=minute)
+                        if candidate >= start:
+                            if hasattr(candidate.tzinfo, 'normalize'):
+                                candidate = candidate.tzinfo.normalize(candidate)
+                            return candidate
+            day = (day + timedelta(days=1)).replace(hour=0, minute=0)
+        raise ValueError(f"Cron expression never fires: '{self.expression}'")
+
+
+class ScheduledJob:
+    def __init__(self, name: str, schedule: CronSchedule, callback: Callable[[datetime], Awaitable[None]], tz):
+        self.name = name
+        self.schedule = schedule
+        self.callback = callback
+        self.tz = tz
+
+
+class Scheduler:
+    """Run async jobs at their cron times, keeping the process (and its clients) warm in between."""
+
+    def __init__(self):
+        self.jobs: List[ScheduledJob] = []
+        self._running = set()
+
+    def add_job(self, name: str, schedule: CronSchedule, callback: Callable[[datetime], Awaitable[None]], tz):
+        self.jobs.append(ScheduledJob(name, schedule, callback, tz))
+
+    async def _run_job(self, job: ScheduledJob, fire_time: datetime):
+        logger.info(f"Running scheduled job '{job.name}' ({fire_time.isoformat()})")
+        try:
+            await job.callback(fire_time)
+        except Exception as e:
+            logger.error(f"Scheduled job '{job.name}' failed: {e}")
+
+    async def run(self):
+        """Fire jobs forever; jobs due at the same time run concurrently."""
+        if not self.jobs:
+            raise ValueError("No jobs scheduled")
+
+        heap = []
+        for i, job in enumerate(self.jobs):
+            next_time = job.schedule.next_after(datetime.now(job.tz))
+            heapq.heappush(heap, (next_time, i))
+            logger.info(f"Job '{job.name}' ({job.schedule.expression}) next run: {next_time.isoformat()}")
+
+        while True:
+            fire_time, i = heap[0]
+            job = self.jobs[i]
+            delay = (fire_time - datetime.now(job.tz)).total_seconds()
+            if delay > 0:
+                await asyncio.sleep(min(delay, MAX_SLEEP_SECONDS))
+                continue
+
+            heapq.heappop(heap)
+            task = asyncio.ensure_future(self._run_job(job, fire_time))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+            next_time = job.schedule.next_after(fire_time)
+            heapq.heappush(heap, (next_time, i))
+            logger.info(f"Job '{job.name}' next run: {next_time.isoformat()}")
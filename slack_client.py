@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Slack Client
+Async Slack delivery over a pooled aiohttp session with timeouts, retries and 429 handling.
+"""
+
+import os
+import json
+import time
+import random
+import asyncio
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+import aiohttp
+
+from metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+SLACK_API_BASE_URL = 'https://slack.com/api'
+
+# HTTP statuses worth retrying (rate limited or transient server errors)
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+request_latency = REGISTRY.histogram('slack_request_seconds', 'Latency of individual Slack HTTP requests')
+request_total = REGISTRY.counter('slack_requests_total', 'Slack HTTP requests by outcome')
+retry_total = REGISTRY.counter('slack_retries_total', 'Slack request retries by reason')
+
+
+class SlackDeliveryError(Exception):
+    """Raised when a Slack request fails after all retries."""
+
+
+class SlackClient:
+    """Async Slack client for incoming webhooks and Web API methods."""
+
+    def __init__(self, bot_token: Optional[str] = None, session: Optional[aiohttp.ClientSession] = None,
+                 api_base_url: str = None, max_retries: int = None, timeout: float = None,
+                 connect_timeout: float = None, pool_size: int = None,
+                 base_delay: float = 1.0, max_delay: float = 30.0, on_rate_limited=None):
+        self.bot_token = bot_token
+        self.api_base_url = (api_base_url or os.getenv('SLACK_API_BASE_URL', SLACK_API_BASE_URL)).rstrip('/')
+        self.max_retries = max_retries if max_retries is not None else int(os.getenv('SLACK_MAX_RETRIES', '4'))
+        self.timeout = timeout if timeout is not None else float(os.getenv('SLACK_TIMEOUT', '10'))
+        self.connect_timeout = connect_timeout if connect_timeout is not None else float(os.getenv('SLACK_CONNECT_TIMEOUT', '5'))
+        self.pool_size = pool_size if pool_size is not None else int(os.getenv('SLACK_POOL_SIZE', '20'))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        # Optional callback(retry_after) fired on every 429 so callers can slow down
+        self.on_rate_limited = on_rate_limited
+
+        self._session = session
+        self._owns_session = session is None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Create the pooled session lazily so it binds to the running event loop."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_size, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._owns_session = True
+        return self._session
+
+    async def close(self):
+        """Close the underlying session if this client created it."""
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Exponential backoff with full jitter, or the server's Retry-After when given."""
+        if retry_after is not None:
+            return retry_after + random.uniform(0, self.base_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    @staticmethod
+    def _parse_retry_after(headers) -> Optional[float]:
+        value = headers.get('Retry-After')
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            return None
+
+    async def _request(self, http_method: str, url: str, label: str, idempotent: bool = True,
+                       **kwargs) -> Tuple[int, str]:
+        """Send one request with retries; return (status, body) of the final response.
+
+        Non-idempotent requests (webhook posts) are only retried when they cannot have been
+        delivered: connection failures before sending, and 429 with Retry-After. A 5xx or a
+        timeout may mean the message was posted, so it is returned / raised as-is and left
+        to the delivery ledger on the next run.
+        """
+        session = self._get_session()
+        timeout = aiohttp.ClientTimeout(total=self.timeout, sock_connect=self.connect_timeout)
+        last_error = None
+
+        for attempt in range(self.max_retries + 1):
+            started = time.perf_counter()
+            try:
+                async with session.request(http_method, url, timeout=timeout, **kwargs) as response:
+                    body = await response.text()
+                    elapsed = time.perf_counter() - started
+                    request_latency.observe(elapsed, {'target': label})
+                    request_total.inc(labels={'target': label, 'status': str(response.status)})
+
+                    retry_after = self._parse_retry_after(response.headers)
+                    if response.status not in RETRYABLE_STATUSES or (
+                            not idempotent and not (response.status == 429 and retry_after is not None)):
+                        logger.debug(f"Slack {label} responded {response.status} in {elapsed:.3f}s")
+                        return response.status, body
+
+                    last_error = f"HTTP {response.status}: {body[:200]}"
+                    reason = 'rate_limited' if response.status == 429 else 'server_error'
+                    if response.status == 429 and self.on_rate_limited is not None:
+                        self.on_rate_limited(retry_after)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                elapsed = time.perf_counter() - started
+                request_latency.observe(elapsed, {'target': label})
+                request_total.inc(labels={'target': label, 'status': 'error'})
+                retry_after = None
+                last_error = f"{type(e).__name__}: {e}"
+                reason = 'timeout' if isinstance(e, asyncio.TimeoutError) else 'connection_error'
+                # Only a failed connect proves a non-idempotent request was never sent
+                if not idempotent and not isinstance(e, aiohttp.ClientConnectorError):
+                    break
+
+            if attempt >= self.max_retries:
+                break
+
+            delay = self._backoff_delay(attempt, retry_after)
+            retry_total.inc(labels={'target': label, 'reason': reason})
+            logger.warning(f"Slack {label} failed ({last_error}), retrying in {delay:.1f}s "
+                           f"({attempt + 1}/{self.max_retries})")
+            await asyncio.sleep(delay)
+
+        raise SlackDeliveryError(f"Slack {label} failed after {attempt + 1} attempts: {last_error}")
+
+    async def post_webhook(self, webhook_url: str, payload: Dict[str, Any]) -> bool:
+        """Post a payload to an incoming webhook."""
+        # Incoming webhooks are not idempotent: a retried post can show up twice
+        status, body = await self._request('POST', webhook_url, 'webhook', idempotent=False, json=payload)
+        if status != 200:
+            raise SlackDeliveryError(f"Webhook returned HTTP {status}: {body[:200]}")
+        return True
+
+    async def call_api(self, method: str, payload: Dict[str, Any] = None,
+                       params: Dict[str, Any] = None, http_method: str = 'POST') -> Dict[str, Any]:
+        """Call a Slack Web API method and return the decoded response."""
+        if not self.bot_token:
+            raise SlackDeliveryError("SLACK_BOT_TOKEN not set")
+
+        headers = {'Authorization': f'Bearer {self.bot_token}'}
+        kwargs = {'headers': headers}
+        if http_method == 'GET':
+            kwargs['params'] = params or payload or {}
+        else:
+            headers['Content-Type'] = 'application/json; charset=utf-8'
+            kwargs['json'] = payload or {}
+
+        status, body = await self._request(http_method, f"{self.api_base_url}/{method}", method, **kwargs)
+        if status != 200:
+            raise SlackDeliveryError(f"{method} returned HTTP {status}: {body[:200]}")
+
+        try:
+            return json.loads(body)
+        except ValueError:
+            raise SlackDeliveryError(f"{method} returned invalid JSON: {body[:200]}")
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Slack Events
+Receive Slack message events via Socket Mode (WebSocket) or the Events API (HTTP).
+"""
+
+import os
+import hmac
+import json
+import time
+import random
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import aiohttp
+from aiohttp import web
+
+logger = logging.getLogger(__name__)
+
+EventHandler = Callable[[Dict[str, Any]], Awaitable[None]]
+
+# Message subtypes that carry a new message (webhook posts arrive as bot_message)
+NEW_MESSAGE_SUBTYPES = {None, 'bot_message'}
+
+
+def is_new_message_event(event: Dict[str, Any]) -> bool:
+    return event.get('type') == 'message' and event.get('subtype') in NEW_MESSAGE_SUBTYPES
+
+
+class RecentEventIds:
+    """Bounded set of recently seen event_ids, so redelivered events are dispatched once."""
+
+    def __init__(self, size: int = 1024):
+        self.size = size
+        self._seen = OrderedDict()
+
+    def first_seen(self, event_id: Optional[str]) -> bool:
+        """True unless event_id was already seen (events without an id always count as new)."""
+        if not event_id:
+            return True
+        if event_id in self._seen:
+            self._seen.move_to_end(event_id)
+            return False
+        self._seen[event_id] = True
+        if len(self._seen) > self.size:
+            self._seen.popitem(last=False)
+        return True
+
+
+async def _dispatch(handler: EventHandler, event: Dict[str, Any]):
+    try:
+        await handler(event)
+    except Exception as e:
+        logger.error(f"Error handling Slack event: {e}")
+
+
+class SocketModeListener:
+    """Socket Mode client: opens a WebSocket, acks envelopes and dispatches message events."""
+
+    def __init__(self, app_token: str, handler: EventHandler, session: Optional[aiohttp.ClientSession] = None,
+                 api_base_url: str = None, socket_url: str = None):
+        self.app_token = app_token
+        self.handler = handler
+        self.api_base_url = (api_base_url or os.getenv('SLACK_API_BASE_URL', 'https://slack.com/api')).rstrip('/')
+        # Fixed WebSocket URL, e.g. a local stand-in that replays event envelopes
+        self.socket_url = socket_url or os.getenv('SLACK_SOCKET_MODE_URL')
+        self._session = session
+        self._owns_session = session is None
+        self._stopped = False
+        self._recent = RecentEventIds()
+
+    async def _open_connection_url(self, session: aiohttp.ClientSession) -> str:
+        if self.socket_url:
+            return self.socket_url
+
+        headers = {'Authorization': f'Bearer {self.app_token}'}
+        async with session.post(f"{self.api_base_url}/apps.connections.open", headers=headers) as response:
+            data = await response.json(content_type=None)
+        if not data.get('ok'):
+            raise RuntimeError(f"apps.connections.open failed: {data.get('error', 'unknown_error')}")
+        return data['url']
+
+    async def _consume(self, ws: aiohttp.ClientWebSocketResponse) -> bool:
+        """Read envelopes until the socket closes; return True if Slack asked us to reconnect."""
+        async for msg in ws:
+            if msg.type != aiohttp.WSMsgType.TEXT:
+                if msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                    break
+                continue
+
+            try:
+                envelope = json.loads(msg.data)
+            except ValueError:
+                logger.warning(f"Ignoring malformed Socket Mode frame: {msg.data[:200]!r}")
+                continue
+            if not isinstance(envelope, dict):
+                logger.warning("Ignoring Socket Mode frame that is not a JSON object")
+                continue
+            envelope_type = envelope.get('type')
+
+            if envelope_type == 'hello':
+                logger.info("Socket Mode connection established")
+                continue
+            if envelope_type == 'disconnect':
+                logger.info(f"Socket Mode disconnect requested ({envelope.get('reason')})")
+                return True
+
+            # Ack first: Slack redelivers envelopes that are not acked within 3 seconds
+            if envelope.get('envelope_id'):
+                await ws.send_json({'envelope_id': envelope['envelope_id']})
+
+            if envelope_type == 'events_api':
+                payload = envelope.get('payload', {})
+                event = payload.get('event', {})
+                if is_new_message_event(event) and self._recent.first_seen(payload.get('event_id')):
+                    asyncio.ensure_future(_dispatch(self.handler, event))
+        return True
+
+    async def run(self):
+        """Connect and keep reconnecting with backoff until stopped."""
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        attempt = 0
+
+        try:
+            while not self._stopped:
+                try:
+                    url = await self._open_connection_url(self._session)
+                    async with self._session.ws_connect(url, heartbeat=30) as ws:
+                        attempt = 0
+                        await self._consume(ws)
+                except (aiohttp.ClientError, RuntimeError, asyncio.TimeoutError) as e:
+                    logger.error(f"Socket Mode connection error: {e}")
+
+                if self._stopped:
+                    break
+                delay = random.uniform(0, min(60, 2 ** attempt))
+                attempt += 1
+                logger.info(f"Reconnecting to Socket Mode in {delay:.1f}s")
+                await asyncio.sleep(delay)
+        finally:
+            if self._owns_session and self._session is not None:
+                await self._session.close()
+
+    def stop(self):
+        self._stopped = True
+
+
+class EventsApiReceiver:
+    """HTTP receiver for the Events API with request signature verification."""
+
+    def __init__(self, handler: EventHandler, signing_secret: Optional[str] = None,
+                 host: str = None, port: int = None, path: str = '/slack/events'):
+        self.handler = handler
+        self.signing_secret = signing_secret or os.getenv('SLACK_SIGNING_SECRET')
+        self.host = host or os.getenv('SLACK_EVENTS_HOST', '0.0.0.0')
+        self.port = port or int(os.getenv('SLACK_EVENTS_PORT', '3000'))
+        self.path = path
+        self._runner = None
+        self._recent = RecentEventIds()
+        # Unsigned events could make the monitor speak arbitrary text
+        if not self.signing_secret:
+            raise ValueError("SLACK_SIGNING_SECRET is required for the Events API receiver")
+
+    def _verify_signature(self, request: web.Request, body: bytes) -> bool:
+        if not self.signing_secret:
+            return False
+
+        timestamp = request.headers.get('X-Slack-Request-Timestamp', '0')
+        signature = request.headers.get('X-Slack-Signature', '')
+        try:
+            if abs(time.time() - int(timestamp)) > 300:
+                return False
+        except ValueError:
+            return False
+
+        basestring = b'v0:' + timestamp.encode() + b':' + body
+        expected = 'v0=' + hmac.new(self.signing_secret.encode(), basestring, hashlib.sha256).hexdigest()
+        return hmac.compare_digest(expected, signature)
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        body = await request.read()
+        if not self._verify_signature(request, body):
+            return web.Response(status=401, text='invalid signature')
+
+        try:
+            data = json.loads(body)
+        except ValueError:
+            return web.Response(status=400, text='invalid JSON')
+        if not isinstance(data, dict):
+            return web.Response(status=400, text='invalid payload')
+        if data.get('type') == 'url_verification':
+            return web.json_response({'challenge': data.get('challenge')})
+
+        if data.get('type') == 'event_callback':
+            event = data.get('event', {})
+            # Respond immediately; Slack retries requests that take longer than 3 seconds or fail,
+            # so a retry is dispatched only if the original delivery never got here
+            if is_new_message_event(event) and self._recent.first_seen(data.get('event_id')):
+                asyncio.ensure_future(_dispatch(self.handler, event))
+        return web.Response(text='')
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post(self.path, self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        logger.info(f"Events API receiver listening on http://{self.host}:{self.port}{self.path}")
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
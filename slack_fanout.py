@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Slack Fan-out
+Deliver one rendered schedule payload to many webhooks, channels and DMs concurrently.
+"""
+
+import os
+import time
+import asyncio
+import hashlib
+import logging
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+from slack_client import SlackClient, SlackDeliveryError
+from metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+delivery_latency = REGISTRY.histogram('slack_delivery_seconds', 'End-to-end latency per fan-out destination')
+delivery_total = REGISTRY.counter('slack_deliveries_total', 'Fan-out deliveries by outcome')
+
+
+def parse_destinations(value: Optional[str]) -> List[str]:
+    """Parse a comma-separated destination list (webhook URLs, channel IDs or user IDs)."""
+    if not value:
+        return []
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def is_webhook(destination: str) -> bool:
+    return destination.startswith('http://') or destination.startswith('https://')
+
+
+def mask_destination(destination: str) -> str:
+    """Destination safe for logs and reports: channel / user IDs as-is, webhook URLs (secrets) as host/…/hash."""
+    if not is_webhook(destination):
+        return destination
+    digest = hashlib.sha256(destination.encode('utf-8')).hexdigest()[:8]
+    return f"{urlparse(destination).netloc}/…/{digest}"
+
+
+class RateLimiter:
+    """Token bucket limiting how many Web API calls start per second."""
+
+    def __init__(self, rate: float, burst: int = None):
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1, int(rate))
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class SlackFanout:
+    """Post the same payload to N destinations with a concurrency cap and rate limit."""
+
+    def __init__(self, client: SlackClient, concurrency: int = None, rate_per_second: float = None):
+        self.client = client
+        self.concurrency = concurrency or int(os.getenv('SLACK_FANOUT_CONCURRENCY', '10'))
+        # chat.postMessage is rate limited per workspace; stay below it by default
+        rate = rate_per_second or float(os.getenv('SLACK_FANOUT_RATE', '10'))
+        self.rate_limiter = RateLimiter(rate, burst=self.concurrency)
+
+    async def _deliver_one(self, destination: str, payload: Dict[str, Any],
+                           semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        # Reports and logs only ever carry the masked destination
+        result = {'destination': mask_destination(destination), 'ok': False, 'ts': None, 'error': None, 'latency': 0.0}
+        kind = 'webhook' if is_webhook(destination) else 'chat'
+
+        async with semaphore:
+            await self.rate_limiter.acquire()
+            started = time.perf_counter()
+            try:
+                if kind == 'webhook':
+                    await self.client.post_webhook(destination, payload)
+                    result['ok'] = True
+                else:
+                    data = await self.client.call_api('chat.postMessage', dict(payload, channel=destination))
+                    result['ok'] = bool(data.get('ok'))
+                    if result['ok']:
+                        result['ts'] = data.get('ts')
+                    else:
+                        result['error'] = data.get('error', 'unknown_error')
+            except SlackDeliveryError as e:
+                result['error'] = str(e).replace(destination, result['destination'])
+            result['latency'] = time.perf_counter() - started
+
+        delivery_latency.observe(result['latency'], {'kind': kind})
+        delivery_total.inc(labels={'kind': kind, 'outcome': 'ok' if result['ok'] else 'error'})
+        if not result['ok']:
+            logger.error(f"Delivery to {result['destination']} failed: {result['error']}")
+        return result
+
+    async def deliver(self, payload: Dict[str, Any], destinations: List[str]) -> List[Dict[str, Any]]:
+        """Deliver payload to all destinations and return a per-destination report, in destinations order."""
+        if not destinations:
+            return []
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        started = time.perf_counter()
+        results = await asyncio.gather(*(self._deliver_one(d, payload, semaphore) for d in destinations))
+
+        succeeded = sum(1 for r in results if r['ok'])
+        logger.info(f"Fan-out delivered {succeeded}/{len(results)} destinations "
+                    f"in {time.perf_counter() - started:.2f}s")
+        return list(results)
@@ -5,14 +5,25 @@ Monitor Slack messages from Calendar Bot and read them aloud using VOICEVOX API.
 """
 
 import os
-import re
 import time
 import logging
-import requests
-import tempfile
+import asyncio
+import aiohttp
+import pytz
 from dotenv import load_dotenv
 from datetime import datetime
 
+from slack_client import SlackClient, SlackDeliveryError
+from slack_fanout import parse_destinations
+from slack_events import SocketModeListener, EventsApiReceiver
+from state_store import load_json, atomic_write_json
+from adaptive_poller import AdaptivePoller
+import message_parser
+from audio_cache import AudioCache
+from metrics import REGISTRY, stage
+from metrics_exporter import MetricsExporter
+from voicevox_client import VoicevoxClient
+
 load_dotenv()
 
 logging.basicConfig(
@@ -21,22 +32,58 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+backlog_depth = REGISTRY.gauge('monitor_backlog_depth', 'Calendar messages detected but not yet spoken')
+speech_latency = REGISTRY.histogram('monitor_detection_to_speech_seconds',
+                                    'Time from detecting a message to its playback finishing')
+
 
 class SlackVoiceMonitor:
-    def __init__(self):
+    def __init__(self, announced=None):
         # Slack API settings
         self.slack_token = os.getenv('SLACK_BOT_TOKEN')
-        self.target_channel = os.getenv('SLACK_CHANNEL_ID', 'general')
+        # Channels and DMs to watch (SLACK_CHANNEL_IDS, falling back to SLACK_CHANNEL_ID)
+        self.channels = (parse_destinations(os.getenv('SLACK_CHANNEL_IDS')) or
+                         [os.getenv('SLACK_CHANNEL_ID', 'general')])
         
         # VOICEVOX API settings
         self.voicevox_api_key = os.getenv('VOICEVOX_API_KEY')
         self.voicevox_speaker_id = int(os.getenv('VOICEVOX_SPEAKER_ID', '3'))
-        self.voicevox_api_url = 'https://api.tts.quest/v3/voicevox/synthesis'
+        self.voicevox_api_url = os.getenv('VOICEVOX_API_URL', 'https://api.tts.quest/v3/voicevox/synthesis')
         
         if not all([self.slack_token, self.voicevox_api_key]):
             logger.warning("Missing SLACK_BOT_TOKEN or VOICEVOX_API_KEY - some features may not work")
         
-        self.last_processed_ts = None
+        # Persisted per-channel checkpoints: ts of the newest message already handled
+        self.checkpoint_path = os.getenv('MONITOR_CHECKPOINT_PATH', 'monitor_checkpoint.json')
+        self.checkpoints = self._load_checkpoints()
+        self.max_attempts = int(os.getenv('MONITOR_MAX_ATTEMPTS', '3'))
+        self._failed_attempts = {}
+        # (channel, ts) handled in a batch but not yet behind the checkpoint
+        self._completed = set()
+        # Calendar messages received as events and still above the checkpoint, per channel,
+        # and the ones being processed right now (so a redelivered event is not spoken twice)
+        self._event_messages = {}
+        self._event_inflight = set()
+        
+        # Adaptive polling: fast around posting windows, exponential backoff when idle
+        self.tz = pytz.timezone(os.getenv('TIMEZONE', 'Asia/Tokyo'))
+        self.adaptive_polling = os.getenv('MONITOR_ADAPTIVE', 'true').lower() == 'true'
+        self.poller = AdaptivePoller(self.tz)
+        
+        # Clip cache shared with main.py; wait this long for the bot's published audio.
+        # Only combined mode is sure to share the cache, so a standalone monitor (possibly on
+        # another host) just checks it once unless AUDIO_ARTIFACT_WAIT says otherwise
+        self.audio_cache = AudioCache()
+        self.artifact_wait = float(os.getenv('AUDIO_ARTIFACT_WAIT') or ('20' if announced is not None else '0'))
+        # Announcements spoken by a bot in this process (combined mode, delivery_ledger.LocalAnnouncements)
+        self.announced = announced
+        
+        # Shared HTTP session, Slack client and global playback queue (created in start())
+        self.session = None
+        self.slack_client = None
+        self.tts = None
+        self.playback_queue = None
+        self._playback_task = None
         
         # Initialize audio (try to import pygame)
         self.audio_available = False
@@ -48,143 +95,128 @@ class SlackVoiceMonitor:
         except ImportError:
             logger.warning("pygame not available - audio playback disabled")
     
-    def get_recent_messages(self, limit=10):
+    async def start(self):
+        """Create the shared session and start the playback worker."""
+        if self.session is None:
+            connector = aiohttp.TCPConnector(limit=int(os.getenv('MONITOR_POOL_SIZE', '20')))
+            self.session = aiohttp.ClientSession(connector=connector)
+            self.slack_client = SlackClient(bot_token=self.slack_token, session=self.session,
+                                            on_rate_limited=self.poller.record_rate_limited)
+            self.tts = VoicevoxClient('monitor', self.voicevox_api_url, self.voicevox_api_key,
+                                      session=self.session, method='post')
+            self.playback_queue = asyncio.Queue()
+            self._synth_semaphore = asyncio.Semaphore(int(os.getenv('MONITOR_SYNTH_CONCURRENCY', '4')))
+            self._playback_task = asyncio.ensure_future(self._playback_worker())
+    
+    async def close(self):
+        """Stop the playback worker and close the shared session."""
+        if self._playback_task is not None:
+            self._playback_task.cancel()
+            try:
+                await self._playback_task
+            except asyncio.CancelledError:
+                pass
+            self._playback_task = None
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+    
+    def _load_checkpoints(self):
+        """Load the last processed ts for every watched channel."""
+        saved = load_json(self.checkpoint_path, {}).get('channels', {})
+        checkpoints = {channel: saved.get(channel) for channel in self.channels}
+        for channel, ts in checkpoints.items():
+            if ts:
+                logger.info(f"[{channel}] Resuming from checkpoint ts={ts}")
+        return checkpoints
+    
+    def _advance_checkpoint(self, channel, ts):
+        """Move a channel's checkpoint forward and persist it atomically."""
+        current = self.checkpoints.get(channel)
+        if not ts or (current and float(ts) <= float(current)):
+            return
+        self.checkpoints[channel] = ts
+        
+        data = load_json(self.checkpoint_path, {})
+        data.setdefault('channels', {}).update({c: t for c, t in self.checkpoints.items() if t})
+        try:
+            atomic_write_json(self.checkpoint_path, data)
+        except OSError as e:
+            logger.error(f"Failed to save checkpoint: {e}")
+    
+    async def _history(self, params):
+        """Call conversations.history and return the decoded response, or None on error."""
+        self.poller.record_request()
+        with stage('monitor', 'slack_fetch') as timer:
+            try:
+                data = await self.slack_client.call_api('conversations.history', params=params, http_method='GET')
+            except SlackDeliveryError as e:
+                timer.fail()
+                logger.error(f"Error fetching messages: {e}")
+                return None
+            
+            if data.get('error') == 'ratelimited':
+                self.poller.record_rate_limited()
+            if not data.get('ok'):
+                timer.fail()
+                logger.error(f"Slack API error: {data.get('error', 'Unknown error')}")
+                return None
+        return data
+    
+    async def get_recent_messages(self, channel, limit=10):
         """Get recent messages from Slack channel."""
         if not self.slack_token:
             logger.error("SLACK_BOT_TOKEN not set")
             return []
         
-        url = "https://slack.com/api/conversations.history"
-        headers = {
-            "Authorization": f"Bearer {self.slack_token}",
-            "Content-Type": "application/json"
-        }
-        params = {
-            "channel": self.target_channel,
-            "limit": limit
-        }
+        data = await self._history({"channel": channel, "limit": limit, "include_all_metadata": "true"})
+        return data.get('messages', []) if data else []
+    
+    async def get_new_messages(self, channel, oldest, page_size=200):
+        """Fetch every message newer than oldest, following pagination cursors.
         
-        try:
-            response = requests.get(url, headers=headers, params=params)
-            data = response.json()
-            
-            if data.get('ok'):
-                return data.get('messages', [])
-            else:
-                logger.error(f"Slack API error: {data.get('error', 'Unknown error')}")
-                return []
-                
-        except Exception as e:
-            logger.error(f"Error fetching messages: {e}")
+        Raises SlackDeliveryError if any page fails: a partial result would let the
+        checkpoint move past messages that were never fetched.
+        """
+        if not self.slack_token:
+            logger.error("SLACK_BOT_TOKEN not set")
             return []
+        
+        params = {"channel": channel, "oldest": oldest, "limit": page_size, "include_all_metadata": "true"}
+        messages = []
+        while True:
+            data = await self._history(params)
+            if not data:
+                raise SlackDeliveryError(f"conversations.history failed after {len(messages)} messages, "
+                                         f"will retry from ts={oldest}")
+            
+            messages.extend(data.get('messages', []))
+            
+            cursor = data.get('response_metadata', {}).get('next_cursor')
+            if not data.get('has_more') or not cursor:
+                break
+            params['cursor'] = cursor
+        
+        return messages
     
     def is_calendar_message(self, message):
         """Check if message is from Calendar Bot."""
-        text = message.get('text', '')
-        username = message.get('username', '')
-        
-        # Check for calendar bot patterns
-        calendar_patterns = [
-            r'📅.*の予定',
-            r'合計.*件の予定',
-            r'Calendar Bot',
-            r'🕐.*〜'
-        ]
-        
-        return (username == 'Calendar Bot' or 
-                any(re.search(pattern, text) for pattern in calendar_patterns))
+        return message_parser.is_calendar_message(message)
     
     def extract_voice_content(self, slack_text):
         """Extract voice-friendly content from Slack message."""
-        # Remove Slack formatting
-        text = re.sub(r'\*([^*]+)\*', r'\1', slack_text)  # Remove bold
-        text = re.sub(r'📅|🕐|📍|📝|✨|📊', '', text)    # Remove emojis
-        text = re.sub(r'\n+', '。', text)                  # Convert newlines to periods
-        text = re.sub(r'〜', 'から', text)                  # Replace tilde
-        
-        # Extract key information
-        lines = slack_text.split('\n')
-        voice_parts = []
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Title line
-            if '予定 -' in line:
-                date_match = re.search(r'(\d+年\d+月\d+日)', line)
-                day_match = re.search(r'(今日|明日)', line)
-                if date_match and day_match:
-                    voice_parts.append(f"{day_match.group(1)}の予定をお知らせします。")
-            
-            # Event lines (numbered items)
-            elif re.match(r'^\d+\.', line):
-                event_name = re.sub(r'^\d+\.\s*', '', line)
-                voice_parts.append(f"{event_name}。")
-            
-            # Time lines
-            elif '🕐' in line:
-                time_text = re.sub(r'🕐\s*', '', line)
-                time_text = re.sub(r'〜', 'から', time_text)
-                voice_parts.append(f"時間は{time_text}です。")
-            
-            # Summary line
-            elif '合計' in line and '件の予定' in line:
-                count_match = re.search(r'(\d+)\s*件', line)
-                if count_match:
-                    count = count_match.group(1)
-                    voice_parts.append(f"以上、{count}件の予定でした。")
-        
-        # Fallback: if no structured content found, clean the whole text
-        if not voice_parts:
-            cleaned = re.sub(r'[📅🕐📍📝✨📊\*]', '', slack_text)
-            cleaned = re.sub(r'\n+', '。', cleaned)
-            return cleaned.strip()
-        
-        return ''.join(voice_parts)
+        return message_parser.extract_voice_content(slack_text)
     
-    def synthesize_speech(self, text):
-        """Synthesize speech using VOICEVOX API."""
-        try:
-            params = {
-                'speaker': self.voicevox_speaker_id,
-                'text': text
-            }
-            
-            if self.voicevox_api_key:
-                params['key'] = self.voicevox_api_key
-            
-            response = requests.post(self.voicevox_api_url, data=params)
-            
-            if response.status_code != 200:
-                logger.error(f"VOICEVOX API error: {response.status_code}")
-                return None
-            
-            result = response.json()
-            mp3_url = result.get('mp3DownloadUrl')
-            
-            if not mp3_url:
-                logger.error("No MP3 download URL in response")
-                return None
-            
-            # Download audio file
-            audio_response = requests.get(mp3_url)
-            if audio_response.status_code != 200:
-                logger.error(f"Failed to download audio: {audio_response.status_code}")
-                return None
-            
-            # Save to temporary file
-            temp_file = tempfile.NamedTemporaryFile(suffix='.mp3', delete=False)
-            temp_file.write(audio_response.content)
-            temp_file.close()
-            
-            logger.info(f"Audio file created: {temp_file.name}")
-            return temp_file.name
-            
-        except Exception as e:
-            logger.error(f"Error synthesizing speech: {e}")
-            return None
+    async def synthesize_speech(self, text, speaker=None):
+        """Synthesize speech using VOICEVOX API (reusing the shared audio cache, keyed by speaker)."""
+        if speaker is None:
+            speaker = self.voicevox_speaker_id
+        return await self.audio_cache.get_or_synthesize(
+            text, speaker, lambda: self._request_speech(text, speaker))
+    
+    async def _request_speech(self, text, speaker):
+        """Call VOICEVOX API and return the MP3 bytes."""
+        return await self.tts.synthesize(text, speaker)
     
     def play_audio(self, audio_file_path):
         """Play audio file."""
@@ -194,11 +226,13 @@ class SlackVoiceMonitor:
         
         try:
             import pygame
-            pygame.mixer.music.load(audio_file_path)
-            pygame.mixer.music.play()
-            
-            while pygame.mixer.music.get_busy():
-                time.sleep(0.1)
+            with stage('monitor', 'decode'):
+                pygame.mixer.music.load(audio_file_path)
+            with stage('monitor', 'playback'):
+                pygame.mixer.music.play()
+                
+                while pygame.mixer.music.get_busy():
+                    time.sleep(0.1)
             
             logger.info("Audio playback completed")
             return True
@@ -207,91 +241,346 @@ class SlackVoiceMonitor:
             logger.error(f"Error playing audio: {e}")
             return False
         finally:
-            # Clean up temporary file
+            # Clean up temporary file (cached clips are kept for reuse)
+            if not self.audio_cache.owns(audio_file_path):
+                try:
+                    os.unlink(audio_file_path)
+                except:
+                    pass
+    
+    async def _playback_worker(self):
+        """Play queued clips one at a time, whichever channel they came from."""
+        loop = asyncio.get_event_loop()
+        while True:
+            audio_file, done = await self.playback_queue.get()
             try:
-                os.unlink(audio_file_path)
-            except:
-                pass
+                success = await loop.run_in_executor(None, self.play_audio, audio_file)
+                if not done.done():
+                    done.set_result(success)
+            except Exception as e:
+                if not done.done():
+                    done.set_exception(e)
+            finally:
+                self.playback_queue.task_done()
     
-    def process_message(self, message):
-        """Process a single calendar message."""
-        text = message.get('text', '')
-        timestamp = message.get('ts', '')
+    async def enqueue_playback(self, audio_file):
+        """Queue a clip on the global playback queue and wait until it has been played."""
+        done = asyncio.get_event_loop().create_future()
+        await self.playback_queue.put((audio_file, done))
+        return await done
+    
+    async def _synthesize_message(self, message):
+        """Synthesize every voice text of a message concurrently; return the clip paths in order."""
+        # Use the bot's metadata when present; parse the text only for older messages
+        with stage('monitor', 'parse'):
+            voice_texts = message_parser.voice_texts_for_message(message)
+        if not voice_texts:
+            logger.warning("No voice content extracted")
+            return None
         
-        logger.info(f"Processing calendar message: {text[:100]}...")
+        for voice_text in voice_texts:
+            logger.info(f"Voice text: {voice_text}")
         
-        # Extract voice content
-        voice_text = self.extract_voice_content(text)
-        if not voice_text:
-            logger.warning("No voice content extracted")
-            return False
+        # Speak each text in the voice the bot chose, so its published clips (and cache entries) match
+        payload = message_parser.read_schedule_metadata(message)
+        speakers = self._speakers_for(payload, len(voice_texts))
+        
+        # Prefer the clips the bot published instead of synthesizing them again
+        if payload and payload.get('audio_published'):
+            published = await asyncio.gather(*(self.audio_cache.wait_for(t, speaker, self.artifact_wait)
+                                                for t, speaker in zip(voice_texts, speakers)))
+            if all(published):
+                logger.info("Using audio published by Calendar Bot")
+                return list(published)
         
-        logger.info(f"Voice text: {voice_text}")
+        async with self._synth_semaphore:
+            audio_files = await asyncio.gather(*(self.synthesize_speech(t, speaker)
+                                                 for t, speaker in zip(voice_texts, speakers)))
         
-        # Synthesize and play
-        audio_file = self.synthesize_speech(voice_text)
-        if audio_file:
-            success = self.play_audio(audio_file)
-            if success:
-                self.last_processed_ts = timestamp
-                return True
+        if not all(audio_files):
+            self._discard_audio([f for f in audio_files if f])
+            return None
+        return list(audio_files)
+    
+    def _speakers_for(self, payload, count):
+        """Speaker per voice text from the metadata (speakers, then speaker), else this monitor's default."""
+        if payload:
+            speakers = payload.get('speakers') or []
+            if len(speakers) == count and all(s is not None for s in speakers):
+                return [int(s) for s in speakers]
+            if payload.get('speaker') is not None:
+                return [int(payload['speaker'])] * count
+        return [self.voicevox_speaker_id] * count
+    
+    def _discard_audio(self, audio_files):
+        for audio_file in audio_files:
+            if self.audio_cache.owns(audio_file):
+                continue
+            try:
+                os.unlink(audio_file)
+            except OSError:
+                pass
+    
+    async def _play_message(self, channel, message, audio_files, detected_at):
+        """Play a message's clips in order on the global queue."""
+        for i, audio_file in enumerate(audio_files):
+            if not await self.enqueue_playback(audio_file):
+                self._discard_audio(audio_files[i + 1:])
+                return False
         
+        now = time.time()
+        speech_latency.observe(now - detected_at, {'channel': channel})
+        logger.info(f"[{channel}] Spoken {now - detected_at:.1f}s after detection "
+                    f"({now - float(message.get('ts', '0')):.1f}s after posting)")
+        return True
+    
+    async def _already_announced(self, channel, message):
+        """True if a bot in this process spoke this announcement (combined mode).
+        
+        Waits while the bot is still speaking it; a failed announcement is spoken here instead.
+        """
+        if self.announced is None:
+            return False
+        payload = message_parser.read_schedule_metadata(message)
+        if payload and await self.announced.was_spoken(payload.get('content_hash')):
+            logger.info(f"[{channel}] Already spoken by Calendar Bot in this process, skipping")
+            return True
         return False
     
-    def monitor_once(self):
-        """Check for new calendar messages once."""
-        messages = self.get_recent_messages(limit=5)
+    async def process_message(self, channel, message):
+        """Process a single calendar message."""
+        text = message.get('text', '')
+        logger.info(f"[{channel}] Processing calendar message: {text[:100]}...")
+        detected_at = time.time()
+        
+        if await self._already_announced(channel, message):
+            return True
+        
+        audio_files = await self._synthesize_message(message)
+        return bool(audio_files) and await self._play_message(channel, message, audio_files, detected_at)
+    
+    def _record_failure(self, channel, ts):
+        """Count a failed attempt; give up on the message after max_attempts."""
+        key = (channel, ts)
+        attempts = self._failed_attempts.get(key, 0) + 1
+        self._failed_attempts[key] = attempts
+        if attempts >= self.max_attempts:
+            logger.error(f"[{channel}] Giving up on message {ts} after {attempts} attempts")
+            self._failed_attempts.pop(key, None)
+            self._completed.add(key)
+    
+    async def _fetch_channel(self, channel):
+        """Fetch a channel's messages newer than its checkpoint, oldest first."""
+        checkpoint = self.checkpoints.get(channel)
+        if checkpoint:
+            # Only transfer messages newer than the checkpoint
+            messages = await self.get_new_messages(channel, oldest=checkpoint)
+        else:
+            # No checkpoint yet (fresh install or deleted file): look at the latest few messages only,
+            # and speak just the newest schedule rather than a backlog of stale ones
+            messages = await self.get_recent_messages(channel, limit=5)
+            calendar = [m for m in messages if self.is_calendar_message(m)]
+            if len(calendar) > 1:
+                newest = max(calendar, key=lambda m: float(m.get('ts', '0')))
+                logger.info(f"[{channel}] No checkpoint: skipping {len(calendar) - 1} older calendar messages")
+                messages = [m for m in messages if m is newest or not self.is_calendar_message(m)]
         
+        if checkpoint:
+            messages = [m for m in messages if float(m.get('ts', '0')) > float(checkpoint)]
+        return sorted(messages, key=lambda m: float(m.get('ts', '0')))
+    
+    def _advance_past_handled(self, channel, messages):
+        """Advance the checkpoint up to the first calendar message that is still pending."""
         for message in messages:
-            ts = message.get('ts', '')
-            
-            # Skip if already processed
-            if self.last_processed_ts and ts <= self.last_processed_ts:
+            key = (channel, message.get('ts', ''))
+            if self.is_calendar_message(message) and key not in self._completed:
+                break
+            self._advance_checkpoint(channel, message.get('ts', ''))
+        
+        checkpoint = float(self.checkpoints.get(channel) or 0)
+        self._completed = {k for k in self._completed if k[0] != channel or float(k[1]) > checkpoint}
+    
+    async def monitor_once(self):
+        """Check every watched channel and process all new calendar messages as one batch."""
+        await self.start()
+        results = await asyncio.gather(*(self._fetch_channel(c) for c in self.channels),
+                                       return_exceptions=True)
+        
+        fetched = {}
+        batch = []
+        for channel, result in zip(self.channels, results):
+            if isinstance(result, Exception):
+                logger.error(f"[{channel}] Error in monitoring: {result}")
                 continue
+            fetched[channel] = result
+            for message in result:
+                if (channel, message.get('ts', '')) in self._completed:
+                    continue
+                if not self.is_calendar_message(message):
+                    continue
+                if await self._already_announced(channel, message):
+                    self._completed.add((channel, message.get('ts', '')))
+                else:
+                    batch.append((channel, message))
+        
+        # Playback follows posting order across all channels
+        batch.sort(key=lambda item: float(item[1].get('ts', '0')))
+        backlog_depth.set(len(batch))
+        
+        processed = 0
+        if batch:
+            logger.info(f"{len(batch)} new calendar messages detected!")
+            detected_at = time.time()
+            for channel, message in batch:
+                self.poller.record_detection(float(message['ts']))
             
-            # Check if it's a calendar message
-            if self.is_calendar_message(message):
-                logger.info("New calendar message detected!")
-                if self.process_message(message):
+            # Synthesize everything concurrently, then play strictly in ts order
+            synth_tasks = [asyncio.ensure_future(self._synthesize_message(message)) for _, message in batch]
+            for i, ((channel, message), task) in enumerate(zip(batch, synth_tasks)):
+                audio_files = await task
+                if audio_files and await self._play_message(channel, message, audio_files, detected_at):
                     logger.info("Message processed successfully")
-                    return True
+                    self._completed.add((channel, message['ts']))
+                    processed += 1
                 else:
                     logger.error("Failed to process message")
+                    self._record_failure(channel, message['ts'])
+                backlog_depth.set(len(batch) - i - 1)
         
-        return False
+        for channel, messages in fetched.items():
+            self._advance_past_handled(channel, messages)
+        
+        return processed > 0
     
-    def run_continuous(self, interval=30):
-        """Run continuous monitoring."""
-        logger.info(f"Starting continuous monitoring (interval: {interval}s)")
+    async def handle_event(self, event):
+        """Process a message event pushed by Socket Mode or the Events API."""
+        channel = event.get('channel')
+        if channel not in self.channels:
+            return
         
-        while True:
+        ts = event.get('ts', '')
+        checkpoint = self.checkpoints.get(channel)
+        if checkpoint and float(ts) <= float(checkpoint):
+            return
+        
+        if not self.is_calendar_message(event):
+            return
+        
+        key = (channel, ts)
+        if key in self._completed or key in self._event_inflight:
+            return
+        
+        logger.info(f"[{channel}] New calendar message received via event!")
+        self.poller.record_detection(float(ts))
+        pending = self._event_messages.setdefault(channel, {})
+        pending[ts] = event
+        self._event_inflight.add(key)
+        try:
+            success = await self.process_message(channel, event)
+        finally:
+            self._event_inflight.discard(key)
+        
+        if success:
+            logger.info("Message processed successfully")
+            self._completed.add(key)
+        else:
+            logger.error("Failed to process message")
+            self._record_failure(channel, ts)
+        
+        # Same bookkeeping as monitor_once: events are handled concurrently, so the checkpoint
+        # only moves past messages that are all done and stops at an earlier one that failed
+        self._advance_past_handled(channel, sorted(pending.values(), key=lambda m: float(m.get('ts', '0'))))
+        checkpoint = float(self.checkpoints.get(channel) or 0)
+        for handled in [t for t in pending if float(t) <= checkpoint]:
+            del pending[handled]
+    
+    async def run_events(self, mode='socket'):
+        """Run event-driven monitoring via Socket Mode or an Events API receiver."""
+        await self.start()
+        
+        # Catch up on anything posted while the monitor was not running
+        if any(self.checkpoints.values()):
+            await self.monitor_once()
+        
+        if mode == 'socket':
+            app_token = os.getenv('SLACK_APP_TOKEN')
+            if not app_token and not os.getenv('SLACK_SOCKET_MODE_URL'):
+                raise ValueError("SLACK_APP_TOKEN is required for Socket Mode")
+            logger.info("Starting event-driven monitoring (Socket Mode)")
+            await SocketModeListener(app_token, self.handle_event, session=self.session).run()
+        else:
+            receiver = EventsApiReceiver(self.handle_event)
+            logger.info("Starting event-driven monitoring (Events API)")
+            await receiver.start()
             try:
-                self.monitor_once()
-                time.sleep(interval)
-            except KeyboardInterrupt:
-                logger.info("Monitoring stopped by user")
-                break
-            except Exception as e:
-                logger.error(f"Error in monitoring loop: {e}")
-                time.sleep(interval)
+                await asyncio.Event().wait()
+            finally:
+                await receiver.stop()
+    
+    async def run_continuous(self, interval=30):
+        """Run continuous monitoring."""
+        if self.adaptive_polling:
+            logger.info(f"Starting adaptive monitoring of {len(self.channels)} channels "
+                        f"(windows: {self.poller.windows}, {self.poller.fast_interval:.0f}s-{self.poller.max_interval:.0f}s)")
+        else:
+            logger.info(f"Starting continuous monitoring of {len(self.channels)} channels (interval: {interval}s)")
+        
+        report_every = int(os.getenv('MONITOR_REPORT_INTERVAL', '3600'))
+        last_report = time.time()
+        
+        try:
+            while True:
+                found = False
+                try:
+                    found = await self.monitor_once()
+                except Exception as e:
+                    logger.error(f"Error in monitoring loop: {e}")
+                self.poller.record_poll(found)
+                
+                if time.time() - last_report >= report_every:
+                    logger.info(f"Polling report: {self.poller.report()}")
+                    last_report = time.time()
+                
+                await asyncio.sleep(self.poller.next_interval() if self.adaptive_polling else interval)
+        finally:
+            logger.info(f"Polling report: {self.poller.report()}")
 
 
-def main():
-    """Main entry point."""
+async def run_monitor():
+    """Run the monitor in the mode selected by the environment."""
+    monitor = SlackVoiceMonitor()
+    exporter = MetricsExporter('monitor')
+    
+    # poll (default), socket (Socket Mode) or events (Events API HTTP receiver)
+    mode = os.getenv('MONITOR_MODE', 'poll').lower()
+    
     try:
-        monitor = SlackVoiceMonitor()
+        await monitor.start()
+        await exporter.start()
         
         # Test mode: check once
         if os.getenv('TEST_MODE', '').lower() == 'true':
             logger.info("Running in test mode")
-            monitor.monitor_once()
+            await monitor.monitor_once()
+        elif mode in ('socket', 'events'):
+            await monitor.run_events(mode)
         else:
             # Continuous monitoring
-            monitor.run_continuous()
-            
+            await monitor.run_continuous()
+    finally:
+        await exporter.stop()
+        await monitor.close()
+
+
+def main():
+    """Main entry point."""
+    try:
+        asyncio.run(run_monitor())
+    except KeyboardInterrupt:
+        logger.info("Monitoring stopped by user")
     except Exception as e:
         logger.error(f"Application error: {e}")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+State Store
+Small helpers for persisting JSON state files atomically.
+"""
+
+import os
+import json
+import logging
+import tempfile
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def load_json(path: str, default: Any = None) -> Any:
+    """Load a JSON file, returning default when it is missing, unreadable or of another shape.
+
+    When default is a dict or list, the file must hold the same type (e.g. not `[]` or `null`
+    where an object is expected).
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return default
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read state file {path}: {e}")
+        return default
+    if isinstance(default, (dict, list)) and not isinstance(data, type(default)):
+        logger.warning(f"Ignoring state file {path}: expected a JSON {type(default).__name__}, "
+                       f"got {type(data).__name__}")
+        return default
+    return data
+
+
+def atomic_write_json(path: str, data: Any):
+    """Write JSON to a temp file in the same directory and rename it over the target."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    fd, temp_path = tempfile.mkstemp(prefix='.tmp-', suffix='.json', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
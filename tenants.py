@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tenants
+Per-tenant delivery settings for the daemon: schedule, calendar and Slack destinations.
+"""
+
+import os
+import json
+import logging
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+# 平日の朝8時 (run_calendar.sh の cron 設定と同じ)
+DEFAULT_SCHEDULE = '0 8 * * 1-5'
+
+
+def _tenant_defaults() -> Dict[str, Any]:
+    return {
+        'name': os.getenv('TENANT_ID', 'default'),
+        'schedule': os.getenv('DAEMON_SCHEDULE', DEFAULT_SCHEDULE),
+        'business_days_only': os.getenv('DAEMON_BUSINESS_DAYS_ONLY', 'true').lower() == 'true',
+        'include_tomorrow': True,
+        'with_voice': True,
+        'reminders': os.getenv('REMINDERS_ENABLED', 'false').lower() == 'true',
+        # Cron expressions for the weekly / monthly digest (empty = off)
+        'weekly_digest_schedule': os.getenv('DIGEST_WEEKLY_SCHEDULE', ''),
+        'monthly_digest_schedule': os.getenv('DIGEST_MONTHLY_SCHEDULE', ''),
+    }
+
+
+def load_tenants(path: str = None) -> List[Dict[str, Any]]:
+    """Load tenants from TENANTS_FILE, or a single tenant built from the environment.
+
+    Each entry may set name, schedule, calendar_id, extra_calendar_ids,
+    slack_destinations, slack_webhook_url, timezone, business_days_only,
+    include_tomorrow, with_voice, reminders, weekly_digest_schedule,
+    monthly_digest_schedule, free_time, freebusy_calendars, working_hours_start,
+    working_hours_end ("9:00"), speaker and tomorrow_speaker. Lists may also be comma-separated strings.
+    Missing keys fall back to the environment.
+    """
+    path = path or os.getenv('TENANTS_FILE')
+    if not path:
+        return [_tenant_defaults()]
+
+    with open(path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    if isinstance(entries, dict):
+        entries = entries.get('tenants', [])
+
+    tenants = []
+    names = set()
+    for entry in entries:
+        tenant = _tenant_defaults()
+        tenant.update(entry)
+        if tenant['name'] in names:
+            raise ValueError(f"Duplicate tenant name in {path}: {tenant['name']}")
+        names.add(tenant['name'])
+        tenants.append(tenant)
+
+    if not tenants:
+        raise ValueError(f"No tenants defined in {path}")
+    logger.info(f"Loaded {len(tenants)} tenants from {path}")
+    return tenants
@@ -7,6 +7,7 @@ import os
 import requests
 import tempfile
 from dotenv import load_dotenv
+from reading import normalize_reading
 
 load_dotenv()
 
@@ -33,6 +34,9 @@ def clean_voice_text(text):
     # 連続する句点を整理
     text = re.sub(r'。+', '。', text)
     
+    # 英語の製品名・略語・URL などを読みやすく（main.py / モニターと同じ辞書）
+    text = normalize_reading(text)
+    
     # 先頭・末尾の空白を除去
     text = text.strip()
     
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+VOICEVOX Client
+tts.quest synthesis + MP3 download with per-phase timeouts, retryAfter handling
+and optional hedged requests to a second backend or API key.
+"""
+
+import os
+import time
+import asyncio
+import logging
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+import aiohttp
+
+from metrics import REGISTRY, stage
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_API_URL = 'https://api.tts.quest/v3/voicevox/synthesis'
+
+hedge_total = REGISTRY.counter('tts_hedge_total', 'Hedged TTS requests by outcome (launched, hedge_won, primary_won)')
+
+Backend = Tuple[str, Optional[str]]
+
+
+def _split(value: Optional[str]) -> List[str]:
+    return [v.strip() for v in (value or '').split(',') if v.strip()]
+
+
+def parse_calendar_speakers(value: Optional[str]) -> Dict[str, int]:
+    """'team@example.com:8,me@example.com:3' -> {calendar_id: speaker}."""
+    speakers = {}
+    for item in _split(value):
+        calendar_id, _, speaker = item.rpartition(':')
+        if calendar_id and speaker.strip().isdigit():
+            speakers[calendar_id.strip()] = int(speaker)
+        else:
+            logger.warning(f"Ignoring invalid VOICEVOX_CALENDAR_SPEAKERS entry: {item}")
+    return speakers
+
+
+class VoicevoxClient:
+    """Synthesize text and return the MP3 bytes, or None on failure."""
+
+    def __init__(self, component: str, api_url: str = None, api_key: str = None,
+                 session: aiohttp.ClientSession = None, method: str = 'get',
+                 connect_timeout: float = None, synth_timeout: float = None, download_timeout: float = None,
+                 hedge_backends: List[Backend] = None, hedge_percentile: float = None,
+                 hedge_min_delay: float = None, rate_limit_retries: int = None):
+        self.component = component
+        self.method = method
+        self.primary: Backend = (api_url or os.getenv('VOICEVOX_API_URL', DEFAULT_API_URL),
+                                 api_key if api_key is not None else os.getenv('VOICEVOX_API_KEY'))
+
+        # Per-phase timeouts so one hanging request cannot stall the announcement
+        self.connect_timeout = connect_timeout if connect_timeout is not None else float(os.getenv('VOICEVOX_CONNECT_TIMEOUT', '5'))
+        self.synth_timeout = synth_timeout if synth_timeout is not None else float(os.getenv('VOICEVOX_SYNTH_TIMEOUT', '30'))
+        self.download_timeout = download_timeout if download_timeout is not None else float(os.getenv('VOICEVOX_DOWNLOAD_TIMEOUT', '30'))
+        self.rate_limit_retries = rate_limit_retries if rate_limit_retries is not None else int(os.getenv('VOICEVOX_RATE_LIMIT_RETRIES', '3'))
+
+        # Hedging: after the latency percentile, send a duplicate to the next backend; first answer wins
+        self.hedge_backends = hedge_backends if hedge_backends is not None else self._hedge_backends_from_env()
+        self.hedge_percentile = hedge_percentile if hedge_percentile is not None else float(os.getenv('VOICEVOX_HEDGE_PERCENTILE', '95'))
+        self.hedge_min_delay = hedge_min_delay if hedge_min_delay is not None else float(os.getenv('VOICEVOX_HEDGE_MIN_DELAY', '2'))
+        # Latency differs by voice, so the hedge threshold is tracked per speaker
+        self._latencies: Dict[int, deque] = {}
+        self._next_hedge = 0
+        # retryAfter applies to the whole backend: later requests (any speaker) wait instead of being refused too
+        self._not_before: Dict[Backend, float] = {}
+
+        self._session = session
+        self._owns_session = session is None
+
+    def _hedge_backends_from_env(self) -> List[Backend]:
+        """VOICEVOX_HEDGE_URLS / VOICEVOX_HEDGE_API_KEYS, paired by position (missing parts use the primary)."""
+        urls = _split(os.getenv('VOICEVOX_HEDGE_URLS'))
+        keys = _split(os.getenv('VOICEVOX_HEDGE_API_KEYS'))
+        return [(urls[i] if i < len(urls) else self.primary[0], keys[i] if i < len(keys) else self.primary[1])
+                for i in range(max(len(urls), len(keys)))]
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+            self._owns_session = True
+        return self._session
+
+    async def close(self):
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def hedge_delay(self, speaker: int) -> float:
+        """Latency percentile of this speaker's recent successful requests, never below hedge_min_delay."""
+        latencies = self._latencies.get(speaker, ())
+        if len(latencies) < 10:
+            return self.hedge_min_delay
+        ordered = sorted(latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * self.hedge_percentile / 100))
+        return max(self.hedge_min_delay, ordered[index])
+
+    async def _attempt(self, backend: Backend, text: str, speaker: int) -> Optional[bytes]:
+        """Synthesize on one backend and download the clip.
+        
+        Only a successful round trip (synthesis after any cooldown wait, plus download) feeds the
+        hedge latency window; rate-limit waits would otherwise push the hedge delay up to the cooldown.
+        """
+        url, key = backend
+        session = self._get_session()
+        params = {'speaker': speaker, 'text': text}
+        if key:
+            params['key'] = key
+        request_args = {'params': params} if self.method == 'get' else {'data': params}
+        synth_timeout = aiohttp.ClientTimeout(total=self.synth_timeout, sock_connect=self.connect_timeout)
+        download_timeout = aiohttp.ClientTimeout(total=self.download_timeout, sock_connect=self.connect_timeout)
+
+        for attempt in range(self.rate_limit_retries + 1):
+            wait = self._not_before.get(backend, 0.0) - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            started = time.monotonic()
+            with stage(self.component, 'synth_request') as timer:
+                async with session.request(self.method, url, timeout=synth_timeout, **request_args) as response:
+                    if response.status != 200:
+                        timer.fail()
+                        logger.error(f"VOICEVOX API error: {response.status} {(await response.text())[:200]}")
+                        return None
+                    result = await response.json(content_type=None)
+
+            # Rate limited: wait as told (a hedge may answer in the meantime)
+            if 'retryAfter' in result and attempt < self.rate_limit_retries:
+                retry_seconds = result['retryAfter'] + 1
+                logger.info(f"Rate limited, retrying after {retry_seconds} seconds")
+                self._not_before[backend] = max(self._not_before.get(backend, 0.0), time.monotonic() + retry_seconds)
+                continue
+            break
+
+        mp3_url = result.get('mp3StreamingUrl') or result.get('mp3DownloadUrl')
+        if not mp3_url:
+            if 'errorMessage' in result:
+                logger.error(f"VOICEVOX API error: {result['errorMessage']}")
+            else:
+                logger.error(f"No MP3 URL in response: {result}")
+            return None
+
+        logger.info(f"Downloading audio from: {mp3_url}")
+        with stage(self.component, 'audio_download') as timer:
+            async with session.get(mp3_url, timeout=download_timeout) as audio_response:
+                if audio_response.status != 200:
+                    timer.fail()
+                    logger.error(f"Failed to download audio: {audio_response.status}")
+                    return None
+                audio_data = await audio_response.read()
+        logger.info(f"Audio downloaded: {len(audio_data):,} bytes")
+        if audio_data:
+            self._latencies.setdefault(speaker, deque(maxlen=200)).append(time.monotonic() - started)
+        return audio_data
+
+    async def _safe_attempt(self, backend: Backend, text: str, speaker: int) -> Optional[bytes]:
+        try:
+            data = await self._attempt(backend, text, speaker)
+        except asyncio.TimeoutError:
+            logger.error(f"VOICEVOX request to {backend[0]} timed out")
+            return None
+        except Exception as e:
+            logger.error(f"Error synthesizing speech: {e}")
+            return None
+        return data
+
+    async def synthesize(self, text: str, speaker: int) -> Optional[bytes]:
+        """Return the MP3 bytes for text, hedging to another backend if the first is slow or fails."""
+        primary = asyncio.ensure_future(self._safe_attempt(self.primary, text, speaker))
+        if not self.hedge_backends:
+            return await primary
+
+        pending = {primary}
+        hedge = None
+        try:
+            done, pending = await asyncio.wait(pending, timeout=self.hedge_delay(speaker))
+            if done and primary.result():
+                return primary.result()
+
+            # Slow or failed: duplicate the request on the next backend
+            backend = self.hedge_backends[self._next_hedge % len(self.hedge_backends)]
+            self._next_hedge += 1
+            hedge_total.inc(labels={'component': self.component, 'outcome': 'launched'})
+            logger.info(f"Hedging VOICEVOX request to {backend[0]}")
+            hedge = asyncio.ensure_future(self._safe_attempt(backend, text, speaker))
+            pending.add(hedge)
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    data = task.result()
+                    if data:
+                        outcome = 'hedge_won' if task is hedge else 'primary_won'
+                        hedge_total.inc(labels={'component': self.component, 'outcome': outcome})
+                        return data
+            return None
+        finally:
+            for task in pending:
+                task.cancel()